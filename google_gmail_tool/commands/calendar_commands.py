@@ -7,12 +7,14 @@ and has been reviewed and tested by a human.
 import json
 import os
 import sys
+from datetime import date as date_type  # "date" is also a CLI option name
 from datetime import datetime, timedelta
 from typing import Any
 
 import click
 
 from google_gmail_tool.core.auth import AuthenticationError, get_credentials
+from google_gmail_tool.core.calendar_cache import CalendarCache
 from google_gmail_tool.core.calendar_client import CalendarClient
 from google_gmail_tool.core.obsidian_calendar_exporter import ObsidianCalendarExporter
 from google_gmail_tool.logging_config import get_logger, setup_logging
@@ -155,6 +157,11 @@ def _parse_date_range(
     "--format", "-f", type=click.Choice(["json", "text"]), default="json", help="Output format"
 )
 @click.option("--text", is_flag=True, help="Output in text format (shorthand for --format text)")
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Use local event cache with incremental sync (~/.cache/google-gmail-tool)",
+)
 @click.option(
     "-v", "--verbose", count=True, help="Increase verbosity (-v INFO, -vv DEBUG, -vvv TRACE)"
 )
@@ -171,6 +178,7 @@ def list_cmd(
     max_results: int,
     format: str,
     text: bool,
+    cache: bool,
     verbose: int,
 ) -> None:
     """List calendar events with optional filtering.
@@ -227,6 +235,10 @@ def list_cmd(
         # Human-readable text output
         google-gmail-tool calendar list --today --text
 
+    \b
+        # Use the local cache (only changed events are fetched on repeat runs)
+        google-gmail-tool calendar list --this-week --cache
+
     \b
     Output Format (JSON):
         Outputs array of event objects to stdout
@@ -273,7 +285,7 @@ def list_cmd(
     # Initialize Calendar client
     try:
         logger.info("Initializing Calendar API client")
-        client = CalendarClient(credentials)
+        client = CalendarClient(credentials, cache=CalendarCache() if cache else None)
     except Exception as e:
         logger.error(f"Failed to initialize Calendar client: {type(e).__name__}")
         click.echo(f"Error initializing Calendar API: {e}", err=True)
@@ -602,7 +614,8 @@ def export_obsidian(
     \b
     Exit Codes:
         0    Success
-        1    Authentication failed or API error
+        1    Authentication failed or API error (dates fetched successfully
+             are still exported; failed ones are listed in failed_dates)
         2    Missing OBSIDIAN_ROOT or invalid configuration
     """
     # Setup logging
@@ -718,42 +731,58 @@ def export_obsidian(
         click.echo(f"Error initializing Obsidian exporter: {e}", err=True)
         sys.exit(2)
 
-    # Process each date
-    exported_notes = []
+    # Fetch events for each day, then export the fetched days in one batch.
+    # Keyed by calendar day: several target datetimes on one day share a note.
+    events_by_date: dict[date_type, list[dict[str, Any]]] = {}
+    failed_dates: list[str] = []
     total_events = 0
 
-    try:
-        for target_date in target_dates:
-            logger.info(f"Processing date: {target_date.date()}")
+    for target_date in target_dates:
+        note_date = target_date.date()
+        if note_date in events_by_date:
+            continue
+        logger.info(f"Processing date: {note_date}")
 
-            # Fetch events for this day
-            time_min = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            time_max = time_min + timedelta(days=1)
+        # Fetch events for this day
+        time_min = datetime.combine(note_date, datetime.min.time())
+        time_max = time_min + timedelta(days=1)
 
+        try:
             events = client.list_events(
                 time_min=time_min, time_max=time_max, query=query, max_results=100
             )
+        except Exception as e:
+            logger.error(f"Failed to fetch events for {note_date}: {type(e).__name__}: {e}")
+            click.echo(f"Error: Failed to fetch events for {note_date}: {e}", err=True)
+            failed_dates.append(note_date.isoformat())
+            continue
 
-            logger.info(f"Found {len(events)} events for {target_date.date()}")
-            total_events += len(events)
-
-            # Export to Obsidian
-            note_path = exporter.export_events_to_daily(events, target_date)
-            exported_notes.append(str(note_path))
-            logger.info(f"Exported to: {note_path}")
-
-        # Output results
-        results = {
-            "exported_dates": len(exported_notes),
-            "total_events": total_events,
-            "notes": exported_notes,
-        }
-
-        click.echo(json.dumps(results, indent=2))
-        logger.info(f"Export complete: {len(exported_notes)} daily notes updated")
+        logger.info(f"Found {len(events)} events for {note_date}")
+        total_events += len(events)
+        events_by_date[note_date] = events
 
+    try:
+        # Export to Obsidian
+        note_paths = exporter.export_events_to_daily_batch(events_by_date)
+        exported_notes = [str(note_path) for note_path in note_paths]
     except Exception as e:
         logger.error(f"Failed to export calendar: {type(e).__name__}: {e}")
         logger.debug("Full traceback:", exc_info=True)
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
+
+    # Output results
+    results: dict[str, Any] = {
+        "exported_dates": len(exported_notes),
+        "total_events": total_events,
+        "notes": exported_notes,
+    }
+    if failed_dates:
+        results["failed_dates"] = failed_dates
+
+    click.echo(json.dumps(results, indent=2))
+    logger.info(f"Export complete: {len(exported_notes)} daily notes updated")
+
+    if failed_dates:
+        logger.error(f"{len(failed_dates)} date(s) failed to export")
+        sys.exit(1)
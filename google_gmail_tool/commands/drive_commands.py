@@ -11,7 +11,7 @@ from typing import Any
 import click
 
 from google_gmail_tool.core.auth import AuthenticationError, get_credentials
-from google_gmail_tool.core.drive_client import DriveClient
+from google_gmail_tool.core.drive_client import FULL_LIST_FIELDS, DriveClient
 from google_gmail_tool.logging_config import get_logger, setup_logging
 
 logger = get_logger(__name__)
@@ -53,6 +53,11 @@ logger = get_logger(__name__)
     is_flag=True,
     help="Output in text format (shorthand for --format text)",
 )
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Include owners, permissions, sharing and createdTime in the output",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -66,6 +71,7 @@ def list_cmd(
     order_by: str,
     format: str,
     text: bool,
+    full: bool,
     verbose: int,
 ) -> None:
     """List files in Google Drive with optional filtering.
@@ -127,9 +133,15 @@ def list_cmd(
         google-gmail-tool drive list \\
             --query "name contains 'invoice' and mimeType='application/pdf'"
 
+    \b
+        # Include owners, permissions and sharing details
+        google-gmail-tool drive list --full
+
     \b
     Output Format (JSON):
-        Array of file objects to stdout
+        Array of file objects to stdout (id, name, mimeType, size, modifiedTime,
+        webViewLink, parents, trashed; --full adds createdTime, iconLink, shared,
+        owners and permissions)
         Logs to stderr (use -v, -vv for verbosity)
 
     \b
@@ -161,6 +173,7 @@ def list_cmd(
             max_results=max_results,
             folder_id=folder,
             order_by=order_by,
+            fields=FULL_LIST_FIELDS if full else None,
         )
 
         # Output results
@@ -281,13 +294,19 @@ def get(file_id: str, format: str, text: bool, verbose: int) -> None:
 @click.command()
 @click.argument("file_id")
 @click.argument("output_path", type=click.Path())
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Copy buffer size in MB (default: 4); larger means fewer write syscalls",
+)
 @click.option(
     "-v",
     "--verbose",
     count=True,
     help="Increase verbosity (-v INFO, -vv DEBUG)",
 )
-def download(file_id: str, output_path: str, verbose: int) -> None:
+def download(file_id: str, output_path: str, chunk_size: int, verbose: int) -> None:
     """Download a file from Google Drive.
 
     Downloads a file by ID to the specified local path. Supports binary files only.
@@ -308,6 +327,10 @@ def download(file_id: str, output_path: str, verbose: int) -> None:
         # With progress logging
         google-gmail-tool drive download "1abc123xyz" "/tmp/file.zip" -vv
 
+    \b
+        # Larger copy buffer for very large files
+        google-gmail-tool drive download "1abc123xyz" "/tmp/backup.tar" --chunk-size 16
+
     \b
     Note:
         Google Workspace files (Docs, Sheets, Slides) cannot be downloaded directly.
@@ -331,7 +354,9 @@ def download(file_id: str, output_path: str, verbose: int) -> None:
         logger.info(f"Downloading file {file_id} to {output_path}")
         click.echo("⬇️  Downloading file...", err=True)
 
-        bytes_downloaded = client.download_file(file_id, output_path)
+        bytes_downloaded = client.download_file(
+            file_id, output_path, chunksize=chunk_size * 1024 * 1024
+        )
 
         # Format size
         size_str = _format_size(bytes_downloaded)
@@ -399,6 +424,11 @@ def download(file_id: str, output_path: str, verbose: int) -> None:
     is_flag=True,
     help="Output in text format (shorthand for --format text)",
 )
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Include owners, permissions, sharing and createdTime in the output",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -413,6 +443,7 @@ def search(
     max_results: int,
     format: str,
     text: bool,
+    full: bool,
     verbose: int,
 ) -> None:
     """Search for files in Google Drive with common filters.
@@ -450,6 +481,10 @@ def search(
         # Human-readable output
         google-gmail-tool drive search --name "budget" --text
 
+    \b
+        # Include owners, permissions and sharing details
+        google-gmail-tool drive search --name "budget" --full
+
     \b
     Common MIME Types:
         application/pdf                      PDF documents
@@ -486,6 +521,7 @@ def search(
             folder_id=folder,
             shared_with_me=shared_with_me,
             max_results=max_results,
+            fields=FULL_LIST_FIELDS if full else None,
         )
 
         # Output results
@@ -21,7 +21,7 @@ logger = get_logger(__name__)
 
 
 @click.command()
-@click.argument("local_path", type=click.Path(exists=True))
+@click.argument("local_path", type=click.Path(exists=True, dir_okay=False))
 @click.option(
     "--folder-id",
     "-d",
@@ -165,20 +165,12 @@ def upload_file(
         # Check for existing file
         logger.info(f"Checking if file '{target_name}' exists in target location")
         try:
-            query_parts = [f"name='{target_name.replace("'", "\\'")}'", "trashed=false"]
-            if folder_id:
-                query_parts.append(f"'{folder_id}' in parents")
-            else:
-                query_parts.append("'root' in parents")
+            existing_id = client.exists_by_name(target_name, folder_id)
 
-            check_query = " and ".join(query_parts)
-            existing_files = client.list_files(query=check_query, max_results=1)
-
-            if existing_files:
-                existing_file = existing_files[0]
+            if existing_id:
                 if not force and not auto_approve:
                     click.echo(
-                        f"⚠️  File '{target_name}' already exists (ID: {existing_file['id']})",
+                        f"⚠️  File '{target_name}' already exists (ID: {existing_id})",
                         err=True,
                     )
                     if not click.confirm("Do you want to continue anyway?", err=True):
@@ -348,6 +340,10 @@ def rename_file(
     is_flag=True,
     help="Output in text format (shorthand for --format text)",
 )
+@click.option(
+    "--source-folder-id",
+    help="Current parent folder ID (skips looking up the file's parents)",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -357,6 +353,7 @@ def rename_file(
 def move_file(
     file_id: str,
     destination_folder_id: str,
+    source_folder_id: str | None,
     format: str,
     text: bool,
     verbose: int,
@@ -377,6 +374,10 @@ def move_file(
         # Move file to My Drive root
         google-gmail-tool drive move "1abc123xyz" "root"
 
+    \b
+        # Known source folder (one API call instead of two)
+        google-gmail-tool drive move "1abc123xyz" "1folder456" --source-folder-id "1src789"
+
     \b
         # Human-readable output
         google-gmail-tool drive move "1abc123xyz" "1folder456" --text
@@ -417,7 +418,7 @@ def move_file(
         logger.info(f"Moving file {file_id} to folder: {destination_folder_id}")
         click.echo("📁 Moving file...", err=True)
 
-        file = client.move_file(file_id, destination_folder_id)
+        file = client.move_file(file_id, destination_folder_id, source_folder_id=source_folder_id)
 
         # Output results
         if output_format == "json":
@@ -152,6 +152,11 @@ def create_folder(
     default=True,
     help="Upload folder contents recursively (default: True)",
 )
+@click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Reuse existing Drive folders and skip files already uploaded (same size and MD5)",
+)
 @click.option(
     "--force",
     "-f",
@@ -185,6 +190,7 @@ def upload_folder(
     local_path: str,
     parent_id: str | None,
     recursive: bool,
+    skip_existing: bool,
     force: bool,
     auto_approve: bool,
     format: str,
@@ -216,6 +222,10 @@ def upload_folder(
         # Upload without contents (folder only)
         google-gmail-tool drive upload-folder "/path/to/folder" --no-recursive
 
+    \b
+        # Re-run an upload, only sending new or changed files
+        google-gmail-tool drive upload-folder "/path/to/folder" --skip-existing
+
     \b
         # Upload with auto-approval
         google-gmail-tool drive upload-folder "/path/to/folder" \\
@@ -228,6 +238,7 @@ def upload_folder(
           "folder": {...},
           "uploaded_files": [...],
           "uploaded_folders": [...],
+          "skipped_files": [...],
           "total_files": 15,
           "total_folders": 3,
           "total_bytes": 5242880
@@ -287,7 +298,9 @@ def upload_folder(
         logger.info(f"Uploading folder: {local_path} to parent: {parent_id or 'root'}")
         click.echo("⬆️  Uploading folder...", err=True)
 
-        result = client.upload_folder(local_path, parent_id=parent_id, recursive=recursive)
+        result = client.upload_folder(
+            local_path, parent_id=parent_id, recursive=recursive, skip_existing=skip_existing
+        )
 
         # Output results
         if output_format == "json":
@@ -297,6 +310,8 @@ def upload_folder(
             click.echo(f"✅ Uploaded folder: {folder['name']}", err=True)
             click.echo(f"   ID: {folder['id']}", err=True)
             click.echo(f"   Files: {result['total_files']}", err=True)
+            if result["skipped_files"]:
+                click.echo(f"   Skipped: {len(result['skipped_files'])}", err=True)
             click.echo(f"   Folders: {result['total_folders']}", err=True)
             click.echo(f"   Size: {_format_size(result['total_bytes'])}", err=True)
             click.echo(f"   Link: {folder.get('webViewLink', 'N/A')}", err=True)
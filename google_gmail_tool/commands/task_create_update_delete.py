@@ -326,23 +326,37 @@ def complete(task_ids: tuple[str, ...], verbose: int) -> None:
     completed_tasks = []
     failed_count = 0
 
-    for task_id in task_ids:
-        try:
-            task = client.complete_task(task_id)
+    # All tasks are sent in batch HTTP requests (one round-trip per 50 tasks)
+    try:
+        tasks, errors = client.bulk_complete_tasks(list(task_ids))
+    except Exception as e:
+        logger.error(f"Failed to complete tasks: {type(e).__name__}: {e}")
+        logger.debug("Full traceback:", exc_info=True)
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    for task_id in dict.fromkeys(task_ids):
+        if task_id in tasks:
             logger.info(f"Task completed: {task_id}")
-            completed_tasks.append(task)
+            completed_tasks.append(tasks[task_id])
+            continue
 
-        except Exception as e:
-            logger.error(f"Failed to complete task {task_id}: {type(e).__name__}: {e}")
-            logger.debug("Full traceback:", exc_info=True)
+        error = errors.get(task_id)
+        if error is None:
+            logger.error(f"No response for task {task_id}")
+            click.echo(f"Error: No response for task: {task_id}", err=True)
+            failed_count += 1
+            continue
 
-            error_str = str(e)
-            if "404" in error_str or "not found" in error_str.lower():
-                click.echo(f"Error: Task not found: {task_id}", err=True)
-            else:
-                click.echo(f"Error completing {task_id}: {e}", err=True)
+        logger.error(f"Failed to complete task {task_id}: {type(error).__name__}: {error}")
 
-            failed_count += 1
+        error_str = str(error)
+        if "404" in error_str or "not found" in error_str.lower():
+            click.echo(f"Error: Task not found: {task_id}", err=True)
+        else:
+            click.echo(f"Error completing {task_id}: {error}", err=True)
+
+        failed_count += 1
 
     # Output results
     click.echo(json.dumps(completed_tasks, indent=2))
@@ -413,23 +427,37 @@ def uncomplete(task_ids: tuple[str, ...], verbose: int) -> None:
     uncompleted_tasks = []
     failed_count = 0
 
-    for task_id in task_ids:
-        try:
-            task = client.uncomplete_task(task_id)
+    # All tasks are sent in batch HTTP requests (one round-trip per 50 tasks)
+    try:
+        tasks, errors = client.bulk_uncomplete_tasks(list(task_ids))
+    except Exception as e:
+        logger.error(f"Failed to uncomplete tasks: {type(e).__name__}: {e}")
+        logger.debug("Full traceback:", exc_info=True)
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    for task_id in dict.fromkeys(task_ids):
+        if task_id in tasks:
             logger.info(f"Task marked incomplete: {task_id}")
-            uncompleted_tasks.append(task)
+            uncompleted_tasks.append(tasks[task_id])
+            continue
 
-        except Exception as e:
-            logger.error(f"Failed to uncomplete task {task_id}: {type(e).__name__}: {e}")
-            logger.debug("Full traceback:", exc_info=True)
+        error = errors.get(task_id)
+        if error is None:
+            logger.error(f"No response for task {task_id}")
+            click.echo(f"Error: No response for task: {task_id}", err=True)
+            failed_count += 1
+            continue
 
-            error_str = str(e)
-            if "404" in error_str or "not found" in error_str.lower():
-                click.echo(f"Error: Task not found: {task_id}", err=True)
-            else:
-                click.echo(f"Error uncompleting {task_id}: {e}", err=True)
+        logger.error(f"Failed to uncomplete task {task_id}: {type(error).__name__}: {error}")
 
-            failed_count += 1
+        error_str = str(error)
+        if "404" in error_str or "not found" in error_str.lower():
+            click.echo(f"Error: Task not found: {task_id}", err=True)
+        else:
+            click.echo(f"Error uncompleting {task_id}: {error}", err=True)
+
+        failed_count += 1
 
     # Output results
     click.echo(json.dumps(uncompleted_tasks, indent=2))
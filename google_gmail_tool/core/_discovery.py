@@ -0,0 +1,53 @@
+"""Google API services built from cached discovery documents.
+
+googleapiclient's build() reads and parses the bundled discovery document on
+every call. build_service() parses each document once per process, so further
+client instances and per-thread services skip the discovery step.
+
+Usage Example:
+    ```python
+    from google_gmail_tool.core._discovery import build_service
+
+    service = build_service("drive", "v3", http=http)
+    ```
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+import threading
+from typing import Any
+
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+# Parsed discovery documents, keyed by (service, version)
+_DISCOVERY_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
+_DISCOVERY_LOCK = threading.Lock()
+
+
+def build_service(name: str, version: str, **kwargs: Any) -> Any:
+    """Build an API service from the bundled (static) discovery document.
+
+    Only reading and parsing the document happens under the lock; the service
+    itself is built outside it, so concurrent callers do not serialize.
+
+    Args:
+        name: API name (e.g. "drive")
+        version: API version (e.g. "v3")
+        **kwargs: Passed to build_from_document (credentials or http, model)
+
+    Returns:
+        API service
+    """
+    key = (name, version)
+    with _DISCOVERY_LOCK:
+        document = _DISCOVERY_CACHE.get(key)
+        if document is None:
+            content = get_static_doc(name, version)
+            if content is not None:
+                document = _DISCOVERY_CACHE[key] = json.loads(content)
+    if document is None:
+        return build(name, version, static_discovery=True, **kwargs)
+    return build_from_document(document, **kwargs)
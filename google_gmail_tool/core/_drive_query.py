@@ -0,0 +1,71 @@
+"""Helpers for building Drive API search queries.
+
+Drive queries (the files().list ``q`` parameter) are built from small clauses
+joined with ``and``. These helpers escape user-supplied values once, in a single
+pass, and keep constant clauses as precomputed strings.
+
+Usage Example:
+    ```python
+    from google_gmail_tool.core._drive_query import q_and, q_in_parent, q_name_eq, q_trashed
+
+    query = q_and(q_name_eq("O'Brien.pdf"), q_trashed(False), q_in_parent("root"))
+    # "name='O\\'Brien.pdf' and trashed=false and 'root' in parents"
+    ```
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+# Backslashes and single quotes must be escaped inside quoted query values
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "'": "\\'"})
+
+_TRASHED = {True: "trashed=true", False: "trashed=false"}
+
+
+def escape(value: str) -> str:
+    """Escape a value for use inside a single-quoted query string.
+
+    Args:
+        value: Raw value (e.g. a file name)
+
+    Returns:
+        Escaped value
+    """
+    return value.translate(_ESCAPE_TABLE)
+
+
+def q_name_eq(name: str) -> str:
+    """Clause matching items with exactly this name."""
+    return f"name='{escape(name)}'"
+
+
+def q_name_contains(text: str) -> str:
+    """Clause matching items whose name contains text."""
+    return f"name contains '{escape(text)}'"
+
+
+def q_in_parent(folder_id: str) -> str:
+    """Clause matching direct children of a folder ("root" for My Drive root)."""
+    return f"'{escape(folder_id)}' in parents"
+
+
+def q_mime_eq(mime_type: str) -> str:
+    """Clause matching items of a MIME type."""
+    return f"mimeType='{escape(mime_type)}'"
+
+
+def q_trashed(trashed: bool) -> str:
+    """Clause matching trashed (True) or non-trashed (False) items."""
+    return _TRASHED[trashed]
+
+
+def q_and(*parts: str | None) -> str:
+    """Join clauses with "and", skipping empty ones.
+
+    Args:
+        *parts: Query clauses (None or empty strings are ignored)
+
+    Returns:
+        Combined query string (empty if no clauses)
+    """
+    return " and ".join(part for part in parts if part)
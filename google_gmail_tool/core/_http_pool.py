@@ -0,0 +1,54 @@
+"""Authorized httplib2 transports shared between API clients.
+
+GmailClient, CalendarClient and DriveClient build their services on the same
+transport per credentials, so keep-alive connections (and TLS sessions) stay
+warm across client instances.
+
+Usage Example:
+    ```python
+    from googleapiclient.discovery import build
+
+    from google_gmail_tool.core._http_pool import shared_http
+
+    service = build("gmail", "v1", http=shared_http(credentials))
+    ```
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import threading
+import weakref
+
+import google_auth_httplib2
+import httplib2
+from google.auth.credentials import Credentials
+
+# Authorized transports keyed by credentials identity. Entries disappear once no
+# client references them anymore.
+_HTTP_POOL: weakref.WeakValueDictionary[int, google_auth_httplib2.AuthorizedHttp] = (
+    weakref.WeakValueDictionary()
+)
+_HTTP_POOL_LOCK = threading.Lock()
+
+
+def shared_http(credentials: Credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """Get the authorized HTTP transport shared by all clients for these credentials.
+
+    The pooled transport holds a reference to the credentials, so the key stays
+    unique while pooled. httplib2 is not thread-safe: the shared transport must
+    only be used from one thread at a time, so multi-threaded code paths need
+    their own transport per thread.
+
+    Args:
+        credentials: Google OAuth credentials
+
+    Returns:
+        Authorized httplib2 transport
+    """
+    with _HTTP_POOL_LOCK:
+        http = _HTTP_POOL.get(id(credentials))
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+            _HTTP_POOL[id(credentials)] = http
+        return http
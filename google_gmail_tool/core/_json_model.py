@@ -0,0 +1,54 @@
+"""Fast JSON response decoding for Google API client services.
+
+googleapiclient decodes every response body with the stdlib json module.
+FastJsonModel decodes directly from the raw bytes with orjson when it is
+installed (optional "fast" extra) and falls back to json otherwise.
+
+Usage Example:
+    ```python
+    from googleapiclient.discovery import build
+
+    from google_gmail_tool.core._json_model import FastJsonModel
+
+    service = build("gmail", "v1", http=http, model=FastJsonModel())
+    ```
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from googleapiclient.model import JsonModel
+
+# Use orjson for response decoding when installed (optional "fast" extra)
+_json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class FastJsonModel(JsonModel):  # type: ignore[misc]
+    """JsonModel that decodes response bodies directly from bytes."""
+
+    def deserialize(self, content: str | bytes) -> Any:
+        """Decode a response body (orjson when available, stdlib json otherwise).
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            Decoded body, or the raw content if it is not valid JSON
+        """
+        try:
+            body = _json_loads(content)
+        except ValueError:
+            return content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            return body["data"]
+        return body
@@ -5,26 +5,118 @@ and has been reviewed and tested by a human.
 """
 
 import logging
-from datetime import datetime
+import sys
+from datetime import UTC, datetime
 from typing import Any
 
 from google.auth.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from google_gmail_tool.core._discovery import build_service
+from google_gmail_tool.core._http_pool import shared_http
+from google_gmail_tool.core.calendar_cache import CalendarCache
 
 logger = logging.getLogger(__name__)
 
+# Interned enum-like values, shared across all processed events
+_RESPONSE_STATUS: dict[str | None, str] = {
+    s: sys.intern(s) for s in ("accepted", "declined", "tentative", "needsAction")
+}
+_EVENT_STATUS: dict[str | None, str] = {
+    s: sys.intern(s) for s in ("confirmed", "tentative", "cancelled")
+}
+
+_RFC3339_UTC = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _rfc3339(dt: datetime) -> str:
+    """Format a datetime as an RFC 3339 UTC timestamp.
+
+    Naive datetimes are assumed to be UTC; aware datetimes are converted to UTC.
+
+    Args:
+        dt: Datetime to format
+
+    Returns:
+        Timestamp formatted as YYYY-MM-DDTHH:MM:SSZ
+    """
+    if dt.tzinfo is None:
+        return dt.strftime(_RFC3339_UTC)
+    return dt.astimezone(UTC).strftime(_RFC3339_UTC)
+
+
+def _make_attendee(attendee: dict[str, Any]) -> dict[str, Any]:
+    """Extract key fields from a raw attendee.
+
+    Args:
+        attendee: Raw attendee from Google Calendar API
+
+    Returns:
+        Attendee with email, response_status and optional fields
+    """
+    get = attendee.get
+    return {
+        "email": get("email"),
+        "response_status": _RESPONSE_STATUS.get(rs := get("responseStatus"), rs),
+        "optional": get("optional", False),
+    }
+
+
+def _event_time(value: datetime, is_all_day: bool, patch: bool = False) -> dict[str, Any]:
+    """Build the start/end field for a new event or an event patch.
+
+    Args:
+        value: Start or end datetime
+        is_all_day: Whether this is an all-day event
+        patch: Build a patch slot that clears the field of the other event shape
+            and keeps the event's existing timeZone (default: new-event slot in UTC)
+
+    Returns:
+        'date' slot (YYYY-MM-DD) for all-day events, 'dateTime' slot otherwise
+    """
+    if is_all_day:
+        slot: dict[str, Any] = {"date": value.strftime("%Y-%m-%d")}
+        if patch:
+            slot["dateTime"] = None
+        return slot
+    if patch:
+        return {"dateTime": value.isoformat(), "date": None}
+    return {"dateTime": value.isoformat(), "timeZone": "UTC"}
+
+
+def _meet_block(start: datetime) -> dict[str, Any]:
+    """Build the conferenceData request that adds Google Meet to an event.
+
+    Args:
+        start: Event start datetime (used for a stable request ID)
+
+    Returns:
+        Partial event body with the conferenceData field
+    """
+    return {
+        "conferenceData": {
+            "createRequest": {
+                "requestId": f"meet-{start.isoformat()}",
+                "conferenceSolutionKey": {"type": "hangoutsMeet"},
+            }
+        }
+    }
+
 
 class CalendarClient:
     """Client for Google Calendar API operations."""
 
-    def __init__(self, credentials: Credentials) -> None:
+    def __init__(self, credentials: Credentials, cache: CalendarCache | None = None) -> None:
         """Initialize Calendar API client.
 
         Args:
             credentials: Google OAuth credentials
+            cache: Optional persistent event cache; when set, list_events uses
+                incremental sync (syncToken) and get_event reads through the cache
         """
         logger.debug("Initializing Google Calendar API client")
-        self.service = build("calendar", "v3", credentials=credentials)
+        self.service = build_service("calendar", "v3", http=shared_http(credentials))
+        self.cache = cache
         logger.debug("Calendar API client initialized successfully")
 
     def list_events(
@@ -52,8 +144,19 @@ class CalendarClient:
         logger.debug(f"Query: {query}, max_results: {max_results}")
 
         # Convert datetime to RFC3339 format
-        time_min_rfc = time_min.isoformat() + "Z"
-        time_max_rfc = time_max.isoformat() + "Z"
+        time_min_rfc = _rfc3339(time_min)
+        time_max_rfc = _rfc3339(time_max)
+
+        # Free-text search cannot be combined with syncToken, so it bypasses the cache
+        if self.cache is not None and not query:
+            try:
+                self._sync_window(self.cache, time_min_rfc, time_max_rfc)
+                cached_events = self.cache.query_events(time_min_rfc, time_max_rfc, max_results)
+                logger.info(f"Retrieved {len(cached_events)} events from cache")
+                return cached_events
+            except Exception as e:
+                logger.error(f"Failed to list events: {type(e).__name__}: {e}")
+                raise
 
         # Build API request
         request_params: dict[str, Any] = {
@@ -72,22 +175,73 @@ class CalendarClient:
 
         try:
             events_result = self.service.events().list(**request_params).execute()
-            events = events_result.get("items", [])
-
-            logger.info(f"Retrieved {len(events)} events")
 
-            # Process events to extract key fields
-            processed_events = []
-            for event in events:
-                processed = self._process_event(event)
-                processed_events.append(processed)
+            # Process events to extract key fields (single pass over the page)
+            process = self._process_event
+            processed_events = [process(event) for event in events_result.get("items", ())]
 
+            logger.info(f"Retrieved {len(processed_events)} events")
             return processed_events
 
         except Exception as e:
             logger.error(f"Failed to list events: {type(e).__name__}: {e}")
             raise
 
+    def _sync_window(self, cache: CalendarCache, time_min_rfc: str, time_max_rfc: str) -> None:
+        """Bring the cache up to date for a time window.
+
+        The first sync of a window is a full sync bounded by timeMin/timeMax. Later
+        syncs pass the stored syncToken (timeMin/timeMax/orderBy are not allowed
+        together with syncToken) and only transfer changed events. An expired
+        token (HTTP 410) triggers a new full sync.
+
+        Args:
+            cache: Event cache to update
+            time_min_rfc: Window start (RFC 3339)
+            time_max_rfc: Window end (RFC 3339)
+        """
+        key = f"primary|{time_min_rfc}|{time_max_rfc}"
+        sync_token = cache.get_sync_token(key)
+
+        params: dict[str, Any] = {
+            "calendarId": "primary",
+            "singleEvents": True,
+            "maxResults": 2500,  # API max per page
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        else:
+            params["timeMin"] = time_min_rfc
+            params["timeMax"] = time_max_rfc
+
+        logger.debug("Syncing calendar cache (%s)", "incremental" if sync_token else "full")
+
+        items: list[dict[str, Any]] = []
+        try:
+            while True:
+                response = self.service.events().list(**params).execute()
+                items.extend(response.get("items", ()))
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+                params["pageToken"] = page_token
+        except HttpError as e:
+            if sync_token and e.resp.status == 410:
+                logger.info("Calendar sync token expired, performing full sync")
+                cache.set_sync_token(key, None)
+                self._sync_window(cache, time_min_rfc, time_max_rfc)
+                return
+            raise
+
+        process = self._process_event
+        processed_events = [process(event) for event in items]
+        if sync_token:
+            cache.upsert_events(processed_events)
+        else:
+            cache.replace_window(time_min_rfc, time_max_rfc, processed_events)
+        cache.set_sync_token(key, response.get("nextSyncToken"))
+        logger.debug("Synced %d changed events into cache", len(processed_events))
+
     def get_event(self, event_id: str) -> dict[str, Any]:
         """Get single calendar event by ID.
 
@@ -102,10 +256,19 @@ class CalendarClient:
         """
         logger.info(f"Fetching event: {event_id}")
 
+        if self.cache is not None:
+            cached_event = self.cache.get_event(event_id)
+            if cached_event is not None:
+                logger.info("Event retrieved from cache")
+                return cached_event
+
         try:
             event = self.service.events().get(calendarId="primary", eventId=event_id).execute()
             logger.info("Event retrieved successfully")
-            return self._process_event(event)
+            processed = self._process_event(event)
+            if self.cache is not None:
+                self.cache.upsert_events([processed])
+            return processed
 
         except Exception as e:
             logger.error(f"Failed to get event: {type(e).__name__}: {e}")
@@ -133,15 +296,7 @@ class CalendarClient:
         is_all_day = start_date is not None
 
         # Extract attendees
-        attendees = []
-        for attendee in event.get("attendees", []):
-            attendees.append(
-                {
-                    "email": attendee.get("email"),
-                    "response_status": attendee.get("responseStatus"),
-                    "optional": attendee.get("optional", False),
-                }
-            )
+        attendees = list(map(_make_attendee, event.get("attendees", ())))
 
         processed = {
             "id": event.get("id"),
@@ -154,7 +309,7 @@ class CalendarClient:
             "attendees": attendees,
             "created": event.get("created"),
             "updated": event.get("updated"),
-            "status": event.get("status"),
+            "status": _EVENT_STATUS.get(status := event.get("status"), status),
             "html_link": event.get("htmlLink"),
         }
 
@@ -191,35 +346,16 @@ class CalendarClient:
         """
         logger.info(f"Creating event: {title}")
 
-        # Build event body
-        event_body: dict[str, Any] = {"summary": title}
-
-        # Handle all-day vs timed events
-        if is_all_day:
-            # All-day events use 'date' field (YYYY-MM-DD)
-            event_body["start"] = {"date": start.strftime("%Y-%m-%d")}
-            event_body["end"] = {"date": end.strftime("%Y-%m-%d")}
-        else:
-            # Timed events use 'dateTime' field (ISO 8601)
-            event_body["start"] = {"dateTime": start.isoformat(), "timeZone": "UTC"}
-            event_body["end"] = {"dateTime": end.isoformat(), "timeZone": "UTC"}
-
-        if location:
-            event_body["location"] = location
-
-        if description:
-            event_body["description"] = description
-
-        if attendees:
-            event_body["attendees"] = [{"email": email} for email in attendees]
-
-        if add_meet:
-            event_body["conferenceData"] = {
-                "createRequest": {
-                    "requestId": f"meet-{start.isoformat()}",
-                    "conferenceSolutionKey": {"type": "hangoutsMeet"},
-                }
-            }
+        # Build event body in one pass (all-day events use 'date', timed use 'dateTime')
+        event_body: dict[str, Any] = {
+            "summary": title,
+            "start": _event_time(start, is_all_day),
+            "end": _event_time(end, is_all_day),
+            **({"location": location} if location else {}),
+            **({"description": description} if description else {}),
+            **({"attendees": [{"email": email} for email in attendees]} if attendees else {}),
+            **(_meet_block(start) if add_meet else {}),
+        }
 
         logger.debug(f"Event body: {event_body}")
 
@@ -236,7 +372,10 @@ class CalendarClient:
             )
 
             logger.info(f"Event created successfully: {created_event['id']}")
-            return self._process_event(created_event)
+            processed = self._process_event(created_event)
+            if self.cache is not None:
+                self.cache.upsert_events([processed])
+            return processed
 
         except Exception as e:
             logger.error(f"Failed to create event: {type(e).__name__}: {e}")
@@ -251,9 +390,14 @@ class CalendarClient:
         location: str | None = None,
         description: str | None = None,
         attendees: list[str] | None = None,
+        is_all_day: bool | None = None,
+        etag: str | None = None,
     ) -> dict[str, Any]:
         """Update an existing calendar event.
 
+        Uses PATCH semantics: only the provided fields are sent to the API, so an
+        update costs a single round-trip instead of a GET followed by a full PUT.
+
         Args:
             event_id: Event ID to update
             title: Optional new title
@@ -262,6 +406,10 @@ class CalendarClient:
             location: Optional new location
             description: Optional new description
             attendees: Optional new list of attendees
+            is_all_day: Whether start/end are all-day dates. When None and start or
+                end is given, the current event shape is looked up (start/end only).
+            etag: Optional event ETag; sent as If-Match so the update fails with
+                412 if the event changed since it was read
 
         Returns:
             Updated event dictionary with processed fields
@@ -272,49 +420,50 @@ class CalendarClient:
         logger.info(f"Updating event: {event_id}")
 
         try:
-            # Fetch existing event
-            existing_event = (
-                self.service.events().get(calendarId="primary", eventId=event_id).execute()
-            )
+            delta: dict[str, Any] = {}
 
-            # Update fields
             if title is not None:
-                existing_event["summary"] = title
+                delta["summary"] = title
+
+            if (start is not None or end is not None) and is_all_day is None:
+                # Lightweight lookup of the event shape (all-day vs timed)
+                existing_times = (
+                    self.service.events()
+                    .get(calendarId="primary", eventId=event_id, fields="start,end")
+                    .execute()
+                )
+                is_all_day = "date" in existing_times.get("start", {})
 
             if start is not None:
-                if "date" in existing_event["start"]:
-                    # All-day event
-                    existing_event["start"]["date"] = start.strftime("%Y-%m-%d")
-                else:
-                    # Timed event
-                    existing_event["start"]["dateTime"] = start.isoformat()
+                delta["start"] = _event_time(start, bool(is_all_day), patch=True)
 
             if end is not None:
-                if "date" in existing_event["end"]:
-                    # All-day event
-                    existing_event["end"]["date"] = end.strftime("%Y-%m-%d")
-                else:
-                    # Timed event
-                    existing_event["end"]["dateTime"] = end.isoformat()
+                delta["end"] = _event_time(end, bool(is_all_day), patch=True)
 
             if location is not None:
-                existing_event["location"] = location
+                delta["location"] = location
 
             if description is not None:
-                existing_event["description"] = description
+                delta["description"] = description
 
             if attendees is not None:
-                existing_event["attendees"] = [{"email": email} for email in attendees]
+                delta["attendees"] = [{"email": email} for email in attendees]
 
-            # Update event
-            updated_event = (
-                self.service.events()
-                .update(calendarId="primary", eventId=event_id, body=existing_event)
-                .execute()
+            logger.debug(f"Event patch body: {delta}")
+
+            # Patch event (only changed fields)
+            request = self.service.events().patch(
+                calendarId="primary", eventId=event_id, body=delta
             )
+            if etag is not None:
+                request.headers["If-Match"] = etag
+            updated_event = request.execute()
 
             logger.info(f"Event updated successfully: {event_id}")
-            return self._process_event(updated_event)
+            processed = self._process_event(updated_event)
+            if self.cache is not None:
+                self.cache.upsert_events([processed])
+            return processed
 
         except Exception as e:
             logger.error(f"Failed to update event: {type(e).__name__}: {e}")
@@ -333,6 +482,8 @@ class CalendarClient:
 
         try:
             self.service.events().delete(calendarId="primary", eventId=event_id).execute()
+            if self.cache is not None:
+                self.cache.delete_event(event_id)
             logger.info(f"Event deleted successfully: {event_id}")
 
         except Exception as e:
@@ -14,44 +14,482 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-import io
+import asyncio
+import hashlib
 import logging
+import mimetypes
+import os
+import random
+import shutil
+import stat
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
+import google_auth_httplib2
+import httplib2
+import requests
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import MediaIoBaseUpload
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+
+from google_gmail_tool import __version__
+from google_gmail_tool.core._discovery import build_service
+from google_gmail_tool.core._drive_query import (
+    q_and,
+    q_in_parent,
+    q_mime_eq,
+    q_name_contains,
+    q_name_eq,
+    q_trashed,
+)
+from google_gmail_tool.core._http_pool import shared_http
+from google_gmail_tool.core._json_model import FastJsonModel
 
 logger = logging.getLogger(__name__)
 
+# Upload small files over aiohttp when installed (optional "async" extra)
+try:
+    import aiohttp
+
+    _HAS_AIOHTTP = True
+except ImportError:
+    _HAS_AIOHTTP = False
+
+# Default copy buffer for streamed media downloads
+DEFAULT_DOWNLOAD_CHUNKSIZE = 4 * 1024 * 1024
+
+# Default chunk size for resumable uploads (fewer PUTs for large files)
+DEFAULT_UPLOAD_CHUNKSIZE = 64 * 1024 * 1024
+
+# Seconds between download progress log lines
+_PROGRESS_LOG_INTERVAL = 1.0
+
+# Minimum seconds between progress bar repaints
+_PROGRESS_MININTERVAL = 0.5
+
+_DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+_DRIVE_UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files"
+
+# Google APIs only gzip responses for clients whose user-agent contains "gzip".
+# googleapiclient adds this itself; our direct requests/aiohttp calls need it too.
+_GZIP_HEADERS = {
+    "User-Agent": f"google-gmail-tool/{__version__} (gzip)",
+    "Accept-Encoding": "gzip",
+}
+
+# Max requests per batch HTTP call (Drive returns HTTP 500s for larger batches)
+_BATCH_LIMIT = 25
+
+# Retries (with exponential backoff) for rate-limited media downloads
+_DOWNLOAD_MAX_RETRIES = 5
+_DOWNLOAD_BACKOFF_BASE = 1.0
+
+_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# list_files result cache (cleared on every mutating call)
+_LIST_CACHE_SIZE = 256
+_LIST_CACHE_TTL = 30.0
+_METADATA_CACHE_SIZE = 4096
+_METADATA_CACHE_TTL = 60.0
+
+# Files smaller than this are sent as a single multipart request instead of
+# the resumable protocol (which costs extra round-trips per file)
+_RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+
+# Read buffer for local MD5 checksums
+_HASH_BUFSIZE = 8 * 1024 * 1024
+_UPLOAD_READ_BUFSIZE = 1024 * 1024
+
+# Field mask for folder listings used to skip already-uploaded files
+_SYNC_LIST_FIELDS = "nextPageToken, files(id, name, mimeType, md5Checksum, size)"
+
+# Field masks (partial responses). FULL includes owners/permissions, which dominate
+# response size; the others are what each call site actually returns.
+_FULL_FILE_FIELDS = (
+    "id, name, mimeType, size, createdTime, modifiedTime, webViewLink, iconLink, "
+    "parents, shared, owners, permissions, trashed, description"
+)
+_MINIMAL_FILE_FIELDS = "id, name, mimeType, modifiedTime"
+_CREATED_FILE_FIELDS = (
+    "id, name, mimeType, size, createdTime, modifiedTime, webViewLink, iconLink, "
+    "parents, description"
+)
+_CREATED_FOLDER_FIELDS = (
+    "id, name, mimeType, createdTime, modifiedTime, webViewLink, iconLink, parents, description"
+)
+_FOLDER_UPLOAD_FIELDS = "id, name, mimeType, size"
+_UPDATED_FILE_FIELDS = "id, name, mimeType, size, modifiedTime, webViewLink, parents"
+_UPDATED_FOLDER_FIELDS = "id, name, mimeType, modifiedTime, webViewLink, parents"
+
+# Lean default field mask for list_files (owners/permissions dominate response size)
+DEFAULT_LIST_FIELDS = (
+    "nextPageToken, files(id, name, mimeType, size, modifiedTime, webViewLink, parents, trashed)"
+)
+
+# Full field mask for list_files, incl. sharing details (drive list/search --full)
+FULL_LIST_FIELDS = (
+    "nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, webViewLink, "
+    "iconLink, parents, shared, owners, permissions, trashed)"
+)
+
+
+def _join_fields(fields: str | Iterable[str] | None, default: str) -> str:
+    """Build a partial-response field mask.
+
+    Args:
+        fields: Field mask string, iterable of field names, or None for the default
+        default: Field mask used when fields is None
+
+    Returns:
+        Comma-separated field mask
+    """
+    if fields is None:
+        return default
+    if isinstance(fields, str):
+        return fields
+    return ", ".join(fields)
+
+
+@lru_cache(maxsize=1024)
+def _guess_mime_for_suffix(suffix: str) -> str | None:
+    """Guess a MIME type from a lower-cased file suffix (cached per suffix)."""
+    return mimetypes.guess_type(f"file{suffix}")[0]
+
+
+def _guess_mime(path: str | Path) -> str | None:
+    """Guess a file's MIME type from its extension.
+
+    Args:
+        path: Local file path
+
+    Returns:
+        MIME type, or None if the extension is unknown
+    """
+    return _guess_mime_for_suffix(os.path.splitext(path)[1].lower())
+
+
+@contextmanager
+def _open_media(
+    path: str | Path, mime_type: str | None, resumable: bool, chunksize: int
+) -> Iterator[MediaIoBaseUpload]:
+    """Open a local file as an upload body backed by one buffered file handle.
+
+    The handle stays open for all chunks of a resumable upload and is closed
+    on exit (MediaFileUpload keeps its descriptor open until garbage collection).
+
+    Args:
+        path: Local file path
+        mime_type: Content MIME type (None = application/octet-stream)
+        resumable: Use the resumable (chunked) protocol
+        chunksize: Bytes per resumable request (-1 = whole file)
+
+    Yields:
+        Media upload object for files().create(media_body=...)
+    """
+    with open(path, "rb", buffering=_UPLOAD_READ_BUFSIZE) as fh:
+        yield MediaIoBaseUpload(
+            fh,
+            mimetype=mime_type or "application/octet-stream",
+            chunksize=chunksize,
+            resumable=resumable,
+        )
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether a requests error is a Drive rate-limit response.
+
+    Drive signals rate limiting with 429, or 403 with reason (user)rateLimitExceeded;
+    other 403s (e.g. missing permissions) are not retryable.
+
+    Args:
+        error: Exception raised by a requests call
+
+    Returns:
+        True if the request should be retried after a backoff
+    """
+    if not isinstance(error, requests.HTTPError) or error.response is None:
+        return False
+    status = error.response.status_code
+    return status == 429 or (status == 403 and "ateLimitExceeded" in error.response.text)
+
+
+def _safe_filename(name: str, fallback: str) -> str:
+    """Turn an (untrusted) Drive file name into a plain local file name.
+
+    Only the last path component is kept, so names like "../../.bashrc" or
+    "/etc/x" cannot escape the output directory.
+
+    Args:
+        name: Drive file name
+        fallback: Name to use when nothing usable remains (e.g. the file ID)
+
+    Returns:
+        File name without directory parts
+    """
+    basename = name.replace("\\", "/").replace("\0", "").rsplit("/", 1)[-1].strip()
+    if basename in ("", ".", ".."):
+        return fallback
+    return basename
+
+
+def _event_loop_running() -> bool:
+    """Check whether the calling thread is running an asyncio event loop.
+
+    Returns:
+        True if asyncio.run() would raise RuntimeError on this thread
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _md5_file(path: Path) -> str:
+    """Compute the MD5 hex digest of a local file.
+
+    Args:
+        path: Local file path
+
+    Returns:
+        MD5 hex digest (comparable to Drive's md5Checksum)
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_BUFSIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _TTLCache:
+    """Small bounded cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries (oldest evicted first)
+            ttl: Seconds an entry stays valid
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a live entry, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store an entry, evicting the oldest one when full."""
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+
+# Authorized requests sessions shared between clients using the same credentials, keyed
+# by credentials identity. Entries disappear once no client references them anymore.
+_SESSION_POOL: weakref.WeakValueDictionary[int, AuthorizedSession] = weakref.WeakValueDictionary()
+_POOL_LOCK = threading.Lock()
+# Keep-alive connections per shared session; covers the default download_files workers
+_SESSION_POOL_SIZE = 32
+
+
+def _shared_session(credentials: Credentials) -> AuthorizedSession:
+    """Get the requests session shared by all clients for these credentials.
+
+    The session mounts a keep-alive pool of _SESSION_POOL_SIZE connections, so
+    concurrent media transfers do not queue on a single socket.
+
+    Args:
+        credentials: Google OAuth credentials
+
+    Returns:
+        Authorized requests session
+    """
+    with _POOL_LOCK:
+        session = _SESSION_POOL.get(id(credentials))
+        if session is None:
+            session = AuthorizedSession(credentials)  # type: ignore[no-untyped-call]
+            session.headers.update(_GZIP_HEADERS)
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=_SESSION_POOL_SIZE, pool_maxsize=_SESSION_POOL_SIZE),
+            )
+            _SESSION_POOL[id(credentials)] = session
+        return session
+
 
 class DriveClient:
     """Client for interacting with Google Drive API v3 (read-only operations)."""
 
-    def __init__(self, credentials: Credentials) -> None:
+    def __init__(
+        self,
+        credentials: Credentials,
+        download_chunksize: int = DEFAULT_DOWNLOAD_CHUNKSIZE,
+        upload_chunksize: int = DEFAULT_UPLOAD_CHUNKSIZE,
+        resumable_threshold_bytes: int = _RESUMABLE_THRESHOLD,
+    ) -> None:
         """Initialize Drive client.
 
         Args:
             credentials: OAuth2 credentials for Drive API access (drive.readonly scope)
+            download_chunksize: Copy buffer size when downloading (default 4 MB)
+            upload_chunksize: Bytes per resumable upload request (default 64 MB, -1 sends
+                the whole file in one request)
+            resumable_threshold_bytes: Files smaller than this are sent in a single
+                non-resumable request (default 5 MB)
         """
         self.credentials = credentials
-        self.service = build("drive", "v3", credentials=credentials)
+        self._download_chunksize = download_chunksize
+        self._upload_chunksize = upload_chunksize
+        self._resumable_threshold = resumable_threshold_bytes
+        self._session: AuthorizedSession | None = None
+        self._local = threading.local()
+        self._list_cache = _TTLCache(_LIST_CACHE_SIZE, _LIST_CACHE_TTL)
+        # folder ID -> {name: file ID}, used by upload_file(check_duplicate=True)
+        self._name_index = _TTLCache(_LIST_CACHE_SIZE, _LIST_CACHE_TTL)
+        self._metadata_cache = _TTLCache(_METADATA_CACHE_SIZE, _METADATA_CACHE_TTL)
+        self.service = build_service(
+            "drive", "v3", model=FastJsonModel(), http=shared_http(credentials)
+        )
         logger.debug("Drive API service initialized")
 
+    def _clear_listing_caches(self, *file_ids: str) -> None:
+        """Drop cached listings and folder name indexes after a mutation.
+
+        Args:
+            *file_ids: IDs of mutated items whose cached metadata must be evicted
+        """
+        self._list_cache.clear()
+        self._name_index.clear()
+        for file_id in file_ids:
+            self._metadata_cache.pop(file_id)
+
+    def _iter_children(self, folder_id: str, fields: str) -> Iterator[dict[str, Any]]:
+        """Yield every non-trashed child of a folder, following nextPageToken.
+
+        Unlike list_files (capped at 1000 results), this pages through folders
+        of any size.
+
+        Args:
+            folder_id: Drive folder ID ("root" for My Drive root)
+            fields: Field mask including nextPageToken and files(...)
+
+        Yields:
+            Child file dictionaries
+        """
+        params: dict[str, Any] = {
+            "q": q_and(q_in_parent(folder_id), q_trashed(False)),
+            "pageSize": 1000,
+            "fields": fields,
+        }
+        while True:
+            response = self.service.files().list(**params).execute()
+            yield from response.get("files", ())
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return
+            params["pageToken"] = page_token
+
+    def _folder_name_index(self, folder_id: str) -> dict[str, str]:
+        """Get (and cache) a name -> file ID mapping for a folder's children.
+
+        Args:
+            folder_id: Drive folder ID ("root" for My Drive root)
+
+        Returns:
+            Dictionary mapping child names to file IDs
+        """
+        index: dict[str, str] | None = self._name_index.get(folder_id)
+        if index is None:
+            index = {}
+            for item in self._iter_children(folder_id, "nextPageToken, files(id, name)"):
+                index.setdefault(item["name"], item["id"])
+            self._name_index.set(folder_id, index)
+        return index
+
+    def _thread_local_service(self) -> Any:
+        """Get a Drive service owned by the calling thread.
+
+        httplib2 is not thread-safe, so worker threads (e.g. upload_folder) each
+        get their own service with a dedicated, non-caching HTTP connection.
+
+        Returns:
+            Drive API service for the current thread
+        """
+        service = getattr(self._local, "service", None)
+        if service is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http(cache=None)
+            )
+            service = build_service("drive", "v3", http=http, model=FastJsonModel())
+            self._local.service = service
+            logger.debug(f"Drive API service initialized for thread {threading.get_ident()}")
+        return service
+
+    def _authorized_session(self) -> AuthorizedSession:
+        """Get the requests session used for streamed media downloads.
+
+        Returns:
+            AuthorizedSession shared by clients with the same credentials
+        """
+        if self._session is None:
+            self._session = _shared_session(self.credentials)
+        return self._session
+
     def list_files(
         self,
         query: str | None = None,
         max_results: int = 100,
         order_by: str = "modifiedTime desc",
         folder_id: str | None = None,
+        fields: str | Iterable[str] | None = None,
+        page_size: int | None = None,
     ) -> list[dict[str, Any]]:
         """List files in Google Drive with optional filtering.
 
+        The default field mask is lean (id, name, mimeType, size, modifiedTime,
+        webViewLink, parents, trashed). Callers needing owners, permissions or
+        sharing details must opt in via fields.
+
+        Results are cached per client for 30 seconds; any mutating call on the
+        client (create, rename, move, delete, upload) clears the cache.
+
         Args:
             query: Drive API query string (e.g., "mimeType='application/pdf'")
             max_results: Maximum number of files to return (default 100, max 1000)
             order_by: Sort order (e.g., "modifiedTime desc", "name", "createdTime")
             folder_id: If specified, list files only in this folder
+            fields: Drive API field mask (default: DEFAULT_LIST_FIELDS)
+            page_size: Files per API request (default: max_results, max 1000)
 
         Returns:
             List of file dictionaries with metadata (id, name, mimeType, size, etc.)
@@ -76,28 +514,26 @@ class DriveClient:
             max_results = 1000
 
         # Build query
-        queries = []
-        if query:
-            queries.append(query)
-        if folder_id:
-            queries.append(f"'{folder_id}' in parents")
-
-        final_query = " and ".join(queries) if queries else None
+        final_query = q_and(query, folder_id and q_in_parent(folder_id)) or None
 
         if final_query:
             logger.debug(f"Using Drive query: {final_query}")
 
         # Build request parameters
         params: dict[str, Any] = {
-            "pageSize": min(max_results, 100),  # API max per page is 100
-            "fields": "nextPageToken, files(id, name, mimeType, size, createdTime, "
-            "modifiedTime, webViewLink, iconLink, parents, shared, owners, "
-            "permissions, trashed)",
+            "pageSize": min(page_size or max_results, 1000),  # API max per page is 1000
+            "fields": _join_fields(fields, DEFAULT_LIST_FIELDS),
             "orderBy": order_by,
         }
         if final_query:
             params["q"] = final_query
 
+        cache_key = (final_query, max_results, order_by, params["fields"], params["pageSize"])
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using cached listing (%d files)", len(cached))
+            return list(cached)
+
         try:
             files: list[dict[str, Any]] = []
             page_token = None
@@ -107,12 +543,15 @@ class DriveClient:
                 if page_token:
                     params["pageToken"] = page_token
 
-                logger.debug(f"Calling Drive API: files().list() (page {len(files) // 100 + 1})")
+                logger.debug(
+                    "Calling Drive API: files().list() (page %d)",
+                    len(files) // params["pageSize"] + 1,
+                )
                 response = self.service.files().list(**params).execute()
 
                 batch = response.get("files", [])
                 files.extend(batch)
-                logger.debug(f"Retrieved {len(batch)} files in this batch")
+                logger.debug("Retrieved %d files in this batch", len(batch))
 
                 # Check if there are more pages
                 page_token = response.get("nextPageToken")
@@ -122,18 +561,31 @@ class DriveClient:
             # Trim to max_results
             files = files[:max_results]
 
+            self._list_cache.set(cache_key, files)
             logger.info(f"Successfully retrieved {len(files)} files")
-            return files
+            return list(files)
 
         except Exception as e:
             logger.error(f"Failed to list files: {type(e).__name__}: {e}")
             raise
 
-    def get_file(self, file_id: str) -> dict[str, Any]:
+    def get_file(
+        self,
+        file_id: str,
+        use_cache: bool = True,
+        fields: str | Iterable[str] | None = None,
+    ) -> dict[str, Any]:
         """Get metadata for a specific file.
 
+        Full metadata is cached per client for 60 seconds; renaming, moving or
+        deleting the file through this client evicts its entry. A cached entry also
+        answers narrowed requests, since it holds a superset of the fields.
+
         Args:
             file_id: The Drive file ID
+            use_cache: Return cached metadata when available (default: True)
+            fields: Fields to request (None = full metadata incl. owners and
+                permissions); narrowed results are not cached
 
         Returns:
             Dictionary with file metadata
@@ -147,31 +599,45 @@ class DriveClient:
             >>> print(f"{file['name']} - {file['mimeType']}")
         """
         logger.info(f"Getting file metadata: {file_id}")
+        if use_cache:
+            cached = self._metadata_cache.get(file_id)
+            if cached is not None:
+                logger.debug("Using cached metadata for file: %s", file_id)
+                return dict(cached)
 
         try:
             file: dict[str, Any] = (
                 self.service.files()
                 .get(
                     fileId=file_id,
-                    fields="id, name, mimeType, size, createdTime, modifiedTime, "
-                    "webViewLink, iconLink, parents, shared, owners, permissions, "
-                    "trashed, description",
+                    fields=_join_fields(fields, _FULL_FILE_FIELDS),
                 )
                 .execute()
             )
             logger.info(f"Retrieved metadata for file: {file.get('name')}")
-            return file
+            if fields is None:
+                self._metadata_cache.set(file_id, file)
+            return dict(file)
 
         except Exception as e:
             logger.error(f"Failed to get file {file_id}: {type(e).__name__}: {e}")
             raise
 
-    def download_file(self, file_id: str, output_path: str) -> int:
+    def download_file(
+        self,
+        file_id: str,
+        output_path: str,
+        chunksize: int | None = None,
+        known_mime_type: str | None = None,
+    ) -> int:
         """Download a file from Google Drive.
 
         Args:
             file_id: The Drive file ID
             output_path: Local path to save the file
+            chunksize: Copy buffer size (default: client download_chunksize)
+            known_mime_type: MIME type if already known (e.g. from search_files); skips
+                the metadata request used to detect Google Workspace files
 
         Returns:
             Number of bytes downloaded
@@ -187,9 +653,12 @@ class DriveClient:
         logger.info(f"Downloading file {file_id} to {output_path}")
 
         try:
-            # Get file metadata first
-            file_metadata = self.get_file(file_id)
-            mime_type = file_metadata.get("mimeType", "")
+            # Get file metadata first (unless the caller already knows the MIME type)
+            if known_mime_type:
+                mime_type = known_mime_type
+            else:
+                file_metadata = self.get_file(file_id, fields="mimeType")
+                mime_type = file_metadata.get("mimeType", "")
 
             # Check if it's a Google Workspace file (needs export)
             if mime_type.startswith("application/vnd.google-apps."):
@@ -203,19 +672,8 @@ class DriveClient:
                 )
 
             # Download binary file
-            request = self.service.files().get_media(fileId=file_id)
-            file_handle = io.FileIO(output_path, "wb")
-            downloader = MediaIoBaseDownload(file_handle, request)
-
-            done = False
-            bytes_downloaded = 0
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    bytes_downloaded = int(status.resumable_progress)
-                    logger.debug(f"Download progress: {int(status.progress() * 100)}%")
-
-            file_handle.close()
+            bytes_downloaded = self._stream_download(file_id, output_path, chunksize)
+
             logger.info(f"Successfully downloaded {bytes_downloaded} bytes to {output_path}")
             return bytes_downloaded
 
@@ -223,6 +681,173 @@ class DriveClient:
             logger.error(f"Failed to download file {file_id}: {type(e).__name__}: {e}")
             raise
 
+    def _stream_download(self, file_id: str, output_path: str, chunksize: int | None) -> int:
+        """Stream binary file content straight to disk (single request, no per-chunk RTT).
+
+        Args:
+            file_id: The Drive file ID (must not be a Google Workspace file)
+            output_path: Local path to save the file
+            chunksize: Copy buffer size (None = client download_chunksize)
+
+        Returns:
+            Number of bytes downloaded
+        """
+        response = self._authorized_session().get(
+            f"{_DRIVE_FILES_URL}/{file_id}", params={"alt": "media"}, stream=True
+        )
+        with response:
+            response.raise_for_status()
+            total_bytes = int(response.headers.get("Content-Length", 0))
+
+            with open(output_path, "wb", buffering=0) as file_handle:
+                # Report progress from a side thread so the copy loop stays tight
+                stop = threading.Event()
+                if total_bytes > 0 and logger.isEnabledFor(logging.DEBUG):
+
+                    def report_progress() -> None:
+                        while not stop.wait(_PROGRESS_LOG_INTERVAL):
+                            logger.debug(
+                                "Download progress: %d%%",
+                                file_handle.tell() * 100 // total_bytes,
+                            )
+
+                    threading.Thread(target=report_progress, daemon=True).start()
+
+                try:
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(
+                        response.raw, file_handle, length=chunksize or self._download_chunksize
+                    )
+                finally:
+                    stop.set()
+                bytes_downloaded = file_handle.tell()
+
+        return bytes_downloaded
+
+    def download_files(
+        self,
+        files: list[str | dict[str, Any]],
+        output_dir: str,
+        workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Download multiple files from Google Drive in parallel.
+
+        Each file is saved under its Drive name in output_dir (directory parts are
+        stripped; repeated names get a " (n)" suffix). Rate-limited
+        downloads (429, 403 rateLimitExceeded) are retried with exponential backoff
+        and jitter; other failures (including Google Workspace files) are logged and
+        reported, not raised.
+
+        Args:
+            files: Drive file IDs, or file dictionaries with id, name and mimeType (as
+                returned by list_files/search_files); bare IDs are resolved in one batch
+            output_dir: Local directory to save the files in (created if missing)
+            workers: Number of parallel download workers (None = min(32, cpu_count * 4))
+
+        Returns:
+            Dictionary with downloaded files, failures and summary counts:
+            {
+                'files': list of {'id', 'name', 'path', 'bytes'},
+                'failed': list of {'id', 'error'},
+                'total_files': count of downloaded files,
+                'total_bytes': total size in bytes
+            }
+
+        Example:
+            >>> client = DriveClient(credentials)
+            >>> files = client.search_files(mime_type="application/pdf")
+            >>> result = client.download_files(files, "/tmp/pdfs")
+            >>> print(f"Downloaded {result['total_files']} files")
+        """
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+        logger.info(f"Downloading {len(files)} files to {output_dir} with {workers} workers")
+
+        output_dir_obj = Path(output_dir).expanduser()
+        output_dir_obj.mkdir(parents=True, exist_ok=True)
+
+        # Local names already taken in this call: Drive allows duplicate names
+        taken_names: set[str] = set()
+        names_lock = threading.Lock()
+
+        def reserve_path(name: str, file_id: str) -> Path:
+            """Pick a safe, not yet used path in output_dir for a Drive file name."""
+            filename = _safe_filename(name, file_id)
+            stem, suffix = os.path.splitext(filename)
+            with names_lock:
+                counter = 1
+                while filename in taken_names:
+                    filename = f"{stem} ({counter}){suffix}"
+                    counter += 1
+                taken_names.add(filename)
+            return output_dir_obj / filename
+
+        downloaded: list[dict[str, Any]] = []
+        failed: list[dict[str, Any]] = []
+
+        # Resolve bare IDs on this thread: self.service is not safe to share with workers
+        file_ids = [file for file in files if isinstance(file, str)]
+        metadata = (
+            self._batch_get_metadata(file_ids, fields=_MINIMAL_FILE_FIELDS) if file_ids else {}
+        )
+        resolved: list[dict[str, Any]] = []
+        for file in files:
+            if not isinstance(file, str):
+                resolved.append(file)
+            elif file in metadata:
+                resolved.append(metadata[file])
+            else:
+                failed.append({"id": file, "error": "File not found"})
+
+        def download_single_file(file_metadata: dict[str, Any]) -> dict[str, Any]:
+            """Download one file described by its metadata."""
+            file_id = file_metadata["id"]
+            mime_type = file_metadata.get("mimeType", "")
+            if mime_type.startswith("application/vnd.google-apps."):
+                raise ValueError(f"Cannot download Google Workspace file ({mime_type})")
+
+            output_path = reserve_path(file_metadata["name"], file_id)
+            for attempt in range(_DOWNLOAD_MAX_RETRIES + 1):
+                try:
+                    bytes_downloaded = self._stream_download(file_id, str(output_path), None)
+                    break
+                except requests.HTTPError as e:
+                    if attempt == _DOWNLOAD_MAX_RETRIES or not _is_rate_limited(e):
+                        raise
+                    delay = _DOWNLOAD_BACKOFF_BASE * 2**attempt + random.uniform(0, 1)
+                    logger.warning("Rate limited downloading %s, retrying in %.1fs", file_id, delay)
+                    time.sleep(delay)
+            return {
+                "id": file_id,
+                "name": file_metadata["name"],
+                "path": str(output_path),
+                "bytes": bytes_downloaded,
+            }
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_id = {
+                executor.submit(download_single_file, file): file["id"] for file in resolved
+            }
+            for future in as_completed(future_to_id):
+                file_id = future_to_id[future]
+                try:
+                    downloaded.append(future.result())
+                except Exception as e:
+                    logger.error(f"Download failed for {file_id}: {type(e).__name__}: {e}")
+                    failed.append({"id": file_id, "error": str(e)})
+
+        total_bytes = sum(f["bytes"] for f in downloaded)
+        logger.info(
+            f"Downloaded {len(downloaded)} files ({total_bytes} bytes), {len(failed)} failed"
+        )
+
+        return {
+            "files": downloaded,
+            "failed": failed,
+            "total_files": len(downloaded),
+            "total_bytes": total_bytes,
+        }
+
     def search_files(
         self,
         name_contains: str | None = None,
@@ -230,6 +855,8 @@ class DriveClient:
         folder_id: str | None = None,
         shared_with_me: bool = False,
         max_results: int = 50,
+        fields: str | Iterable[str] | None = None,
+        page_size: int | None = None,
     ) -> list[dict[str, Any]]:
         """Search for files with common filters.
 
@@ -239,6 +866,8 @@ class DriveClient:
             folder_id: Search only within this folder
             shared_with_me: Only show files shared with me
             max_results: Maximum number of results to return
+            fields: Drive API field mask (default: DEFAULT_LIST_FIELDS)
+            page_size: Files per API request (default: max_results, max 1000)
 
         Returns:
             List of file dictionaries matching the search criteria
@@ -257,33 +886,84 @@ class DriveClient:
             f"folder_id={folder_id}, shared_with_me={shared_with_me}"
         )
 
-        # Build query parts
-        query_parts = []
+        # Build query (always excluding trashed files)
+        query = q_and(
+            name_contains and q_name_contains(name_contains),
+            mime_type and q_mime_eq(mime_type),
+            folder_id and q_in_parent(folder_id),
+            "sharedWithMe=true" if shared_with_me else None,
+            q_trashed(False),
+        )
+        logger.debug(f"Search query: {query}")
+
+        return self.list_files(
+            query=query, max_results=max_results, fields=fields, page_size=page_size
+        )
 
-        if name_contains:
-            # Escape single quotes in search term
-            escaped_name = name_contains.replace("'", "\\'")
-            query_parts.append(f"name contains '{escaped_name}'")
+    def exists_by_name(
+        self, name: str, folder_id: str | None = None, mime_type: str | None = None
+    ) -> str | None:
+        """Check whether a non-trashed item with the given name exists in a folder.
 
-        if mime_type:
-            query_parts.append(f"mimeType='{mime_type}'")
+        Issues a single files().list request for one ID, bypassing list_files'
+        pagination and default field mask.
 
-        if folder_id:
-            query_parts.append(f"'{folder_id}' in parents")
+        Args:
+            name: Exact item name
+            folder_id: ID of the folder to look in (None = My Drive root)
+            mime_type: Only match items of this MIME type (e.g. folders)
 
-        if shared_with_me:
-            query_parts.append("sharedWithMe=true")
+        Returns:
+            ID of an existing item with that name, or None
 
-        # Always exclude trashed files
-        query_parts.append("trashed=false")
+        Example:
+            >>> client = DriveClient(credentials)
+            >>> if client.exists_by_name("report.pdf", folder_id="1abc123"):
+            ...     print("Already uploaded")
+        """
+        query = q_and(
+            q_name_eq(name),
+            q_trashed(False),
+            mime_type and q_mime_eq(mime_type),
+            q_in_parent(folder_id or "root"),
+        )
+        logger.debug(f"Checking for existing item with query: {query}")
+        response = self.service.files().list(q=query, pageSize=1, fields="files(id)").execute()
+        files = response.get("files", [])
+        return str(files[0]["id"]) if files else None
 
-        query = " and ".join(query_parts)
-        logger.debug(f"Search query: {query}")
+    def _check_folder_name_available(self, name: str, parent_id: str | None) -> None:
+        """Ensure no folder with the given name exists in the parent location.
+
+        Args:
+            name: Folder name
+            parent_id: ID of the parent folder (None = My Drive root)
 
-        return self.list_files(query=query, max_results=max_results)
+        Raises:
+            ValueError: If folder with same name already exists in parent location
+        """
+        try:
+            existing_id = self.exists_by_name(name, parent_id, mime_type=_FOLDER_MIME_TYPE)
+            if existing_id:
+                error_msg = (
+                    f"Folder with name '{name}' already exists in "
+                    f"{'folder ' + parent_id if parent_id else 'My Drive root'}. "
+                    f"Existing folder ID: {existing_id}. "
+                    f"Use a different name or rename the existing folder first."
+                )
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+        except ValueError:
+            raise  # Re-raise ValueError from duplicate check
+        except Exception as e:
+            logger.warning(f"Could not check for existing folders: {type(e).__name__}: {e}")
 
     def create_folder(
-        self, name: str, parent_id: str | None = None, description: str | None = None
+        self,
+        name: str,
+        parent_id: str | None = None,
+        description: str | None = None,
+        check_duplicate: bool = True,
     ) -> dict[str, Any]:
         """Create a folder in Google Drive.
 
@@ -291,6 +971,8 @@ class DriveClient:
             name: Name for the folder
             parent_id: ID of the parent folder (None = My Drive root)
             description: Optional description for the folder
+            check_duplicate: If True, fail when the parent already has a folder with this
+                name (costs one extra request). Pass False when the parent is known to be new.
 
         Returns:
             Dictionary with folder metadata (id, name, mimeType, webViewLink, etc.)
@@ -315,35 +997,8 @@ class DriveClient:
         logger.info(f"Creating folder: '{name}' in parent: {parent_id or 'root'}")
 
         # Check if folder with same name already exists in parent
-        escaped_name = name.replace("'", "\\'")
-        query_parts = [
-            f"name='{escaped_name}'",
-            "mimeType='application/vnd.google-apps.folder'",
-            "trashed=false",
-        ]
-        if parent_id:
-            query_parts.append(f"'{parent_id}' in parents")
-        else:
-            query_parts.append("'root' in parents")
-
-        check_query = " and ".join(query_parts)
-        logger.debug(f"Checking for existing folder with query: {check_query}")
-
-        try:
-            existing_folders = self.list_files(query=check_query, max_results=1)
-            if existing_folders:
-                error_msg = (
-                    f"Folder with name '{name}' already exists in "
-                    f"{'folder ' + parent_id if parent_id else 'My Drive root'}. "
-                    f"Existing folder ID: {existing_folders[0]['id']}. "
-                    f"Use a different name or rename the existing folder first."
-                )
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-        except ValueError:
-            raise  # Re-raise ValueError from duplicate check
-        except Exception as e:
-            logger.warning(f"Could not check for existing folders: {type(e).__name__}: {e}")
+        if check_duplicate:
+            self._check_folder_name_available(name, parent_id)
 
         # Build folder metadata
         file_metadata: dict[str, Any] = {
@@ -358,12 +1013,12 @@ class DriveClient:
         try:
             # Create folder
             logger.debug(f"Creating folder: {name}")
+            self._clear_listing_caches()
             folder: dict[str, Any] = (
                 self.service.files()
                 .create(
                     body=file_metadata,
-                    fields="id, name, mimeType, createdTime, modifiedTime, "
-                    "webViewLink, iconLink, parents, description",
+                    fields=_CREATED_FOLDER_FIELDS,
                 )
                 .execute()
             )
@@ -398,11 +1053,14 @@ class DriveClient:
             >>> print(f"Renamed to: {folder['name']}")
         """
         logger.info(f"Renaming folder {folder_id} to '{new_name}'")
+        self._clear_listing_caches(folder_id)  # Listings may change
 
         try:
-            # Verify it's a folder
-            file_metadata = self.get_file(folder_id)
-            if file_metadata.get("mimeType") != "application/vnd.google-apps.folder":
+            # Verify it's a folder (lean preflight: only the fields we check)
+            file_metadata = (
+                self.service.files().get(fileId=folder_id, fields="mimeType, name").execute()
+            )
+            if file_metadata.get("mimeType") != _FOLDER_MIME_TYPE:
                 item_name = file_metadata.get("name")
                 error_msg = (
                     f"Item {folder_id} is not a folder "
@@ -419,7 +1077,7 @@ class DriveClient:
                 .update(
                     fileId=folder_id,
                     body=folder_metadata,
-                    fields="id, name, mimeType, modifiedTime, webViewLink, parents",
+                    fields=_UPDATED_FOLDER_FIELDS,
                 )
                 .execute()
             )
@@ -456,6 +1114,7 @@ class DriveClient:
             >>> print(f"Moved {folder['name']} to new parent")
         """
         logger.info(f"Moving folder {folder_id} to folder {destination_folder_id}")
+        self._clear_listing_caches(folder_id)  # Listings may change
 
         try:
             # Verify it's a folder
@@ -489,7 +1148,7 @@ class DriveClient:
                     fileId=folder_id,
                     addParents=destination_folder_id,
                     removeParents=previous_parents,
-                    fields="id, name, mimeType, modifiedTime, webViewLink, parents",
+                    fields=_UPDATED_FOLDER_FIELDS,
                 )
                 .execute()
             )
@@ -530,11 +1189,14 @@ class DriveClient:
         """
         action = "Permanently deleting" if permanent else "Trashing"
         logger.info(f"{action} folder {folder_id}")
+        self._clear_listing_caches(folder_id)  # Listings may change
 
         try:
-            # Verify it's a folder
-            file_metadata = self.get_file(folder_id)
-            if file_metadata.get("mimeType") != "application/vnd.google-apps.folder":
+            # Verify it's a folder (lean preflight: only the fields we check)
+            file_metadata = (
+                self.service.files().get(fileId=folder_id, fields="mimeType, name").execute()
+            )
+            if file_metadata.get("mimeType") != _FOLDER_MIME_TYPE:
                 item_name = file_metadata.get("name")
                 error_msg = (
                     f"Item {folder_id} is not a folder "
@@ -561,24 +1223,365 @@ class DriveClient:
             logger.error(f"Failed to delete folder {folder_id}: {type(e).__name__}: {e}")
             raise
 
+    def _batch_get_metadata(
+        self, file_ids: list[str], fields: str = "id, name, mimeType, parents"
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch metadata for many files using batch HTTP requests.
+
+        Args:
+            file_ids: Drive file IDs (duplicates are fetched once)
+            fields: Fields to return for each file
+
+        Returns:
+            Dictionary mapping file ID to metadata (failed lookups are omitted)
+        """
+        # A batch rejects repeated request IDs
+        file_ids = list(dict.fromkeys(file_ids))
+        results: dict[str, dict[str, Any]] = {}
+
+        def callback(request_id: str, response: dict[str, Any], exception: Exception) -> None:
+            if exception is not None:
+                logger.error(f"Failed to get file {request_id}: {exception}")
+                return
+            results[request_id] = response
+
+        for start in range(0, len(file_ids), _BATCH_LIMIT):
+            chunk = file_ids[start : start + _BATCH_LIMIT]
+            batch = self.service.new_batch_http_request(callback=callback)
+            for file_id in chunk:
+                batch.add(
+                    self.service.files().get(fileId=file_id, fields=fields), request_id=file_id
+                )
+            logger.debug(f"Executing metadata batch of {len(chunk)} requests")
+            batch.execute()
+
+        return results
+
+    def _bulk_folder_op(
+        self,
+        folder_ids: list[str],
+        action: str,
+        operation: Callable[[str, dict[str, Any]], Any],
+    ) -> dict[str, Any]:
+        """Run an operation on many folders after a single batched folder check.
+
+        Args:
+            folder_ids: Drive folder IDs
+            action: Action name for logging (e.g. "rename")
+            operation: Callable(folder_id, metadata) performing the mutation
+
+        Returns:
+            Dictionary with 'folders' (operation results) and 'failed' ({'id', 'error'})
+        """
+        metadata = self._batch_get_metadata(folder_ids)
+        self._clear_listing_caches(*folder_ids)  # Listings may change
+        folders: list[Any] = []
+        failed: list[dict[str, Any]] = []
+
+        for folder_id in folder_ids:
+            file = metadata.get(folder_id)
+            if file is None:
+                failed.append({"id": folder_id, "error": "Folder not found"})
+                continue
+            if file.get("mimeType") != _FOLDER_MIME_TYPE:
+                failed.append(
+                    {
+                        "id": folder_id,
+                        "error": f"Item is not a folder (mimeType: {file.get('mimeType')})",
+                    }
+                )
+                continue
+            try:
+                folders.append(operation(folder_id, file))
+            except Exception as e:
+                logger.error(f"Failed to {action} folder {folder_id}: {type(e).__name__}: {e}")
+                failed.append({"id": folder_id, "error": str(e)})
+
+        logger.info(f"Bulk {action}: {len(folders)} succeeded, {len(failed)} failed")
+        return {"folders": folders, "failed": failed}
+
+    def rename_folders(self, mapping: dict[str, str]) -> dict[str, Any]:
+        """Rename many folders, verifying them with batched metadata requests.
+
+        Args:
+            mapping: Dictionary mapping folder ID to new name
+
+        Returns:
+            Dictionary with 'folders' (updated metadata) and 'failed' ({'id', 'error'})
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> result = client.rename_folders({"1abc": "Reports", "1def": "Archive"})
+            >>> print(f"Renamed {len(result['folders'])} folders")
+        """
+        logger.info(f"Renaming {len(mapping)} folders")
+
+        def rename(folder_id: str, file: dict[str, Any]) -> dict[str, Any]:
+            folder: dict[str, Any] = (
+                self.service.files()
+                .update(
+                    fileId=folder_id,
+                    body={"name": mapping[folder_id]},
+                    fields=_UPDATED_FOLDER_FIELDS,
+                )
+                .execute()
+            )
+            return folder
+
+        return self._bulk_folder_op(list(mapping), "rename", rename)
+
+    def move_folders(self, folder_ids: list[str], destination_folder_id: str) -> dict[str, Any]:
+        """Move many folders to a parent folder, verifying them with batched requests.
+
+        Args:
+            folder_ids: Drive folder IDs to move
+            destination_folder_id: ID of the destination parent folder
+
+        Returns:
+            Dictionary with 'folders' (updated metadata) and 'failed' ({'id', 'error'})
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> result = client.move_folders(["1abc", "1def"], "1parent456")
+        """
+        logger.info(f"Moving {len(folder_ids)} folders to folder {destination_folder_id}")
+
+        def move(folder_id: str, file: dict[str, Any]) -> dict[str, Any]:
+            folder: dict[str, Any] = (
+                self.service.files()
+                .update(
+                    fileId=folder_id,
+                    addParents=destination_folder_id,
+                    removeParents=",".join(file.get("parents", [])),
+                    fields=_UPDATED_FOLDER_FIELDS,
+                )
+                .execute()
+            )
+            return folder
+
+        return self._bulk_folder_op(folder_ids, "move", move)
+
+    def delete_folders(self, folder_ids: list[str], permanent: bool = False) -> dict[str, Any]:
+        """Delete many folders, verifying them with batched metadata requests.
+
+        Args:
+            folder_ids: Drive folder IDs
+            permanent: If False (default), move to trash. If True, permanently delete.
+
+        Returns:
+            Dictionary with 'folders' (deleted IDs) and 'failed' ({'id', 'error'})
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> result = client.delete_folders(["1abc", "1def"])
+        """
+        action = "Permanently deleting" if permanent else "Trashing"
+        logger.info(f"{action} {len(folder_ids)} folders")
+
+        def delete(folder_id: str, file: dict[str, Any]) -> str:
+            if permanent:
+                self.service.files().delete(fileId=folder_id).execute()
+            else:
+                self.service.files().update(fileId=folder_id, body={"trashed": True}).execute()
+            return folder_id
+
+        return self._bulk_folder_op(folder_ids, "delete", delete)
+
+    async def _async_auth_headers(self) -> dict[str, str]:
+        """Get request headers (auth + gzip), refreshing the token off the event loop."""
+        if not self.credentials.valid:
+            await asyncio.to_thread(self.credentials.refresh, Request())
+        return {"Authorization": f"Bearer {self.credentials.token}", **_GZIP_HEADERS}
+
+    async def _async_multipart_upload(
+        self,
+        session: aiohttp.ClientSession,
+        file_path: Path,
+        metadata: dict[str, Any],
+        mime_type: str | None,
+        fields: str,
+    ) -> tuple[dict[str, Any], int]:
+        """POST one file as a multipart upload (metadata + content in one request).
+
+        Args:
+            session: aiohttp session carrying the Authorization header
+            file_path: Local file (read into memory whole)
+            metadata: Drive file metadata (name, parents, description, ...)
+            mime_type: Content MIME type (None = application/octet-stream)
+            fields: Fields to return for the created file
+
+        Returns:
+            Tuple of (uploaded file metadata, local size)
+        """
+        content = await asyncio.to_thread(file_path.read_bytes)
+        with aiohttp.MultipartWriter("related") as body:
+            body.append_json(metadata)
+            body.append(content, {"Content-Type": mime_type or "application/octet-stream"})
+        params = {"uploadType": "multipart", "fields": fields}
+        async with session.post(_DRIVE_UPLOAD_URL, params=params, data=body) as resp:
+            resp.raise_for_status()
+            file: dict[str, Any] = await resp.json()
+        return file, len(content)
+
+    async def upload_files_async(
+        self,
+        uploads: list[dict[str, Any]],
+        concurrency: int = 8,
+        fields: str | Iterable[str] | None = None,
+        on_done: Callable[[], object] | None = None,
+    ) -> dict[str, Any]:
+        """Upload many files concurrently over one aiohttp session.
+
+        Each file is sent as a single multipart request and read into memory
+        whole, so this suits many small files; use upload_file for large ones.
+        Requires the optional aiohttp dependency (pip install ".[async]").
+
+        Args:
+            uploads: Dictionaries with upload_file keyword arguments: local_path
+                (required), folder_id, name, mime_type, description
+            concurrency: Maximum number of in-flight uploads (default 8)
+            fields: Field mask for the returned file metadata (default: the
+                same fields as upload_file)
+            on_done: Called after each upload completes (success or failure),
+                e.g. to advance a progress bar
+
+        Returns:
+            Dictionary with 'files' (uploaded metadata, in input order) and 'failed'
+            ({'local_path', 'error'})
+
+        Raises:
+            ImportError: If aiohttp is not installed
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> result = asyncio.run(client.upload_files_async(
+            ...     [{"local_path": "a.txt"}, {"local_path": "b.txt", "folder_id": "1abc"}]
+            ... ))
+            >>> print(f"Uploaded {len(result['files'])} files")
+        """
+        if not _HAS_AIOHTTP:
+            raise ImportError('aiohttp is required for async uploads: pip install ".[async]"')
+
+        logger.info(f"Uploading {len(uploads)} files (concurrency={concurrency})")
+        headers = await self._async_auth_headers()
+        semaphore = asyncio.Semaphore(concurrency)
+        file_fields = _join_fields(fields, _CREATED_FILE_FIELDS)
+        self._clear_listing_caches()  # Listings may change
+
+        async def upload(
+            session: aiohttp.ClientSession, spec: dict[str, Any]
+        ) -> dict[str, Any] | Exception:
+            file_path = Path(spec["local_path"])
+            metadata: dict[str, Any] = {"name": spec.get("name") or file_path.name}
+            if spec.get("folder_id"):
+                metadata["parents"] = [spec["folder_id"]]
+            if spec.get("description"):
+                metadata["description"] = spec["description"]
+            mime_type = spec.get("mime_type") or _guess_mime(file_path)
+            async with semaphore:
+                try:
+                    file, _ = await self._async_multipart_upload(
+                        session,
+                        file_path,
+                        metadata,
+                        mime_type,
+                        file_fields,
+                    )
+                    logger.debug("Uploaded %s (ID: %s)", file_path, file["id"])
+                    return file
+                except Exception as e:
+                    logger.error(f"Failed to upload file {file_path}: {type(e).__name__}: {e}")
+                    return e
+                finally:
+                    if on_done is not None:
+                        on_done()
+
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            results = await asyncio.gather(*(upload(session, spec) for spec in uploads))
+
+        files: list[dict[str, Any]] = []
+        failed: list[dict[str, Any]] = []
+        for spec, result in zip(uploads, results, strict=True):
+            if isinstance(result, Exception):
+                failed.append({"local_path": spec["local_path"], "error": str(result)})
+            else:
+                files.append(result)
+        logger.info(f"Async upload: {len(files)} succeeded, {len(failed)} failed")
+        return {"files": files, "failed": failed}
+
+    async def upload_file_async(
+        self,
+        local_path: str,
+        folder_id: str | None = None,
+        name: str | None = None,
+        mime_type: str | None = None,
+        description: str | None = None,
+    ) -> dict[str, Any]:
+        """Upload a single file as one async multipart request.
+
+        Args:
+            local_path: Path to the local file to upload
+            folder_id: ID of the folder to upload to (None = My Drive root)
+            name: Name for the file in Drive (None = use local filename)
+            mime_type: MIME type of the file (None = auto-detect)
+            description: Description for the file
+
+        Returns:
+            Dictionary with uploaded file metadata
+
+        Raises:
+            FileNotFoundError: If local_path does not exist
+            ImportError: If aiohttp is not installed
+            Exception: If upload fails
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> file = asyncio.run(client.upload_file_async("/path/to/notes.txt"))
+        """
+        if not os.path.exists(local_path):
+            raise FileNotFoundError(f"File not found: {local_path}")
+        result = await self.upload_files_async(
+            [
+                {
+                    "local_path": local_path,
+                    "folder_id": folder_id,
+                    "name": name,
+                    "mime_type": mime_type,
+                    "description": description,
+                }
+            ],
+            concurrency=1,
+        )
+        if result["failed"]:
+            raise RuntimeError(f"Failed to upload {local_path}: {result['failed'][0]['error']}")
+        file: dict[str, Any] = result["files"][0]
+        return file
+
     def upload_folder(
         self,
         local_path: str,
         parent_id: str | None = None,
         recursive: bool = True,
         workers: int | None = None,
+        skip_existing: bool = False,
     ) -> dict[str, Any]:
         """Upload a local folder to Google Drive with parallel file uploads.
 
         This method creates the folder structure and uploads files in parallel for
         improved performance. Requires additional imports: Path, ThreadPoolExecutor,
-        as_completed, tqdm, sys, os, mimetypes.
+        as_completed, tqdm, sys, os, mimetypes. When aiohttp is installed and the
+        caller is not running an event loop, small files are uploaded concurrently
+        over a single async session (workers * 4 in flight); large files always use
+        the resumable thread-pool path.
 
         Args:
             local_path: Path to the local folder to upload
             parent_id: ID of the parent folder in Drive (None = My Drive root)
             recursive: If True, upload subdirectories recursively
             workers: Number of parallel upload workers (None = use os.cpu_count())
+            skip_existing: If True, reuse existing destination folders and skip files whose
+                name, size and MD5 match a file already in the destination (re-run sync)
 
         Returns:
             Dictionary with folder metadata, lists of created items, and summary counts:
@@ -586,6 +1589,7 @@ class DriveClient:
                 'folder': root folder metadata,
                 'folders': list of created folders,
                 'files': list of uploaded files,
+                'skipped_files': local paths skipped as already uploaded,
                 'total_files': count of files,
                 'total_folders': count of folders,
                 'total_bytes': total size in bytes
@@ -615,15 +1619,6 @@ class DriveClient:
             ...     workers=8
             ... )
         """
-        # This method requires additional imports that are added at module level
-        import mimetypes
-        import os
-        import sys
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        from pathlib import Path
-
-        from tqdm import tqdm
-
         # Validate local path
         local_path_obj = Path(local_path).expanduser().resolve()
         if not local_path_obj.exists():
@@ -649,17 +1644,36 @@ class DriveClient:
         created_folders: list[dict[str, Any]] = []
         created_files: list[dict[str, Any]] = []
 
+        skipped_files: list[str] = []
+
         # Folder ID mapping: local path -> Drive folder ID
-        folder_mapping: dict[str, str] = {}
+        folder_mapping: dict[Path, str] = {}
+
+        # Existing destination contents (skip_existing): Drive folder ID -> name -> item
+        remote_children: dict[str, dict[str, dict[str, Any]]] = {}
+
+        def children_of(drive_id: str) -> dict[str, dict[str, Any]]:
+            """List (once) all existing items in a destination folder."""
+            if drive_id not in remote_children:
+                items = self._iter_children(drive_id, _SYNC_LIST_FIELDS)
+                remote_children[drive_id] = {item["name"]: item for item in items}
+            return remote_children[drive_id]
+
+        def is_uploaded(file_path: Path, size: int, parent_drive_id: str) -> bool:
+            """Check whether an identical file already exists in the destination."""
+            remote = children_of(parent_drive_id).get(file_path.name)
+            if remote is None or remote.get("size") != str(size):
+                return False
+            return remote.get("md5Checksum") == _md5_file(file_path)
 
         # Helper function to upload a single file
-        def upload_single_file(file_path: Path, parent_drive_id: str) -> dict[str, Any] | None:
-            """Upload a single file with error handling."""
+        def upload_single_file(
+            file_path: Path, size: int, parent_drive_id: str
+        ) -> tuple[dict[str, Any], int] | None:
+            """Upload a single file with error handling, returning (file, local size)."""
             try:
                 # Auto-detect MIME type
-                mime_type, _ = mimetypes.guess_type(str(file_path))
-                if mime_type is None:
-                    mime_type = "application/octet-stream"
+                mime_type = _guess_mime(file_path) or "application/octet-stream"
 
                 # Build file metadata
                 file_metadata: dict[str, Any] = {
@@ -667,80 +1681,132 @@ class DriveClient:
                     "parents": [parent_drive_id],
                 }
 
-                # Import MediaFileUpload here to avoid circular import issues
-                from googleapiclient.http import MediaFileUpload
-
-                # Create media upload
-                media = MediaFileUpload(str(file_path), mimetype=mime_type, resumable=True)
-
-                # Upload file
-                file: dict[str, Any] = (
-                    self.service.files()
-                    .create(
-                        body=file_metadata,
-                        media_body=media,
-                        fields="id, name, mimeType, size",
+                # Upload file (multipart for small files, resumable for large)
+                resumable = size >= self._resumable_threshold
+                with _open_media(file_path, mime_type, resumable, self._upload_chunksize) as media:
+                    file: dict[str, Any] = (
+                        self._thread_local_service()
+                        .files()
+                        .create(
+                            body=file_metadata,
+                            media_body=media,
+                            fields=_FOLDER_UPLOAD_FIELDS,
+                        )
+                        .execute()
                     )
-                    .execute()
-                )
-                return file
+                return file, size
             except Exception as e:
                 logger.error(f"Failed to upload file {file_path.name}: {e}")
                 return None
 
         try:
-            # Create root folder
-            root_folder = self.create_folder(folder_name, parent_id=parent_id)
-            created_folders.append(root_folder)
-            folder_mapping[str(local_path_obj)] = root_folder["id"]
-            logger.info(f"Created root folder: {root_folder['name']} (ID: {root_folder['id']})")
-
-            # Collect all items to upload
-            folders_to_create: list[tuple[Path, str]] = []  # (local_path, parent_id)
-            files_to_upload: list[tuple[Path, str]] = []  # (local_path, parent_id)
-
-            # Walk directory tree
-            if recursive:
-                items = local_path_obj.rglob("*")
+            # Create root folder (or reuse it when syncing)
+            existing_root = (
+                children_of(parent_id or "root").get(folder_name) if skip_existing else None
+            )
+            if existing_root and existing_root.get("mimeType") == _FOLDER_MIME_TYPE:
+                root_folder = existing_root
+                logger.info(f"Reusing root folder: {root_folder['name']} (ID: {root_folder['id']})")
             else:
-                items = local_path_obj.glob("*")
-
-            for item in items:
-                parent_local_path = item.parent
-
-                # Get parent folder ID in Drive
-                if str(parent_local_path) in folder_mapping:
-                    parent_drive_id = folder_mapping[str(parent_local_path)]
-                else:
-                    parent_drive_id = root_folder["id"]
-
-                if item.is_dir():
-                    folders_to_create.append((item, parent_drive_id))
-                elif item.is_file():
-                    files_to_upload.append((item, parent_drive_id))
-
-            # Create folders first (must be sequential for hierarchy)
+                root_folder = self.create_folder(folder_name, parent_id=parent_id)
+                created_folders.append(root_folder)
+                remote_children[root_folder["id"]] = {}
+                logger.info(f"Created root folder: {root_folder['name']} (ID: {root_folder['id']})")
+            folder_mapping[local_path_obj] = root_folder["id"]
+
+            # Walk directory tree breadth-first so folders come out in level order
+            # (every parent precedes its children); file sizes come from the walk's stat.
+            # Symlinked directories are created but not descended into (no cycles).
+            folders_to_create: list[Path] = []
+            local_files: list[tuple[Path, int]] = []  # (local_path, size)
+            pending = deque([local_path_obj])
+            while pending:
+                directory = pending.popleft()
+                with os.scandir(directory) as entries:
+                    for entry in sorted(entries, key=lambda entry: entry.name):
+                        item = directory / entry.name
+                        if entry.is_dir():
+                            folders_to_create.append(item)
+                            if recursive and not entry.is_symlink():
+                                pending.append(item)
+                        elif entry.is_file():
+                            local_files.append((item, entry.stat().st_size))
+
+            # Create folders top-down (must be sequential for hierarchy)
             logger.info(f"Creating {len(folders_to_create)} folders...")
-            for folder_path, parent_drive_id in tqdm(
-                folders_to_create, desc="Creating folders", file=sys.stderr, disable=False
+            for folder_path in tqdm(
+                folders_to_create,
+                desc="Creating folders",
+                file=sys.stderr,
+                disable=False,
+                mininterval=_PROGRESS_MININTERVAL,
+                miniters=max(1, len(folders_to_create) // 200),
             ):
+                parent_drive_id = folder_mapping.get(folder_path.parent)
+                if parent_drive_id is None:
+                    logger.error(f"Skipping folder {folder_path.name}: parent folder not created")
+                    continue
+                if skip_existing:
+                    existing = children_of(parent_drive_id).get(folder_path.name)
+                    if existing and existing.get("mimeType") == _FOLDER_MIME_TYPE:
+                        folder_mapping[folder_path] = existing["id"]
+                        continue
                 try:
-                    folder = self.create_folder(folder_path.name, parent_id=parent_drive_id)
+                    # Parent was just created (or checked above), so no duplicate check
+                    folder = self.create_folder(
+                        folder_path.name, parent_id=parent_drive_id, check_duplicate=False
+                    )
                     created_folders.append(folder)
-                    folder_mapping[str(folder_path)] = folder["id"]
-                    logger.debug(f"Created folder: {folder_path.name} (ID: {folder['id']})")
+                    folder_mapping[folder_path] = folder["id"]
+                    remote_children[folder["id"]] = {}
+                    logger.debug("Created folder: %s (ID: %s)", folder_path.name, folder["id"])
                 except Exception as e:
                     logger.error(f"Failed to create folder {folder_path.name}: {e}")
                     # Continue with other items
 
+            # Resolve file parents now that the folder hierarchy exists
+            files_to_upload: list[tuple[Path, int, str]] = []  # (local_path, size, parent_id)
+            for file_path, size in local_files:
+                parent_drive_id = folder_mapping.get(file_path.parent)
+                if parent_drive_id is None:
+                    logger.error(f"Skipping file {file_path.name}: parent folder not created")
+                    continue
+                if skip_existing and is_uploaded(file_path, size, parent_drive_id):
+                    skipped_files.append(str(file_path))
+                    continue
+                files_to_upload.append((file_path, size, parent_drive_id))
+
+            if skipped_files:
+                logger.info(f"Skipping {len(skipped_files)} files already uploaded")
+
             # Upload files in parallel
             logger.info(f"Uploading {len(files_to_upload)} files with {workers} workers...")
 
+            # Total bytes from local sizes (the API omits size for Google-native types)
+            total_bytes = 0
+
+            # Small files go over aiohttp when available, the rest over the thread pool.
+            # asyncio.run() cannot nest in a caller's running event loop, so then
+            # every file takes the thread pool path.
+            async_uploads: list[dict[str, Any]] = []
+            async_sizes: dict[str, int] = {}
+            threaded_files = files_to_upload
+            if _HAS_AIOHTTP and not _event_loop_running():
+                threaded_files = []
+                for file_path, size, parent_drive_id in files_to_upload:
+                    if size < self._resumable_threshold:
+                        async_uploads.append(
+                            {"local_path": str(file_path), "folder_id": parent_drive_id}
+                        )
+                        async_sizes[str(file_path)] = size
+                    else:
+                        threaded_files.append((file_path, size, parent_drive_id))
+
             with ThreadPoolExecutor(max_workers=workers) as executor:
-                # Submit all upload tasks
+                # Submit all threaded upload tasks
                 future_to_file = {
-                    executor.submit(upload_single_file, file_path, parent_drive_id): file_path
-                    for file_path, parent_drive_id in files_to_upload
+                    executor.submit(upload_single_file, file_path, size, parent_drive_id): file_path
+                    for file_path, size, parent_drive_id in threaded_files
                 }
 
                 # Process completed uploads with progress bar
@@ -749,24 +1815,38 @@ class DriveClient:
                     desc="Uploading files",
                     file=sys.stderr,
                     disable=False,
+                    mininterval=_PROGRESS_MININTERVAL,
+                    miniters=max(1, len(files_to_upload) // 200),
+                    smoothing=0,
                 ) as pbar:
+                    if async_uploads:
+                        async_result = asyncio.run(
+                            self.upload_files_async(
+                                async_uploads,
+                                concurrency=workers * 4,
+                                fields=_FOLDER_UPLOAD_FIELDS,
+                                on_done=lambda: pbar.update(1),
+                            )
+                        )
+                        created_files.extend(async_result["files"])
+                        for failure in async_result["failed"]:
+                            del async_sizes[failure["local_path"]]
+                        total_bytes += sum(async_sizes.values())
+
                     for future in as_completed(future_to_file):
                         file_path = future_to_file[future]
                         try:
                             result = future.result()
                             if result:
-                                created_files.append(result)
-                                logger.debug(
-                                    f"Uploaded file: {result['name']} (ID: {result['id']})"
-                                )
+                                file, size = result
+                                created_files.append(file)
+                                total_bytes += size
                         except Exception as e:
                             logger.error(f"Upload failed for {file_path.name}: {e}")
                         finally:
                             pbar.update(1)
 
-            # Calculate total bytes
-            total_bytes = sum(int(f.get("size", 0)) for f in created_files)
-
+            self._clear_listing_caches()  # Listings changed
             logger.info(
                 f"Successfully uploaded folder: {len(created_folders)} folders, "
                 f"{len(created_files)} files, {total_bytes} bytes"
@@ -776,6 +1856,7 @@ class DriveClient:
                 "folder": root_folder,
                 "folders": created_folders,
                 "files": created_files,
+                "skipped_files": skipped_files,
                 "total_files": len(created_files),
                 "total_folders": len(created_folders),
                 "total_bytes": total_bytes,
@@ -792,22 +1873,39 @@ class DriveClient:
         name: str | None = None,
         mime_type: str | None = None,
         description: str | None = None,
+        chunk_size: int | None = None,
+        check_duplicate: bool = False,
+        fields: str | Iterable[str] | None = None,
     ) -> dict[str, Any]:
         """Upload a file to Google Drive.
 
+        Drive allows duplicate names, so by default the file is created without a
+        lookup. With check_duplicate=True the target folder's names are fetched once
+        and cached on the client, so a batch of uploads into the same folder costs a
+        single extra listing.
+
         Args:
             local_path: Path to the local file to upload
             folder_id: ID of the folder to upload to (None = My Drive root)
             name: Name for the file in Drive (None = use local filename)
             mime_type: MIME type of the file (None = auto-detect)
             description: Description for the file
+            chunk_size: Bytes per request for resumable uploads (None = client default,
+                64 MB). -1 streams the whole file in one request: best throughput, but a
+                failure restarts from zero. Smaller chunks survive interruptions better
+                at the cost of one HTTPS round-trip per chunk.
+            check_duplicate: Refuse to upload if the target folder already contains an
+                item with the same name (default: False)
+            fields: Fields to return for the uploaded file (None = id, name, mimeType,
+                size, times, links, parents, description)
 
         Returns:
             Dictionary with uploaded file metadata (id, name, mimeType, webViewLink, etc.)
 
         Raises:
             FileNotFoundError: If local_path does not exist
-            ValueError: If file with same name already exists in target folder
+            ValueError: If local_path is not a regular file, or check_duplicate is set
+                and a file with the same name exists
             Exception: If upload fails
 
         Examples:
@@ -824,15 +1922,16 @@ class DriveClient:
             ...     description="January 2025 report"
             ... )
         """
-        import mimetypes
-        import os
-
-        from googleapiclient.http import MediaFileUpload
-
-        # Validate local path exists
-        if not os.path.exists(local_path):
+        # Validate local path (one stat call for existence, type and size)
+        try:
+            st = os.stat(local_path)
+        except FileNotFoundError:
             logger.error(f"File not found: {local_path}")
-            raise FileNotFoundError(f"File not found: {local_path}")
+            raise FileNotFoundError(f"File not found: {local_path}") from None
+        if not stat.S_ISREG(st.st_mode):
+            logger.error(f"Not a regular file: {local_path}")
+            raise ValueError(f"Not a regular file: {local_path}")
+        file_size = st.st_size
 
         # Determine filename
         file_name = name if name else os.path.basename(local_path)
@@ -842,7 +1941,7 @@ class DriveClient:
 
         # Auto-detect MIME type if not provided
         if mime_type is None:
-            mime_type, _ = mimetypes.guess_type(local_path)
+            mime_type = _guess_mime(local_path)
             if mime_type is None:
                 mime_type = "application/octet-stream"
                 logger.debug(f"Could not detect MIME type, using: {mime_type}")
@@ -850,32 +1949,22 @@ class DriveClient:
                 logger.debug(f"Auto-detected MIME type: {mime_type}")
 
         # Check if file with same name already exists in target folder
-        escaped_name = file_name.replace("'", "\\'")
-        query_parts = [f"name='{escaped_name}'", "trashed=false"]
-        if folder_id:
-            query_parts.append(f"'{folder_id}' in parents")
-        else:
-            query_parts.append("'root' in parents")
-
-        check_query = " and ".join(query_parts)
-        logger.debug(f"Checking for existing file with query: {check_query}")
-
-        try:
-            existing_files = self.list_files(query=check_query, max_results=1)
-            if existing_files:
+        name_index: dict[str, str] | None = None
+        if check_duplicate:
+            try:
+                name_index = self._folder_name_index(folder_id or "root")
+            except Exception as e:
+                logger.warning(f"Could not check for existing files: {type(e).__name__}: {e}")
+            if name_index and file_name in name_index:
                 error_msg = (
                     f"File with name '{file_name}' already exists in "
                     f"{'folder ' + folder_id if folder_id else 'My Drive root'}. "
-                    f"Existing file ID: {existing_files[0]['id']}. "
+                    f"Existing file ID: {name_index[file_name]}. "
                     f"Use rename_file() to rename the existing file first, "
                     f"or choose a different name."
                 )
                 logger.error(error_msg)
                 raise ValueError(error_msg)
-        except ValueError:
-            raise  # Re-raise ValueError from duplicate check
-        except Exception as e:
-            logger.warning(f"Could not check for existing files: {type(e).__name__}: {e}")
 
         # Build file metadata
         file_metadata: dict[str, Any] = {"name": file_name}
@@ -885,21 +1974,27 @@ class DriveClient:
             file_metadata["description"] = description
 
         try:
-            # Create media upload
-            media = MediaFileUpload(local_path, mimetype=mime_type, resumable=True)
+            self._list_cache.clear()  # Listings may change (name index is updated below)
+            # Single-shot multipart for small files, resumable (chunked) for large ones
+            resumable = file_size >= self._resumable_threshold
 
             # Upload file
             logger.debug(f"Starting upload: {file_name} ({mime_type})")
-            file: dict[str, Any] = (
-                self.service.files()
-                .create(
-                    body=file_metadata,
-                    media_body=media,
-                    fields="id, name, mimeType, size, createdTime, modifiedTime, "
-                    "webViewLink, iconLink, parents, description",
+            with _open_media(
+                local_path, mime_type, resumable, chunk_size or self._upload_chunksize
+            ) as media:
+                file: dict[str, Any] = (
+                    self.service.files()
+                    .create(
+                        body=file_metadata,
+                        media_body=media,
+                        fields=_join_fields(fields, _CREATED_FILE_FIELDS),
+                    )
+                    .execute()
                 )
-                .execute()
-            )
+
+            if name_index is not None:
+                name_index[file["name"]] = file["id"]
 
             logger.info(
                 f"Successfully uploaded file: {file['name']} (ID: {file['id']}, "
@@ -911,12 +2006,16 @@ class DriveClient:
             logger.error(f"Failed to upload file {local_path}: {type(e).__name__}: {e}")
             raise
 
-    def rename_file(self, file_id: str, new_name: str) -> dict[str, Any]:
+    def rename_file(
+        self, file_id: str, new_name: str, fields: str | Iterable[str] | None = None
+    ) -> dict[str, Any]:
         """Rename a file in Google Drive.
 
         Args:
             file_id: The Drive file ID
             new_name: New name for the file
+            fields: Fields to return (None = id, name, mimeType, size, modifiedTime,
+                webViewLink, parents)
 
         Returns:
             Dictionary with updated file metadata
@@ -930,6 +2029,7 @@ class DriveClient:
             >>> print(f"Renamed to: {file['name']}")
         """
         logger.info(f"Renaming file {file_id} to '{new_name}'")
+        self._clear_listing_caches(file_id)  # Listings may change
 
         try:
             # Update file metadata
@@ -939,7 +2039,7 @@ class DriveClient:
                 .update(
                     fileId=file_id,
                     body=file_metadata,
-                    fields="id, name, mimeType, size, modifiedTime, webViewLink, parents",
+                    fields=_join_fields(fields, _UPDATED_FILE_FIELDS),
                 )
                 .execute()
             )
@@ -951,12 +2051,22 @@ class DriveClient:
             logger.error(f"Failed to rename file {file_id}: {type(e).__name__}: {e}")
             raise
 
-    def move_file(self, file_id: str, destination_folder_id: str) -> dict[str, Any]:
+    def move_file(
+        self,
+        file_id: str,
+        destination_folder_id: str,
+        fields: str | Iterable[str] | None = None,
+        source_folder_id: str | None = None,
+    ) -> dict[str, Any]:
         """Move a file to a different folder in Google Drive.
 
         Args:
             file_id: The Drive file ID
             destination_folder_id: ID of the destination folder
+            fields: Fields to return (None = id, name, mimeType, size, modifiedTime,
+                webViewLink, parents)
+            source_folder_id: Current parent folder, if known; skips the metadata
+                lookup otherwise needed to find the parents to remove
 
         Returns:
             Dictionary with updated file metadata
@@ -972,13 +2082,16 @@ class DriveClient:
         logger.info(f"Moving file {file_id} to folder {destination_folder_id}")
 
         try:
-            # Get current parents
-            file = self.service.files().get(fileId=file_id, fields="parents, name").execute()
-            previous_parents = ",".join(file.get("parents", []))
-            file_name = file.get("name", "unknown")
+            if source_folder_id:
+                previous_parents = source_folder_id
+            else:
+                # Get current parents (possibly cached)
+                file = self.get_file(file_id, fields="parents")
+                previous_parents = ",".join(file.get("parents", []))
+            self._clear_listing_caches(file_id)  # Listings may change
 
             logger.debug(
-                f"Moving file '{file_name}' from parents [{previous_parents}] "
+                f"Moving file {file_id} from parents [{previous_parents}] "
                 f"to [{destination_folder_id}]"
             )
 
@@ -989,14 +2102,14 @@ class DriveClient:
                     fileId=file_id,
                     addParents=destination_folder_id,
                     removeParents=previous_parents,
-                    fields="id, name, mimeType, size, modifiedTime, webViewLink, parents",
+                    fields=_join_fields(fields, _UPDATED_FILE_FIELDS),
                 )
                 .execute()
             )
 
             logger.info(
-                f"Successfully moved file '{file_name}' (ID: {file_id}) "
-                f"to folder {destination_folder_id}"
+                f"Successfully moved file '{updated_file.get('name', 'unknown')}' "
+                f"(ID: {file_id}) to folder {destination_folder_id}"
             )
             return updated_file
 
@@ -1024,6 +2137,7 @@ class DriveClient:
         """
         action = "Permanently deleting" if permanent else "Trashing"
         logger.info(f"{action} file {file_id}")
+        self._clear_listing_caches(file_id)  # Listings may change
 
         try:
             if permanent:
@@ -1039,3 +2153,152 @@ class DriveClient:
         except Exception as e:
             logger.error(f"Failed to delete file {file_id}: {type(e).__name__}: {e}")
             raise
+
+    def _run_batch(self, batch_requests: list[tuple[str, Any]], action: str) -> dict[str, Any]:
+        """Execute request objects as batch HTTP calls of up to _BATCH_LIMIT each.
+
+        Args:
+            batch_requests: (file ID, unexecuted API request) pairs; only the first
+                request per file ID is sent
+            action: Action name for logging (e.g. "rename")
+
+        Returns:
+            Dictionary with 'files' (responses) and 'failed' ({'id', 'error'}),
+            both in request order
+        """
+        # A batch rejects repeated request IDs, and across batches a repeat would
+        # overwrite the first response
+        unique: dict[str, Any] = {}
+        for file_id, request in batch_requests:
+            if file_id in unique:
+                logger.warning("Skipping duplicate %s request for file %s", action, file_id)
+            else:
+                unique[file_id] = request
+        batch_requests = list(unique.items())
+
+        responses: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+
+        def callback(request_id: str, response: Any, exception: Exception) -> None:
+            if exception is not None:
+                logger.error(f"Failed to {action} file {request_id}: {exception}")
+                errors[request_id] = str(exception)
+                return
+            responses[request_id] = response or {"id": request_id}
+
+        for start in range(0, len(batch_requests), _BATCH_LIMIT):
+            chunk = batch_requests[start : start + _BATCH_LIMIT]
+            batch = self.service.new_batch_http_request(callback=callback)
+            for file_id, request in chunk:
+                batch.add(request, request_id=file_id)
+            logger.debug(f"Executing {action} batch of {len(chunk)} requests")
+            batch.execute()
+
+        files = [responses[file_id] for file_id in unique if file_id in responses]
+        failed = [
+            {"id": file_id, "error": errors[file_id]} for file_id in unique if file_id in errors
+        ]
+        logger.info(f"Bulk {action}: {len(files)} succeeded, {len(failed)} failed")
+        return {"files": files, "failed": failed}
+
+    def rename_files(self, pairs: list[tuple[str, str]]) -> dict[str, Any]:
+        """Rename many files using batch HTTP requests.
+
+        Args:
+            pairs: (file ID, new name) pairs
+
+        Returns:
+            Dictionary with 'files' (updated metadata) and 'failed' ({'id', 'error'})
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> result = client.rename_files([("1abc", "a.pdf"), ("1def", "b.pdf")])
+            >>> print(f"Renamed {len(result['files'])} files")
+        """
+        logger.info(f"Renaming {len(pairs)} files")
+        self._clear_listing_caches(*(file_id for file_id, _ in pairs))  # Listings may change
+        batch_requests = [
+            (
+                file_id,
+                self.service.files().update(
+                    fileId=file_id,
+                    body={"name": new_name},
+                    fields=_UPDATED_FILE_FIELDS,
+                ),
+            )
+            for file_id, new_name in pairs
+        ]
+        return self._run_batch(batch_requests, "rename")
+
+    def move_files(self, pairs: list[tuple[str, str]]) -> dict[str, Any]:
+        """Move many files using batch HTTP requests.
+
+        Current parents are looked up with one batched metadata request per
+        _BATCH_LIMIT files, then the moves are sent as batches as well.
+
+        Args:
+            pairs: (file ID, destination folder ID) pairs
+
+        Returns:
+            Dictionary with 'files' (updated metadata) and 'failed' ({'id', 'error'})
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> result = client.move_files([("1abc", "1folder"), ("1def", "1folder")])
+            >>> print(f"Moved {len(result['files'])} files")
+        """
+        logger.info(f"Moving {len(pairs)} files")
+        metadata = self._batch_get_metadata([file_id for file_id, _ in pairs], fields="parents")
+        self._clear_listing_caches(*(file_id for file_id, _ in pairs))  # Listings may change
+
+        batch_requests: list[tuple[str, Any]] = []
+        missing: list[dict[str, Any]] = []
+        for file_id, destination_folder_id in pairs:
+            file = metadata.get(file_id)
+            if file is None:
+                missing.append({"id": file_id, "error": "File not found"})
+                continue
+            batch_requests.append(
+                (
+                    file_id,
+                    self.service.files().update(
+                        fileId=file_id,
+                        addParents=destination_folder_id,
+                        removeParents=",".join(file.get("parents", [])),
+                        fields=_UPDATED_FILE_FIELDS,
+                    ),
+                )
+            )
+
+        result = self._run_batch(batch_requests, "move")
+        result["failed"].extend(missing)
+        return result
+
+    def delete_files(self, file_ids: list[str], permanent: bool = False) -> dict[str, Any]:
+        """Delete (trash by default) many files using batch HTTP requests.
+
+        Args:
+            file_ids: Drive file IDs
+            permanent: If False (default), move to trash. If True, permanently delete.
+
+        Returns:
+            Dictionary with 'files' ({'id'} per deleted file) and 'failed' ({'id', 'error'})
+
+        Examples:
+            >>> client = DriveClient(credentials)
+            >>> result = client.delete_files(["1abc", "1def"])
+            >>> print(f"Trashed {len(result['files'])} files")
+        """
+        logger.info(f"{'Permanently deleting' if permanent else 'Trashing'} {len(file_ids)} files")
+        self._clear_listing_caches(*file_ids)  # Listings may change
+        files = self.service.files()
+        batch_requests = [
+            (
+                file_id,
+                files.delete(fileId=file_id)
+                if permanent
+                else files.update(fileId=file_id, body={"trashed": True}, fields="id"),
+            )
+            for file_id in file_ids
+        ]
+        return self._run_batch(batch_requests, "delete")
@@ -5,16 +5,178 @@ and has been reviewed and tested by a human.
 """
 
 import base64
+import binascii
+import copy
 import logging
-from email.mime.text import MIMEText
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
+from email.generator import BytesGenerator
+from email.message import EmailMessage
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from io import BytesIO, StringIO
 from typing import Any
 
+import google_auth_httplib2
 import html2text
+import httplib2
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build  # type: ignore[import-untyped]
+from googleapiclient.errors import HttpError
+
+from google_gmail_tool.core._discovery import build_service
+from google_gmail_tool.core._http_pool import shared_http
+from google_gmail_tool.core._json_model import FastJsonModel
 
 logger = logging.getLogger(__name__)
 
+# Requests per batch HTTP call (Gmail allows 100 but rate-limits batches above ~50)
+_BATCH_LIMIT = 50
+
+# Summary fetches only need these headers; format="metadata" skips the bodies
+_METADATA_GET: dict[str, Any] = {
+    "format": "metadata",
+    "metadataHeaders": ["Subject", "From", "To", "Date"],
+}
+
+# Parsed get_message_full results kept per client (messages are immutable)
+_MESSAGE_CACHE_SIZE = 512
+
+# Lowercased header names read from summary and full messages
+_SUMMARY_HEADERS = frozenset({"subject", "from", "to", "date"})
+_FULL_HEADERS = frozenset(
+    {"subject", "from", "to", "cc", "bcc", "date", "in-reply-to", "references"}
+)
+
+# Concurrent single GETs when a batch request fails as a whole
+_FALLBACK_CONCURRENCY = 10
+
+_FALLBACK_EXECUTOR: ThreadPoolExecutor | None = None
+_FALLBACK_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_fallback_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor for single GETs replacing a failed batch.
+
+    Created on first use and shared by all GmailClient instances, so worker
+    threads (and their per-thread services) survive across batches.
+
+    Returns:
+        Shared thread pool executor
+    """
+    global _FALLBACK_EXECUTOR
+    with _FALLBACK_EXECUTOR_LOCK:
+        if _FALLBACK_EXECUTOR is None:
+            _FALLBACK_EXECUTOR = ThreadPoolExecutor(
+                max_workers=_FALLBACK_CONCURRENCY, thread_name_prefix="gmail-fetch"
+            )
+        return _FALLBACK_EXECUTOR
+
+
+# base64url -> standard base64 alphabet
+_URL_SAFE_TRANS = bytes.maketrans(b"-_", b"+/")
+
+
+def _b64url_decode(data: str) -> bytes:
+    """Decode base64url data as returned by the Gmail API.
+
+    Translates to the standard alphabet and decodes with binascii directly,
+    restoring any stripped padding.
+
+    Args:
+        data: base64url-encoded string
+
+    Returns:
+        Decoded bytes
+
+    Raises:
+        binascii.Error: If the data is not valid base64
+    """
+    raw = data.encode("ascii").translate(_URL_SAFE_TRANS)
+    pad = -len(raw) % 4
+    if pad:
+        raw += b"=" * pad
+    return binascii.a2b_base64(raw)
+
+
+def _extract_headers(headers: list[dict[str, str]], wanted: frozenset[str]) -> dict[str, str]:
+    """Collect the wanted headers of a message payload.
+
+    Args:
+        headers: payload["headers"] list of {"name", "value"} dictionaries
+        wanted: Lowercased header names to keep
+
+    Returns:
+        Dictionary mapping lowercased header name to value (last one wins)
+    """
+    found: dict[str, str] = {}
+    for header in headers:
+        name = header["name"].lower()
+        if name in wanted:
+            found[name] = header["value"]
+    return found
+
+
+@lru_cache(maxsize=4096)
+def _parse_rfc2822(date_str: str) -> str:
+    """Parse an RFC 2822 date header to ISO format (memoized).
+
+    Messages in a thread or digest often share identical Date headers, so
+    results are cached as ISO strings.
+
+    Args:
+        date_str: Email date header value, e.g. "Mon, 15 Jan 2025 10:30:00 +0000"
+
+    Returns:
+        ISO formatted date string (the input unchanged if it cannot be parsed)
+    """
+    try:
+        return parsedate_to_datetime(date_str).isoformat()
+    except Exception as e:
+        logger.debug("Failed to parse date %r: %s", date_str, e)
+        return date_str
+
+
+def _write_text_part(part: dict[str, Any], out: StringIO, label: str) -> None:
+    """Decode a text/plain or text/html body part and append it to a writer.
+
+    Args:
+        part: MIME part from the message payload
+        out: Writer collecting this kind of body text
+        label: Part description for logging ("plain text" or "HTML")
+    """
+    data = part.get("body", {}).get("data")
+    if not data:
+        return
+    try:
+        decoded = _b64url_decode(data).decode("utf-8", errors="replace")
+    except Exception as e:
+        logger.warning("Failed to decode %s part: %s", label, e)
+        return
+    out.write(decoded)
+    logger.debug("Extracted %s: %d chars", label, len(decoded))
+
+
+def _html_to_markdown(html: str) -> str:
+    """Convert an HTML body to markdown.
+
+    A fresh HTML2Text is used per call: handle() leaves parser state behind
+    (e.g. pending newlines), so a reused instance changes the next conversion.
+    Construction is cheap (a few microseconds) compared to the conversion.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        Markdown text (links, images and emphasis kept, no line wrapping)
+    """
+    h = html2text.HTML2Text(bodywidth=0)
+    h.ignore_links = False
+    h.ignore_images = False
+    h.ignore_emphasis = False
+    return h.handle(html)
+
 
 class GmailClient:
     """Client for interacting with Gmail API."""
@@ -26,7 +188,12 @@ class GmailClient:
             credentials: OAuth2 credentials for Gmail API access
         """
         self.credentials = credentials
-        self.service = build("gmail", "v1", credentials=credentials)
+        self.service = build_service(
+            "gmail", "v1", http=shared_http(credentials), model=FastJsonModel()
+        )
+        self._new_batch = self.service.new_batch_http_request
+        self._local = threading.local()
+        self._message_cache: OrderedDict[tuple[str, bool], dict[str, Any]] = OrderedDict()
         logger.debug("Gmail API service initialized")
 
     def list_threads(
@@ -54,7 +221,7 @@ class GmailClient:
             >>> for thread in threads:
             ...     print(thread["subject"], thread["from"])
         """
-        logger.info(f"Listing threads: query={query}, max_results={max_results}")
+        logger.info("Listing threads: query=%s, max_results=%d", query, max_results)
 
         # Validate max_results
         if max_results > 500:
@@ -84,14 +251,8 @@ class GmailClient:
                 logger.info("No threads found matching query")
                 return []
 
-            # Fetch full thread details
-            threads = []
-            for i, thread_stub in enumerate(thread_list, 1):
-                thread_id = thread_stub["id"]
-                logger.debug(f"Fetching thread {i}/{len(thread_list)}: {thread_id}")
-
-                thread_data = self._get_thread(thread_id)
-                threads.append(thread_data)
+            # Fetch full thread details (batched)
+            threads = self._get_threads_batch([stub["id"] for stub in thread_list])
 
             logger.info(f"Successfully fetched {len(threads)} threads")
             return threads
@@ -121,7 +282,7 @@ class GmailClient:
         Raises:
             Exception: If Gmail API call fails
         """
-        logger.info(f"Listing messages: query={query}, max_results={max_results}")
+        logger.info("Listing messages: query=%s, max_results=%d", query, max_results)
 
         # Validate max_results
         if max_results > 500:
@@ -149,14 +310,8 @@ class GmailClient:
                 logger.info("No messages found matching query")
                 return []
 
-            # Fetch full message details
-            messages = []
-            for i, msg_stub in enumerate(message_list, 1):
-                msg_id = msg_stub["id"]
-                logger.debug(f"Fetching message {i}/{len(message_list)}: {msg_id}")
-
-                msg_data = self._get_message(msg_id)
-                messages.append(msg_data)
+            # Fetch full message details (batched)
+            messages = self._get_messages_batch([stub["id"] for stub in message_list])
 
             logger.info(f"Successfully fetched {len(messages)} messages")
             return messages
@@ -167,8 +322,125 @@ class GmailClient:
             logger.debug("Full traceback:", exc_info=True)
             raise
 
+    @staticmethod
+    def _collection(service: Any, kind: str) -> Any:
+        """Get the users().threads() or users().messages() collection of a service."""
+        users = service.users()
+        return users.threads() if kind == "thread" else users.messages()
+
+    def _thread_service(self) -> Any:
+        """Get a Gmail service bound to a transport owned by the calling thread.
+
+        httplib2 is not thread-safe, so worker threads must not share the
+        pooled transport used by self.service.
+
+        Returns:
+            Gmail API service for the current thread
+        """
+        service = getattr(self._local, "service", None)
+        if service is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            service = build_service("gmail", "v1", http=http, model=FastJsonModel())
+            self._local.service = service
+        return service
+
+    def _get_parallel(self, kind: str, ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch threads or messages with concurrent single GET requests.
+
+        Used as a fallback when a batch request fails as a whole. Requests run on
+        the shared fallback executor, at most _FALLBACK_CONCURRENCY at a time; its
+        worker threads are reused, and so are their per-thread services.
+
+        Args:
+            kind: "thread" or "message"
+            ids: Thread or message IDs
+
+        Returns:
+            Dictionary mapping ID to raw API response (failed fetches are omitted)
+        """
+
+        def fetch(item_id: str) -> dict[str, Any]:
+            collection = self._collection(self._thread_service(), kind)
+            response: dict[str, Any] = collection.get(
+                userId="me", id=item_id, **_METADATA_GET
+            ).execute()
+            return response
+
+        executor = _get_fallback_executor()
+        futures = [executor.submit(fetch, item_id) for item_id in ids]
+
+        results: dict[str, dict[str, Any]] = {}
+        for item_id, future in zip(ids, futures, strict=True):
+            try:
+                results[item_id] = future.result()
+            except Exception as e:
+                logger.error("Failed to fetch %s %s: %s", kind, item_id, e)
+        return results
+
+    def _batch_get(self, kind: str, ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch many threads or messages using batch HTTP requests.
+
+        If a batch request fails as a whole (e.g. batching is unavailable), its
+        IDs are fetched with concurrent single requests instead.
+
+        Args:
+            kind: "thread" or "message"
+            ids: Thread or message IDs
+
+        Returns:
+            Dictionary mapping ID to raw API response (failed fetches are omitted)
+        """
+        resource = self._collection(self.service, kind)
+        results: dict[str, dict[str, Any]] = {}
+
+        def callback(request_id: str, response: dict[str, Any], exception: Exception) -> None:
+            if exception is not None:
+                logger.error("Failed to fetch %s %s: %s", kind, request_id, exception)
+                return
+            results[request_id] = response
+
+        for start in range(0, len(ids), _BATCH_LIMIT):
+            chunk = ids[start : start + _BATCH_LIMIT]
+            batch = self._new_batch(callback=callback)
+            for item_id in chunk:
+                batch.add(
+                    resource.get(userId="me", id=item_id, **_METADATA_GET), request_id=item_id
+                )
+            logger.debug("Executing %s batch of %d requests", kind, len(chunk))
+            try:
+                batch.execute()
+            except HttpError as e:
+                logger.warning(f"Batch request failed ({e}), fetching {kind}s concurrently")
+                results.update(self._get_parallel(kind, chunk))
+
+        return results
+
+    def _get_threads_batch(self, thread_ids: list[str]) -> list[dict[str, Any]]:
+        """Get details for many threads with ceil(N / 50) HTTP calls.
+
+        Args:
+            thread_ids: Thread IDs to fetch
+
+        Returns:
+            Thread dictionaries in input order (failed fetches are omitted)
+        """
+        raw = self._batch_get("thread", thread_ids)
+        return [self._parse_thread(tid, raw[tid]) for tid in thread_ids if tid in raw]
+
+    def _get_messages_batch(self, message_ids: list[str]) -> list[dict[str, Any]]:
+        """Get details for many messages with ceil(N / 50) HTTP calls.
+
+        Args:
+            message_ids: Message IDs to fetch
+
+        Returns:
+            Message dictionaries in input order (failed fetches are omitted)
+        """
+        raw = self._batch_get("message", message_ids)
+        return [self._parse_message(mid, raw[mid]) for mid in message_ids if mid in raw]
+
     def _get_thread(self, thread_id: str) -> dict[str, Any]:
-        """Get full thread details.
+        """Get thread summary details (metadata and summary headers only).
 
         Args:
             thread_id: Thread ID to fetch
@@ -176,13 +448,26 @@ class GmailClient:
         Returns:
             Thread dictionary with parsed metadata
         """
-        logger.debug(f"Fetching thread details: {thread_id}")
-        thread = self.service.users().threads().get(userId="me", id=thread_id).execute()
+        logger.debug("Fetching thread details: %s", thread_id)
+        thread = (
+            self.service.users().threads().get(userId="me", id=thread_id, **_METADATA_GET).execute()
+        )
+        return self._parse_thread(thread_id, thread)
+
+    def _parse_thread(self, thread_id: str, thread: dict[str, Any]) -> dict[str, Any]:
+        """Parse a threads().get response into a thread dictionary.
+
+        Args:
+            thread_id: Thread ID
+            thread: Raw thread resource from the Gmail API
 
+        Returns:
+            Thread dictionary with parsed metadata
+        """
         # Parse thread metadata from first message
         messages = thread.get("messages", [])
         if not messages:
-            logger.warning(f"Thread {thread_id} has no messages")
+            logger.warning("Thread %s has no messages", thread_id)
             return {
                 "id": thread_id,
                 "type": "thread",
@@ -196,7 +481,7 @@ class GmailClient:
             }
 
         first_msg = messages[0]
-        headers = {h["name"].lower(): h["value"] for h in first_msg["payload"]["headers"]}
+        headers = _extract_headers(first_msg["payload"]["headers"], _SUMMARY_HEADERS)
 
         # Extract metadata
         subject = headers.get("subject", "(No Subject)")
@@ -208,9 +493,10 @@ class GmailClient:
         date_iso = self._parse_date(date_str) if date_str else ""
 
         # Collect all message IDs
+        message_count = len(messages)
         message_ids = [msg["id"] for msg in messages]
 
-        logger.debug(f"Thread {thread_id}: subject='{subject}', messages={len(messages)}")
+        logger.debug("Thread %s: subject=%r, messages=%d", thread_id, subject, message_count)
 
         return {
             "id": thread_id,
@@ -220,12 +506,12 @@ class GmailClient:
             "date": date_iso,
             "snippet": thread.get("snippet", ""),
             "labels": labels,
-            "message_count": len(messages),
+            "message_count": message_count,
             "message_ids": message_ids,
         }
 
     def _get_message(self, message_id: str) -> dict[str, Any]:
-        """Get full message details.
+        """Get message summary details (metadata and summary headers only).
 
         Args:
             message_id: Message ID to fetch
@@ -233,11 +519,27 @@ class GmailClient:
         Returns:
             Message dictionary with parsed metadata
         """
-        logger.debug(f"Fetching message details: {message_id}")
-        message = self.service.users().messages().get(userId="me", id=message_id).execute()
+        logger.debug("Fetching message details: %s", message_id)
+        message = (
+            self.service.users()
+            .messages()
+            .get(userId="me", id=message_id, **_METADATA_GET)
+            .execute()
+        )
+        return self._parse_message(message_id, message)
+
+    def _parse_message(self, message_id: str, message: dict[str, Any]) -> dict[str, Any]:
+        """Parse a messages().get response into a message dictionary.
 
+        Args:
+            message_id: Message ID
+            message: Raw message resource from the Gmail API
+
+        Returns:
+            Message dictionary with parsed metadata
+        """
         # Parse headers
-        headers = {h["name"].lower(): h["value"] for h in message["payload"]["headers"]}
+        headers = _extract_headers(message["payload"]["headers"], _SUMMARY_HEADERS)
 
         # Extract metadata
         subject = headers.get("subject", "(No Subject)")
@@ -252,7 +554,7 @@ class GmailClient:
         # Get thread ID
         thread_id = message.get("threadId", "")
 
-        logger.debug(f"Message {message_id}: subject='{subject}'")
+        logger.debug("Message %s: subject=%r", message_id, subject)
 
         return {
             "id": message_id,
@@ -276,16 +578,7 @@ class GmailClient:
         Returns:
             ISO formatted date string (YYYY-MM-DDTHH:MM:SSZ)
         """
-        try:
-            # Email dates are in RFC 2822 format
-            # Example: "Mon, 15 Jan 2025 10:30:00 +0000"
-            from email.utils import parsedate_to_datetime
-
-            dt = parsedate_to_datetime(date_str)
-            return dt.isoformat()
-        except Exception as e:
-            logger.debug(f"Failed to parse date '{date_str}': {e}")
-            return date_str
+        return _parse_rfc2822(date_str)
 
     def send_email(
         self,
@@ -328,10 +621,8 @@ class GmailClient:
 
         try:
             # Create MIME message
-            if html:
-                message = MIMEText(body, "html")
-            else:
-                message = MIMEText(body, "plain")
+            message = EmailMessage()
+            message.set_content(body, subtype="html" if html else "plain")
 
             message["To"] = to
             message["Subject"] = subject
@@ -348,8 +639,10 @@ class GmailClient:
                 message["Bcc"] = bcc
                 logger.debug(f"Bcc: {bcc}")
 
-            # Encode message to base64url format
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+            # Serialize with CRLF line endings (SMTP policy) and encode to base64url
+            buffer = BytesIO()
+            BytesGenerator(buffer, policy=policy.SMTP, mangle_from_=False).flatten(message)
+            raw_message = base64.urlsafe_b64encode(buffer.getvalue()).decode("ascii")
 
             # Send via Gmail API
             logger.debug("Calling Gmail API: messages().send()")
@@ -381,11 +674,13 @@ class GmailClient:
             logger.debug("Full traceback:", exc_info=True)
             raise
 
-    def get_message_full(self, message_id: str) -> dict[str, Any]:
+    def get_message_full(self, message_id: str, prefer_html: bool = False) -> dict[str, Any]:
         """Get full message details including body and attachments.
 
         Args:
             message_id: Message ID to fetch
+            prefer_html: If True, derive body_markdown from the HTML part even when
+                a plain text part exists (default: use plain text when available)
 
         Returns:
             Dictionary with complete message data including:
@@ -395,47 +690,52 @@ class GmailClient:
 
         Raises:
             Exception: If Gmail API call fails
+
+        Note:
+            Results are cached per client (LRU, 512 entries) and returned as deep
+            copies. Message content is immutable, but labels may change; call
+            invalidate() to refetch.
         """
-        logger.debug(f"Fetching full message: {message_id}")
+        cache_key = (message_id, prefer_html)
+        cached = self._message_cache.get(cache_key)
+        if cached is not None:
+            self._message_cache.move_to_end(cache_key)
+            logger.debug("Message cache hit: %s", message_id)
+            return copy.deepcopy(cached)
+
+        logger.debug("Fetching full message: %s", message_id)
         message = (
             self.service.users().messages().get(userId="me", id=message_id, format="full").execute()
         )
 
         # Parse headers
-        headers = {h["name"].lower(): h["value"] for h in message["payload"]["headers"]}
+        headers = _extract_headers(message["payload"]["headers"], _FULL_HEADERS)
 
         # Extract body parts
-        body_plain = ""
-        body_html = ""
         attachments: list[dict[str, Any]] = []
+        body_plain_io = StringIO()
+        body_html_io = StringIO()
+        self._extract_message_parts(message["payload"], body_plain_io, body_html_io, attachments)
 
-        body_plain_list: list[str] = []
-        body_html_list: list[str] = []
-        self._extract_message_parts(
-            message["payload"], body_plain_list, body_html_list, attachments
-        )
-
-        body_plain = "".join(body_plain_list)
-        body_html = "".join(body_html_list)
+        body_plain = body_plain_io.getvalue()
+        body_html = body_html_io.getvalue()
 
-        # Convert HTML to markdown if no plain text available
+        # Use the plain text part as markdown; convert HTML only when needed
         body_markdown = ""
-        if body_html:
-            h = html2text.HTML2Text()
-            h.ignore_links = False
-            h.ignore_images = False
-            h.ignore_emphasis = False
-            h.body_width = 0  # Don't wrap text
-            body_markdown = h.handle(body_html)
+        if body_html and (prefer_html or not body_plain):
+            body_markdown = _html_to_markdown(body_html)
         elif body_plain:
             body_markdown = body_plain
 
         logger.debug(
-            f"Message {message_id}: body_plain={len(body_plain)} chars, "
-            f"body_html={len(body_html)} chars, attachments={len(attachments)}"
+            "Message %s: body_plain=%d chars, body_html=%d chars, attachments=%d",
+            message_id,
+            len(body_plain),
+            len(body_html),
+            len(attachments),
         )
 
-        return {
+        result = {
             "id": message_id,
             "thread_id": message.get("threadId", ""),
             "subject": headers.get("subject", "(No Subject)"),
@@ -456,68 +756,95 @@ class GmailClient:
             "size_estimate": message.get("sizeEstimate", 0),
         }
 
+        self._message_cache[cache_key] = result
+        if len(self._message_cache) > _MESSAGE_CACHE_SIZE:
+            self._message_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def invalidate(self, message_id: str | None = None) -> None:
+        """Drop cached get_message_full results.
+
+        Args:
+            message_id: Message to drop (None drops all cached messages)
+        """
+        if message_id is None:
+            self._message_cache.clear()
+            return
+        for prefer_html in (False, True):
+            self._message_cache.pop((message_id, prefer_html), None)
+
     def _extract_message_parts(
         self,
         payload: dict[str, Any],
-        body_plain_list: list[str],
-        body_html_list: list[str],
+        body_plain_io: StringIO,
+        body_html_io: StringIO,
         attachments: list[dict[str, Any]],
     ) -> None:
-        """Recursively extract body parts and attachments from message payload.
+        """Extract body parts and attachments from message payload.
+
+        Walks the MIME tree depth-first with an explicit stack, visiting parts
+        in document order.
 
         Args:
             payload: Message payload from Gmail API
-            body_plain_list: Accumulator for plain text body parts
-            body_html_list: Accumulator for HTML body parts
+            body_plain_io: Writer collecting plain text body parts
+            body_html_io: Writer collecting HTML body parts
             attachments: Accumulator for attachment metadata
         """
-        mime_type = payload.get("mimeType", "")
-        filename = payload.get("filename", "")
-
-        # Handle attachments
-        if filename:
-            body = payload.get("body", {})
-            attachment_id = body.get("attachmentId")
-            size = body.get("size", 0)
-
-            attachments.append(
-                {
-                    "filename": filename,
-                    "mime_type": mime_type,
-                    "size": size,
-                    "attachment_id": attachment_id,
-                }
-            )
-            logger.debug(f"Found attachment: {filename} ({mime_type}, {size} bytes)")
-            return
-
-        # Extract body content
-        if mime_type == "text/plain":
-            body = payload.get("body", {})
-            data = body.get("data")
-            if data:
-                try:
-                    decoded = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-                    body_plain_list.append(decoded)
-                    logger.debug(f"Extracted plain text: {len(decoded)} chars")
-                except Exception as e:
-                    logger.warning(f"Failed to decode plain text part: {e}")
-
-        elif mime_type == "text/html":
-            body = payload.get("body", {})
-            data = body.get("data")
-            if data:
-                try:
-                    decoded = base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-                    body_html_list.append(decoded)
-                    logger.debug(f"Extracted HTML: {len(decoded)} chars")
-                except Exception as e:
-                    logger.warning(f"Failed to decode HTML part: {e}")
-
-        # Recurse into multipart messages
-        parts = payload.get("parts", [])
-        for part in parts:
-            self._extract_message_parts(part, body_plain_list, body_html_list, attachments)
+        # Fast path: the common multipart/alternative of exactly [text/plain, text/html]
+        parts = payload.get("parts")
+        if (
+            parts
+            and len(parts) == 2
+            and payload.get("mimeType") == "multipart/alternative"
+            and not payload.get("filename")
+        ):
+            plain, html = parts
+            if (
+                plain.get("mimeType") == "text/plain"
+                and html.get("mimeType") == "text/html"
+                and not plain.get("filename")
+                and not html.get("filename")
+                and not plain.get("parts")
+                and not html.get("parts")
+            ):
+                _write_text_part(plain, body_plain_io, "plain text")
+                _write_text_part(html, body_html_io, "HTML")
+                return
+
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            mime_type = part.get("mimeType", "")
+            filename = part.get("filename", "")
+
+            # Handle attachments
+            if filename:
+                body = part.get("body", {})
+                attachment_id = body.get("attachmentId")
+                size = body.get("size", 0)
+
+                attachments.append(
+                    {
+                        "filename": filename,
+                        "mime_type": mime_type,
+                        "size": size,
+                        "attachment_id": attachment_id,
+                    }
+                )
+                logger.debug("Found attachment: %s (%s, %s bytes)", filename, mime_type, size)
+                continue
+
+            # Extract body content
+            if mime_type == "text/plain":
+                _write_text_part(part, body_plain_io, "plain text")
+            elif mime_type == "text/html":
+                _write_text_part(part, body_html_io, "HTML")
+
+            # Descend into multipart children (reversed so they pop in order)
+            children = part.get("parts")
+            if children:
+                stack.extend(reversed(children))
 
     def download_attachment(self, message_id: str, attachment_id: str) -> bytes:
         """Download an email attachment.
@@ -548,7 +875,7 @@ class GmailClient:
                 raise ValueError(f"No data in attachment {attachment_id}")
 
             # Decode from base64url
-            file_data = base64.urlsafe_b64decode(data)
+            file_data = _b64url_decode(data)
             logger.debug(f"Downloaded {len(file_data)} bytes")
 
             return file_data
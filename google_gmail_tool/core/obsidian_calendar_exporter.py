@@ -5,13 +5,20 @@ and has been reviewed and tested by a human.
 """
 
 import logging
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# "## Calendar" section (header up to the next level-2 heading or end of file),
+# and checklist items
+_CAL_SECTION_RE = re.compile(r"^## Calendar\s*$.*?(?=^## |\Z)", re.MULTILINE | re.DOTALL)
+_CHECK_RE = re.compile(r"^[ \t]*- \[([ x])\] (.+)$", re.MULTILINE)
+
 
 class ObsidianCalendarExporter:
     """Export calendar events to Obsidian daily notes with smart merge."""
@@ -46,14 +53,76 @@ class ObsidianCalendarExporter:
         """
         logger.info(f"Exporting {len(events)} events to daily note: {target_date.date()}")
 
-        # Build daily note path: daily/YYYY/YYYY-MM/YYYY-MM-DD.md
-        year = target_date.strftime("%Y")
-        year_month = target_date.strftime("%Y-%m")
-        date_str = target_date.strftime("%Y-%m-%d")
-
-        note_dir = self.daily_root / year / year_month
+        note_dir = self._note_dir(target_date)
         note_dir.mkdir(parents=True, exist_ok=True)
 
+        return self._write_daily_note(note_dir, events, target_date)
+
+    def export_events_to_daily_batch(
+        self,
+        events_by_date: dict[date, list[dict[str, Any]]],
+        max_workers: int = 8,
+    ) -> list[Path]:
+        """Export calendar events to several daily notes with smart merge.
+
+        Each month folder is created once, then the notes are merged and
+        written concurrently (file I/O releases the GIL).
+
+        Args:
+            events_by_date: Event dictionaries from Calendar API, keyed by calendar
+                day (one note, and one writer thread, per key)
+            max_workers: Maximum number of notes processed concurrently
+
+        Returns:
+            Paths to the created/updated daily note files, in input order
+
+        Raises:
+            Exception: If export fails
+        """
+        logger.info(f"Exporting events to {len(events_by_date)} daily notes")
+
+        note_dirs = {target_date: self._note_dir(target_date) for target_date in events_by_date}
+        for note_dir in set(note_dirs.values()):
+            note_dir.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda target_date: self._write_daily_note(
+                        note_dirs[target_date], events_by_date[target_date], target_date
+                    ),
+                    events_by_date,
+                )
+            )
+
+    def _note_dir(self, target_date: date) -> Path:
+        """Get the folder of a daily note: daily/YYYY/YYYY-MM.
+
+        Args:
+            target_date: Date of the daily note
+
+        Returns:
+            Folder path (not created)
+        """
+        return self.daily_root / target_date.strftime("%Y") / target_date.strftime("%Y-%m")
+
+    def _write_daily_note(
+        self,
+        note_dir: Path,
+        events: list[dict[str, Any]],
+        target_date: date,
+    ) -> Path:
+        """Merge events into the daily note in an existing folder and write it.
+
+        Args:
+            note_dir: Existing folder of the daily note
+            events: List of event dictionaries from Calendar API
+            target_date: Date for the daily note
+
+        Returns:
+            Path to the created/updated daily note file
+        """
+        date_str = target_date.strftime("%Y-%m-%d")
         note_file = note_dir / f"{date_str}.md"
         logger.debug(f"Daily note path: {note_file}")
 
@@ -79,10 +148,17 @@ class ObsidianCalendarExporter:
         else:
             # Create new daily note with frontmatter
             frontmatter = self._build_frontmatter(target_date)
-            full_content = f"{frontmatter}\n\n# {date_str}\n\n{new_calendar_section}"
+            full_content = f"{frontmatter}\n\n# {date_str}\n\n{new_calendar_section}\n"
 
-        # Write note
-        note_file.write_text(full_content, encoding="utf-8")
+        # Skip the write (and mtime bump / sync churn) when nothing changed
+        if full_content == existing_content:
+            logger.info(f"Daily note unchanged: {note_file}")
+            return note_file
+
+        # Write note atomically: a crash mid-write never leaves a truncated note
+        tmp_file = note_file.with_suffix(".md.tmp")
+        tmp_file.write_bytes(full_content.encode("utf-8"))
+        os.replace(tmp_file, note_file)
         logger.info(f"Exported to: {note_file}")
 
         return note_file
@@ -96,21 +172,8 @@ class ObsidianCalendarExporter:
         Returns:
             Calendar section content (including ## Calendar header) or empty string
         """
-        # Find ## Calendar section
-        match = re.search(r"^## Calendar\s*$", content, re.MULTILINE)
-        if not match:
-            return ""
-
-        start = match.start()
-
-        # Find next ## heading or end of file
-        next_match = re.search(r"^## ", content[match.end() :], re.MULTILINE)
-        if next_match:
-            end = match.end() + next_match.start()
-        else:
-            end = len(content)
-
-        return content[start:end].strip()
+        match = _CAL_SECTION_RE.search(content)
+        return match.group(0).strip() if match else ""
 
     def _parse_checked_items(self, calendar_section: str) -> dict[str, bool]:
         """Parse checked items from calendar section.
@@ -122,22 +185,12 @@ class ObsidianCalendarExporter:
             Dict mapping event signature (time + title) to checked status
             Example: {"09:00-10:00 Team Standup": True}
         """
-        checked_items = {}
-
-        # Match checklist items: - [ ] or - [x]
-        pattern = r"^- \[([ x])\] (.+)$"
-
-        for line in calendar_section.split("\n"):
-            match = re.match(pattern, line.strip())
-            if match:
-                is_checked = match.group(1) == "x"
-                item_text = match.group(2).strip()
-
-                # Extract time and title (before @ if location present)
-                signature = item_text.split(" @ ")[0].strip()
-                checked_items[signature] = is_checked
-
-        return checked_items
+        # Match checklist items (- [ ] or - [x]) in one pass; the signature is the
+        # time and title, before " @ " if a location is present
+        return {
+            match.group(2).strip().split(" @ ")[0].strip(): match.group(1) == "x"
+            for match in _CHECK_RE.finditer(calendar_section)
+        }
 
     def _build_calendar_section(
         self,
@@ -160,11 +213,8 @@ class ObsidianCalendarExporter:
             return "\n".join(lines)
 
         for event in events:
-            # Format event as checklist item
-            item_text = self._format_event_checklist(event)
-
-            # Extract signature (time + title)
-            signature = item_text.split(" @ ")[0].strip()
+            # Format event as checklist item, with its signature (time + title)
+            signature, item_text = self._format_event_checklist(event)
 
             # Check if this event was previously checked
             if checked_items.get(signature, False):
@@ -177,15 +227,15 @@ class ObsidianCalendarExporter:
 
         return "\n".join(lines)
 
-    def _format_event_checklist(self, event: dict[str, Any]) -> str:
+    def _format_event_checklist(self, event: dict[str, Any]) -> tuple[str, str]:
         """Format single event as checklist item text.
 
         Args:
             event: Event dictionary
 
         Returns:
-            Checklist item text (without - [ ] prefix)
-            Example: "09:00-10:00 Team Standup @ Zoom"
+            Tuple of (signature, checklist item text without - [ ] prefix)
+            Example: ("09:00-10:00 Team Standup", "09:00-10:00 Team Standup @ Zoom")
         """
         summary = event.get("summary", "(No title)")
 
@@ -200,12 +250,15 @@ class ObsidianCalendarExporter:
             end_time = end[11:16] if len(end) > 16 else end
             item = f"{start_time}-{end_time} {summary}"
 
+        # Signature as _parse_checked_items reads it back: text before the first " @ "
+        signature = item.partition(" @ ")[0].strip()
+
         # Add location if present
         location = event.get("location")
         if location:
             item = f"{item} @ {location}"
 
-        return item
+        return signature, item
 
     def _replace_calendar_section(self, content: str, new_calendar_section: str) -> str:
         """Replace ## Calendar section in existing content.
@@ -217,36 +270,32 @@ class ObsidianCalendarExporter:
         Returns:
             Updated note content
         """
-        # Find ## Calendar section
-        match = re.search(r"^## Calendar\s*$", content, re.MULTILINE)
-
-        if not match:
-            # No calendar section exists, append it
-            logger.debug("No existing calendar section, appending")
-            return content.rstrip() + "\n\n" + new_calendar_section + "\n"
-
-        start = match.start()
-
-        # Find next ## heading or end of file
-        next_match = re.search(r"^## ", content[match.end() :], re.MULTILINE)
-        if next_match:
-            end = match.end() + next_match.start()
-            # Replace section, preserve content after
-            return content[:start] + new_calendar_section + "\n\n" + content[end:]
-        else:
-            # Calendar section is last section
-            return content[:start] + new_calendar_section + "\n"
+        content_len = len(content)
+
+        def replacement(match: re.Match[str]) -> str:
+            # Keep a blank line before a following section; end the file otherwise
+            return new_calendar_section + ("\n\n" if match.end() < content_len else "\n")
+
+        # Replace the section in a single pass (a function, so that backslashes
+        # in event titles are not treated as group references)
+        new_content, count = _CAL_SECTION_RE.subn(replacement, content, count=1)
+        if count:
+            return new_content
+
+        # No calendar section exists, append it
+        logger.debug("No existing calendar section, appending")
+        return content.rstrip() + "\n\n" + new_calendar_section + "\n"
 
-    def _build_frontmatter(self, date: datetime) -> str:
+    def _build_frontmatter(self, note_date: date) -> str:
         """Build YAML frontmatter for new daily note.
 
         Args:
-            date: Date for the note
+            note_date: Date for the note
 
         Returns:
             Frontmatter as YAML string
         """
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = note_date.strftime("%Y-%m-%d")
 
         lines = [
             "---",
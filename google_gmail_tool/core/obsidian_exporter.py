@@ -5,14 +5,57 @@ and has been reviewed and tested by a human.
 """
 
 import logging
+import mmap
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from dateutil import parser as dateutil_parser
 from slugify import slugify
 
 logger = logging.getLogger(__name__)
 
+# Gmail system labels not turned into note tags
+_GMAIL_TAG_BLACKLIST = frozenset(
+    {"unread", "inbox", "sent", "category-promotions", "category-updates"}
+)
+
+# Attachment files written concurrently per thread export
+_ATTACHMENT_WRITE_WORKERS = 8
+
+# Address inside "Name <email>"
+_EMAIL_RE = re.compile(r"<(.+?)>")
+
+# Message IDs in frontmatter ("message_id: x") or message headers
+# ("**Message ID:** `x`", as written by _format_message); matched on raw note bytes
+_ANY_MSG_ID_RE = re.compile(rb"message_id:\s*(\S+)|Message ID:\**\s*`(\S+)`")
+
+# Whitespace between the frontmatter and the body of an existing note: the UTF-8
+# encodings of every character str.isspace() accepts (all below U+3001), so the
+# byte-level match strips exactly what str.lstrip() would
+_LEADING_WS_RE = re.compile(
+    b"(?:"
+    + b"|".join(re.escape(chr(c).encode()) for c in range(0x3001) if chr(c).isspace())
+    + b")*"
+)
+
+
+@lru_cache(maxsize=4096)
+def _cached_slugify(text: str) -> str:
+    """Slugify text (memoized; senders and subjects recur across exports).
+
+    Args:
+        text: Text to slugify
+
+    Returns:
+        URL/filename-safe slug
+    """
+    return slugify(text)
+
 
 class ObsidianExporter:
     """Export Gmail messages to Obsidian markdown notes."""
@@ -70,7 +113,7 @@ class ObsidianExporter:
         sender = self._extract_email_address(first_msg["from"])
         subject = first_msg["subject"]
 
-        folder_name = f"{timestamp}-{slugify(sender)}-{slugify(subject)}"
+        folder_name = f"{timestamp}-{_cached_slugify(sender)}-{_cached_slugify(subject)}"
         thread_folder = self.emails_root / folder_name
 
         logger.info(f"Exporting thread {thread_id} to {thread_folder}")
@@ -83,67 +126,98 @@ class ObsidianExporter:
         note_file = thread_folder / f"{folder_name}.md"
 
         # Check if note exists (append mode)
-        existing_content = ""
-        existing_message_ids = set()
-        if note_file.exists():
+        note_exists = note_file.exists()
+        existing_message_ids: set[str] = set()
+        if note_exists:
             logger.info(f"Note exists, loading for append: {note_file}")
-            existing_content = note_file.read_text(encoding="utf-8")
-            existing_message_ids = self._extract_message_ids_from_note(existing_content)
+            existing_message_ids = self._read_message_ids(note_file)
             logger.debug(f"Found {len(existing_message_ids)} existing messages in note")
 
-        # Download attachments and save to folder
-        all_attachments = []
-        for msg in messages:
-            msg_id = msg["id"]
-            if msg_id in existing_message_ids:
-                logger.debug(f"Skipping existing message: {msg_id}")
+        # New messages with their 1-based position in the thread
+        new_messages = [
+            (i, msg) for i, msg in enumerate(messages, 1) if msg["id"] not in existing_message_ids
+        ]
+        if note_exists and not new_messages:
+            logger.info("No new messages to add to existing note")
+            return note_file
+
+        # Collect downloaded attachments of new messages
+        # One write per path: threads often repeat a filename (image001.png), and
+        # the last message's data wins, as with writing the messages in order
+        attachment_writes: dict[Path, bytes] = {}
+        for _, msg in new_messages:
+            msg_attachments = attachments_data.get(msg["id"])
+            if not msg_attachments:
                 continue
 
-            for attachment in msg.get("attachments", []):
+            for attachment in msg.get("attachments", ()):
                 filename = attachment["filename"]
-                attachment_id = attachment.get("attachment_id")
-
-                if attachment_id and msg_id in attachments_data:
-                    if filename in attachments_data[msg_id]:
-                        # Save attachment to thread folder
-                        attachment_path = thread_folder / filename
-                        attachment_path.write_bytes(attachments_data[msg_id][filename])
-                        logger.info(f"Saved attachment: {filename}")
-                        all_attachments.append(attachment)
-
-        # Build frontmatter (only update if new note or new messages added)
-        if not existing_content or len(existing_message_ids) < len(messages):
-            frontmatter = self._build_frontmatter(messages, all_attachments)
-
-            # Build message content (only new messages)
-            messages_content = []
-            for i, msg in enumerate(messages, 1):
-                if msg["id"] not in existing_message_ids:
-                    messages_content.append(self._format_message(msg, i, len(messages)))
-
-            # Combine: frontmatter + existing content + new messages
-            if existing_content:
-                # Strip old frontmatter
-                content_without_frontmatter = self._strip_frontmatter(existing_content)
-                full_content = (
-                    frontmatter
-                    + "\n\n"
-                    + content_without_frontmatter
-                    + "\n\n"
-                    + "\n\n---\n\n".join(messages_content)
-                )
-            else:
-                # New note
-                full_content = frontmatter + "\n\n" + "\n\n---\n\n".join(messages_content)
-
-            # Write note
-            note_file.write_text(full_content, encoding="utf-8")
-            logger.info(f"Wrote note: {note_file}")
-        else:
-            logger.info("No new messages to add to existing note")
+                data = msg_attachments.get(filename)
+                if attachment.get("attachment_id") and data is not None:
+                    attachment_writes[thread_folder / filename] = data
+
+        # Save attachments to thread folder (concurrently; file I/O releases the GIL)
+        if attachment_writes:
+            workers = min(_ATTACHMENT_WRITE_WORKERS, len(attachment_writes))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for attachment_path in executor.map(
+                    self._write_attachment, attachment_writes.items()
+                ):
+                    logger.info(f"Saved attachment: {attachment_path.name}")
+
+        # Frontmatter lists the saved attachments of every message in the thread,
+        # including those of earlier exports (their files are already in the folder)
+        saved_names = {path.name for path in attachment_writes}
+        if note_exists:
+            saved_names.update(os.listdir(thread_folder))
+        all_attachments = [
+            attachment
+            for msg in messages
+            for attachment in msg.get("attachments", ())
+            if attachment.get("attachment_id") and attachment["filename"] in saved_names
+        ]
+
+        # Build frontmatter (new note or new messages added)
+        frontmatter = self._build_frontmatter(messages, all_attachments)
+
+        # Build message content (only new messages)
+        total = len(messages)
+        messages_content = [self._format_message(msg, i, total) for i, msg in new_messages]
+
+        # Combine: frontmatter + existing content (old frontmatter stripped) + new messages.
+        # The existing body is copied as raw bytes, never decoded and re-encoded.
+        # Write note atomically: a crash mid-write never leaves a truncated note
+        tmp_file = note_file.with_suffix(".md.tmp")
+        with tmp_file.open("wb") as out:
+            out.write(f"{frontmatter}\n\n".encode())
+            if note_exists:
+                self._copy_note_body(note_file, out)
+            out.write("\n\n---\n\n".join(messages_content).encode("utf-8"))
+        os.replace(tmp_file, note_file)
+        logger.info(f"Wrote note: {note_file}")
 
         return note_file
 
+    def _write_attachment(self, write: tuple[Path, bytes]) -> Path:
+        """Write one attachment file.
+
+        Args:
+            write: Tuple of (destination path, file content)
+
+        Returns:
+            Destination path
+        """
+        attachment_path, data = write
+        # Raw fd write: no buffered file object, no fsync (the kernel flushes)
+        fd = os.open(attachment_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        return attachment_path
+
     def _extract_email_address(self, from_field: str) -> str:
         """Extract email address from 'From' field.
 
@@ -153,45 +227,72 @@ class ObsidianExporter:
         Returns:
             Email address part only
         """
-        import re
-
-        match = re.search(r"<(.+?)>", from_field)
+        match = _EMAIL_RE.search(from_field)
         if match:
             return match.group(1)
         return from_field.split()[0] if from_field else "unknown"
 
-    def _extract_message_ids_from_note(self, content: str) -> set[str]:
-        """Extract message IDs from existing note content.
+    def _read_message_ids(self, note_file: Path) -> set[str]:
+        """Read message IDs from an existing note file.
+
+        The file is memory-mapped and scanned as bytes, so no decoded copy of
+        the whole note is made just to find its message IDs.
 
         Args:
-            content: Existing note content
+            note_file: Existing note file
 
         Returns:
             Set of message IDs found in the note
         """
-        import re
+        with note_file.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return set()  # Empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self._extract_message_ids_from_note(content)
 
-        # Look for message_id in frontmatter and message sections
-        ids = set(re.findall(r"message_id:\s*(\S+)", content))
-        ids.update(re.findall(r"Message ID:\s*`(\S+)`", content))
-        return ids
-
-    def _strip_frontmatter(self, content: str) -> str:
-        """Remove frontmatter from existing content.
+    def _extract_message_ids_from_note(self, content: bytes | mmap.mmap) -> set[str]:
+        """Extract message IDs from existing note content.
 
         Args:
-            content: Note content with frontmatter
+            content: Existing note content as UTF-8 bytes (or a memory map of the note)
 
         Returns:
-            Content without frontmatter
+            Set of message IDs found in the note
         """
-        lines = content.split("\n")
-        if lines and lines[0] == "---":
-            # Find end of frontmatter
-            for i, line in enumerate(lines[1:], 1):
-                if line == "---":
-                    return "\n".join(lines[i + 1 :]).lstrip()
-        return content
+        # Look for message_id in frontmatter and message sections in one scan;
+        # only the matched IDs are decoded
+        return {
+            (match.group(1) or match.group(2)).decode("utf-8")
+            for match in _ANY_MSG_ID_RE.finditer(content)
+        }
+
+    def _copy_note_body(self, note_file: Path, out: BinaryIO) -> None:
+        """Copy an existing note without its frontmatter, followed by a blank line.
+
+        The closing "---" line of the frontmatter is found on a memory map of
+        the note, whitespace after it is skipped (as str.lstrip() would), and
+        the body is streamed to out.
+
+        Args:
+            note_file: Existing note file
+            out: Destination file opened for binary writing
+        """
+        with note_file.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return  # Empty files cannot be mapped (and have no body)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                body_start = 0
+                if content[:4] == b"---\n":
+                    end = content.find(b"\n---\n", 3)
+                    if end != -1:
+                        match = _LEADING_WS_RE.match(content, end + 5)
+                        body_start = match.end() if match else end + 5
+                    elif content[-4:] == b"\n---":
+                        body_start = size
+            f.seek(body_start)
+            shutil.copyfileobj(f, out)
+        out.write(b"\n\n")
 
     def _build_frontmatter(
         self, messages: list[dict[str, Any]], attachments: list[dict[str, Any]]
@@ -216,41 +317,45 @@ class ObsidianExporter:
         tags = ["email"]
         for label in sorted(all_labels):
             tag = label.lower().replace("_", "-")
-            if tag not in ["unread", "inbox", "sent", "category-promotions", "category-updates"]:
+            if tag not in _GMAIL_TAG_BLACKLIST:
                 tags.append(f"gmail/{tag}")
 
         # Build frontmatter
-        fm_lines = ["---"]
-        fm_lines.append(f'subject: "{self._escape_yaml(first_msg["subject"])}"')
-        fm_lines.append(f'from: "{self._escape_yaml(first_msg["from"])}"')
-        fm_lines.append(f'to: "{self._escape_yaml(first_msg["to"])}"')
-
+        fm_lines = [
+            "---",
+            f'subject: "{self._escape_yaml(first_msg["subject"])}"',
+            f'from: "{self._escape_yaml(first_msg["from"])}"',
+            f'to: "{self._escape_yaml(first_msg["to"])}"',
+        ]
         if first_msg.get("cc"):
             fm_lines.append(f'cc: "{self._escape_yaml(first_msg["cc"])}"')
         if first_msg.get("bcc"):
             fm_lines.append(f'bcc: "{self._escape_yaml(first_msg["bcc"])}"')
 
-        fm_lines.append(f'date: "{first_msg["date_iso"]}"')
-        fm_lines.append(f'thread_id: "{first_msg["thread_id"]}"')
-        fm_lines.append(f"message_count: {len(messages)}")
-
-        # Message IDs
-        fm_lines.append("message_ids:")
-        for msg in messages:
-            fm_lines.append(f'  - "{msg["id"]}"')
+        fm_lines += [
+            f'date: "{first_msg["date_iso"]}"',
+            f'thread_id: "{first_msg["thread_id"]}"',
+            f"message_count: {len(messages)}",
+            "message_ids:",
+        ]
+        fm_lines += [f'  - "{msg["id"]}"' for msg in messages]
 
         # Tags
         fm_lines.append("tags:")
-        for tag in tags:
-            fm_lines.append(f"  - {tag}")
+        fm_lines += [f"  - {tag}" for tag in tags]
 
         # Attachments
         if attachments:
             fm_lines.append("attachments:")
-            for att in attachments:
-                fm_lines.append(f'  - filename: "{att["filename"]}"')
-                fm_lines.append(f"    size: {att['size']}")
-                fm_lines.append(f'    mime_type: "{att["mime_type"]}"')
+            fm_lines += [
+                line
+                for att in attachments
+                for line in (
+                    f'  - filename: "{att["filename"]}"',
+                    f"    size: {att['size']}",
+                    f'    mime_type: "{att["mime_type"]}"',
+                )
+            ]
 
         fm_lines.append("---")
 
@@ -267,36 +372,36 @@ class ObsidianExporter:
         Returns:
             Formatted message content
         """
-        lines = []
-
         # Header
-        lines.append(f"# Message {index}/{total}")
-        lines.append("")
-        lines.append(f"**From:** {msg['from']}")
-        lines.append(f"**To:** {msg['to']}")
-
+        lines = [
+            f"# Message {index}/{total}",
+            "",
+            f"**From:** {msg['from']}",
+            f"**To:** {msg['to']}",
+        ]
         if msg.get("cc"):
             lines.append(f"**CC:** {msg['cc']}")
 
-        lines.append(f"**Date:** {msg['date_iso']}")
-        lines.append(f"**Message ID:** `{msg['id']}`")
+        lines += [f"**Date:** {msg['date_iso']}", f"**Message ID:** `{msg['id']}`"]
 
         if msg.get("in_reply_to"):
             lines.append(f"**In-Reply-To:** `{msg['in_reply_to']}`")
 
         # Attachments
         if msg.get("attachments"):
-            lines.append("")
-            lines.append("**Attachments:**")
-            for att in msg["attachments"]:
-                size_kb = att["size"] / 1024
-                lines.append(f"- [[{att['filename']}]] ({size_kb:.1f} KB, {att['mime_type']})")
+            lines += ["", "**Attachments:**"]
+            lines += [
+                f"- [[{att['filename']}]] ({att['size'] / 1024:.1f} KB, {att['mime_type']})"
+                for att in msg["attachments"]
+            ]
 
         # Body
-        lines.append("")
-        lines.append("## Message Body")
-        lines.append("")
-        lines.append(msg.get("body_markdown", msg.get("body_plain", "(No content)")))
+        lines += [
+            "",
+            "## Message Body",
+            "",
+            msg.get("body_markdown", msg.get("body_plain", "(No content)")),
+        ]
 
         return "\n".join(lines)
 
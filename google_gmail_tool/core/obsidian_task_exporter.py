@@ -59,11 +59,41 @@ and has been reviewed and tested by a human.
 import logging
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# "## Tasks" section (header, then body up to the next level-2 heading or end
+# of file) and checklist items
+_TASKS_BLOCK_RE = re.compile(r"(^## Tasks\s*$)(.*?)(?=^## |\Z)", re.MULTILINE | re.DOTALL)
+_CHECKLIST_RE = re.compile(r"^- \[([ x])\] (.+?)(?:\n|$)", re.MULTILINE)
+
+# Subsections of ## Tasks in output order: (heading, category key)
+_TASK_SECTIONS = (
+    ("### Overdue", "overdue"),
+    ("### Today", "today"),
+    ("### Tomorrow", "tomorrow"),
+    ("### This Week", "this_week"),
+    ("### No Due Date", "no_due"),
+)
+
+
+@lru_cache(maxsize=512)
+def _build_daily_path(root: str, ordinal: int) -> Path:
+    """Build the daily note path for a vault root and date (memoized).
+
+    Args:
+        root: Obsidian vault root directory
+        ordinal: Proleptic Gregorian ordinal of the note date
+
+    Returns:
+        Path to daily note file: root/daily/YYYY/YYYY-MM/YYYY-MM-DD.md
+    """
+    day = datetime.fromordinal(ordinal)
+    return Path(root) / "daily" / f"{day:%Y}" / f"{day:%Y-%m}" / f"{day:%Y-%m-%d}.md"
+
 
 class ObsidianTaskExporter:
     """Export Google Tasks to Obsidian daily notes with smart merge."""
@@ -98,26 +128,30 @@ class ObsidianTaskExporter:
         note_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Read existing note if it exists
-        existing_content = ""
+        existing_bytes = b""
         if note_path.exists():
-            existing_content = note_path.read_text()
+            existing_bytes = note_path.read_bytes()
+        existing_content = existing_bytes.decode("utf-8")
+        if existing_content:
             logger.debug(f"Read existing note: {len(existing_content)} characters")
 
         # Parse existing tasks section
         checked_items = self._parse_checked_items(existing_content)
         logger.debug(f"Found {len(checked_items)} checked items in existing note")
 
-        # Categorize tasks by due date relative to target_date
-        categorized = self._categorize_tasks(tasks, target_date)
-
-        # Build new tasks section
-        tasks_section = self._build_tasks_section(categorized, checked_items)
+        # Categorize tasks by due date and build the new tasks section in one pass
+        tasks_section = self._build_tasks_section(tasks, target_date, checked_items)
 
         # Merge with existing content
         new_content = self._merge_content(existing_content, tasks_section, target_date)
 
-        # Write to file
-        note_path.write_text(new_content)
+        # Write to file, unless nothing changed
+        new_bytes = new_content.encode("utf-8")
+        if new_bytes == existing_bytes:
+            logger.info(f"Daily note unchanged: {note_path}")
+            return note_path
+
+        note_path.write_bytes(new_bytes)
         logger.info(f"Exported tasks to: {note_path}")
 
         return note_path
@@ -131,11 +165,7 @@ class ObsidianTaskExporter:
         Returns:
             Path to daily note file
         """
-        year = date.strftime("%Y")
-        year_month = date.strftime("%Y-%m")
-        date_str = date.strftime("%Y-%m-%d")
-
-        return self.obsidian_root / "daily" / year / year_month / f"{date_str}.md"
+        return _build_daily_path(str(self.obsidian_root), date.toordinal())
 
     def _parse_checked_items(self, content: str) -> dict[str, bool]:
         """Parse existing tasks section to find checked items.
@@ -148,27 +178,19 @@ class ObsidianTaskExporter:
         """
         checked_items: dict[str, bool] = {}
 
-        # Find ## Tasks section
-        tasks_match = re.search(r"^## Tasks\s*$", content, re.MULTILINE)
+        # Find ## Tasks section (body runs until next ## or end)
+        tasks_match = _TASKS_BLOCK_RE.search(content)
         if not tasks_match:
             return checked_items
 
-        # Extract tasks section content (until next ## or end)
-        start_pos = tasks_match.end()
-        next_section = re.search(r"^## ", content[start_pos:], re.MULTILINE)
-        if next_section:
-            tasks_content = content[start_pos : start_pos + next_section.start()]
-        else:
-            tasks_content = content[start_pos:]
-
-        # Parse checklist items
-        checklist_pattern = r"^- \[([ x])\] (.+?)(?:\n|$)"
-        for match in re.finditer(checklist_pattern, tasks_content, re.MULTILINE):
+        # Parse checklist items within the section body, without slicing it out
+        for match in _CHECKLIST_RE.finditer(content, tasks_match.start(2), tasks_match.end(2)):
             check_mark = match.group(1)
             item_text = match.group(2)
 
-            # Extract task signature (title + due date if present)
-            signature = self._extract_task_signature(item_text)
+            # Task signature: the full item text, including "(due: YYYY-MM-DD)" if
+            # present, identifies the same task across exports
+            signature = item_text.strip()
             is_checked = check_mark == "x"
 
             checked_items[signature] = is_checked
@@ -176,122 +198,85 @@ class ObsidianTaskExporter:
 
         return checked_items
 
+    # Deprecated: the export loops inline item_text.strip(); kept for existing callers
     def _extract_task_signature(self, item_text: str) -> str:
         """Extract task signature from checklist item text.
 
-        Task signature is used to identify the same task across exports.
-        Format: "Task Title (due: YYYY-MM-DD)" or just "Task Title"
-
         Args:
             item_text: Full checklist item text
 
         Returns:
-            Task signature for matching
+            Task signature for matching (the full text including "(due: ...)")
         """
-        # The signature is the full text including (due: ...) if present
         return item_text.strip()
 
-    def _categorize_tasks(
-        self, tasks: list[dict[str, Any]], target_date: datetime
-    ) -> dict[str, list[dict[str, Any]]]:
-        """Categorize tasks by due date relative to target date.
+    def _build_tasks_section(
+        self, tasks: list[dict[str, Any]], target_date: datetime, checked_items: dict[str, bool]
+    ) -> str:
+        """Build ## Tasks section with tasks categorized by due date.
+
+        Each task is categorized and formatted in the same pass, appending its
+        lines directly to the block of its subsection.
 
         Args:
             tasks: List of tasks
             target_date: Reference date for categorization
+            checked_items: Previously checked task signatures
 
         Returns:
-            Dictionary with categories: overdue, today, tomorrow, this_week, no_due
+            Complete ## Tasks section markdown
         """
-        categorized: dict[str, list[dict[str, Any]]] = {
-            "overdue": [],
-            "today": [],
-            "tomorrow": [],
-            "this_week": [],
-            "no_due": [],
-        }
+        # One block of lines per subsection, each starting with its heading
+        blocks = {category_key: [section_title] for section_title, category_key in _TASK_SECTIONS}
+        overdue, today, tomorrow, this_week, no_due = blocks.values()
 
+        # YYYY-MM-DD strings compare in date order, so no per-task date parsing
         target_date_str = target_date.strftime("%Y-%m-%d")
         tomorrow_date_str = (target_date + timedelta(days=1)).strftime("%Y-%m-%d")
-        week_end_date = target_date + timedelta(days=7)
+        week_end_date_str = (target_date + timedelta(days=7)).strftime("%Y-%m-%d")
 
         for task in tasks:
             due_str = task.get("due")
 
             if not due_str:
-                categorized["no_due"].append(task)
-                continue
-
-            # Extract date from ISO format (YYYY-MM-DDTHH:MM:SS.sssZ)
-            task_due_date_str = due_str[:10]  # Get YYYY-MM-DD
-            task_due_date = datetime.strptime(task_due_date_str, "%Y-%m-%d")
-
-            if task_due_date < target_date.replace(hour=0, minute=0, second=0, microsecond=0):
-                categorized["overdue"].append(task)
-            elif task_due_date_str == target_date_str:
-                categorized["today"].append(task)
-            elif task_due_date_str == tomorrow_date_str:
-                categorized["tomorrow"].append(task)
-            elif task_due_date <= week_end_date:
-                categorized["this_week"].append(task)
+                lines = no_due
             else:
-                # Future tasks beyond a week don't appear in today's note
-                pass
-
-        return categorized
-
-    def _build_tasks_section(
-        self, categorized: dict[str, list[dict[str, Any]]], checked_items: dict[str, bool]
-    ) -> str:
-        """Build ## Tasks section with categorized tasks.
-
-        Args:
-            categorized: Tasks organized by category
-            checked_items: Previously checked task signatures
-
-        Returns:
-            Complete ## Tasks section markdown
-        """
-        lines = ["## Tasks", ""]
-
-        # Add subsections in order
-        sections = [
-            ("### Overdue", "overdue"),
-            ("### Today", "today"),
-            ("### Tomorrow", "tomorrow"),
-            ("### This Week", "this_week"),
-            ("### No Due Date", "no_due"),
-        ]
-
-        for section_title, category_key in sections:
-            tasks_in_category = categorized[category_key]
-
-            if not tasks_in_category:
-                continue  # Skip empty sections
-
-            lines.append(section_title)
-
-            for task in tasks_in_category:
-                # Format task checklist item
-                item_text = self._format_task_checklist(task)
-                signature = self._extract_task_signature(item_text)
-
-                # Preserve checked status
-                check_mark = "x" if checked_items.get(signature, False) else " "
-
-                lines.append(f"- [{check_mark}] {item_text}")
-
-                # Add task notes as indented content
-                notes = task.get("notes")
-                if notes:
-                    # Indent notes under the checklist item
-                    for note_line in notes.split("\n"):
-                        if note_line.strip():
-                            lines.append(f"  {note_line}")
-
-            lines.append("")  # Blank line after section
-
-        return "\n".join(lines)
+                # Extract date from ISO format (YYYY-MM-DDTHH:MM:SS.sssZ)
+                task_due_date_str = due_str[:10]
+
+                if task_due_date_str < target_date_str:
+                    lines = overdue
+                elif task_due_date_str == target_date_str:
+                    lines = today
+                elif task_due_date_str == tomorrow_date_str:
+                    lines = tomorrow
+                elif task_due_date_str <= week_end_date_str:
+                    lines = this_week
+                else:
+                    # Future tasks beyond a week don't appear in today's note
+                    continue
+
+            # Format task checklist item
+            item_text = self._format_task_checklist(task)
+            signature = item_text.strip()  # same signature as _parse_checked_items
+
+            # Preserve checked status
+            check_mark = "x" if checked_items.get(signature, False) else " "
+            lines.append(f"- [{check_mark}] {item_text}")
+
+            # Add task notes as indented content under the checklist item
+            notes = task.get("notes")
+            if notes:
+                lines += [f"  {line}" for line in notes.split("\n") if line.strip()]
+
+        # Skip empty sections (heading only)
+        section_blocks = ["\n".join(lines) for lines in blocks.values() if len(lines) > 1]
+
+        if not section_blocks:
+            return "## Tasks\n"
+
+        # Blank line after the header and after each section
+        return "## Tasks\n\n" + "\n\n".join(section_blocks) + "\n"
 
     def _format_task_checklist(self, task: dict[str, Any]) -> str:
         """Format task as checklist item text.
@@ -330,19 +315,18 @@ class ObsidianTaskExporter:
             return self._create_note_template(target_date, tasks_section)
 
         # Find and replace ## Tasks section
-        tasks_pattern = r"(^## Tasks\s*$)(.*?)(?=^## |\Z)"
-        tasks_match = re.search(tasks_pattern, existing_content, re.MULTILINE | re.DOTALL)
+        tasks_match = _TASKS_BLOCK_RE.search(existing_content)
 
         if tasks_match:
             # Replace existing ## Tasks section
-            new_content = existing_content[: tasks_match.start()] + tasks_section
+            parts = [existing_content[: tasks_match.start()], tasks_section]
             # Add remaining content after ## Tasks section
             if tasks_match.end() < len(existing_content):
-                new_content += "\n" + existing_content[tasks_match.end() :].lstrip()
-            return new_content
+                parts += ["\n", existing_content[tasks_match.end() :].lstrip()]
+            return "".join(parts)
         else:
             # No ## Tasks section, append at end
-            return existing_content.rstrip() + "\n\n" + tasks_section
+            return "".join([existing_content.rstrip(), "\n\n", tasks_section])
 
     def _create_note_template(self, date: datetime, tasks_section: str) -> str:
         """Create new daily note from template.
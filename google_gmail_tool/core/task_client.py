@@ -6,16 +6,22 @@ and task status management (complete/uncomplete). Works with the default task li
 
 Key Responsibilities:
 - Automatic default task list discovery via _get_default_tasklist_id()
+  (prefetched in the background on construction, then cached per client;
+  see refresh_default_tasklist())
 - Task listing with filtering: completion status, due date ranges, keyword search
+  (iter_tasks() streams pages lazily; list_tasks() collects up to max_results)
 - Task creation with title, notes, and due date
 - Task updates (partial field updates supported)
 - Task status changes (complete/uncomplete via status field)
 - Task deletion
+- Bulk complete/uncomplete/update/delete in batch HTTP requests (one round-trip per 50 tasks)
+- Concurrent per-task operations via bulk_apply() (thread-safe: one transport per thread)
 - Response processing via _process_task() for consistent field extraction
 
 API Integration:
 - Uses google.auth.credentials.Credentials for OAuth2 authentication
-- Builds Google Tasks API v1 service via googleapiclient.discovery.build()
+- Builds Google Tasks API v1 service from the bundled discovery document
+  (parsed once per process, see _discovery.build_service())
 - Handles RFC 3339 timestamp format for due dates (midnight UTC)
 - Client-side filtering for query parameter (title/notes search)
 
@@ -52,49 +58,211 @@ and has been reviewed and tested by a human.
 """
 
 import logging
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
-from typing import Any
+from itertools import islice
+from typing import Any, TypeVar
 
+import google_auth_httplib2
+import httplib2
 from google.auth.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+
+from google_gmail_tool.core._discovery import build_service
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of requests per batch HTTP request
+_BATCH_LIMIT = 50
+
+# Partial responses: only the fields _process_task reads
+_TASK_FIELDS = "id,title,notes,due,status,completed,updated"
+_LIST_FIELDS = f"items({_TASK_FIELDS}),nextPageToken"
+
+# Maximum page size of tasks().list
+_LIST_PAGE_LIMIT = 100
+
+# Worker threads of the shared executor (default bulk_apply concurrency)
+_BULK_WORKERS = 8
+
+T = TypeVar("T")
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide executor for bulk task operations.
+
+    Created on first use and shared by all TaskClient instances, so worker
+    threads (and their per-thread transports) are reused across calls.
+
+    Returns:
+        Shared thread pool executor
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=_BULK_WORKERS, thread_name_prefix="gmail-tasks"
+            )
+        return _EXECUTOR
+
+
+def _process_task(task: dict[str, Any]) -> dict[str, Any]:
+    """Process raw task to extract key fields.
+
+    Args:
+        task: Raw task from Google Tasks API
+
+    Returns:
+        Processed task with standardized fields
+    """
+    return {
+        "id": task.get("id"),
+        "title": task.get("title", "(No title)"),
+        "notes": task.get("notes"),
+        "due": task.get("due"),
+        "status": task.get("status"),
+        "completed": task.get("completed"),
+        "updated": task.get("updated"),
+    }
+
+
+def _format_due(due: datetime) -> str:
+    """Format a due date as the RFC 3339 timestamp the Tasks API expects.
+
+    Only the date is used; due dates are always midnight UTC.
+
+    Args:
+        due: Due date (time ignored)
+
+    Returns:
+        Timestamp formatted as YYYY-MM-DDT00:00:00.000Z
+    """
+    return f"{due.year:04d}-{due.month:02d}-{due.day:02d}T00:00:00.000Z"
+
 
 class TaskClient:
     """Client for Google Tasks API operations."""
 
-    def __init__(self, credentials: Credentials) -> None:
+    # Kept as a (static) method for callers of client._process_task
+    _process_task = staticmethod(_process_task)
+
+    def __init__(self, credentials: Credentials, prefetch: bool = True) -> None:
         """Initialize Tasks API client.
 
         Args:
             credentials: Google OAuth credentials
+            prefetch: Start fetching the default task list ID in a background
+                thread, overlapping that round-trip with the caller's own work
         """
         logger.debug("Initializing Google Tasks API client")
-        self.service = build("tasks", "v1", credentials=credentials)
+        self.credentials = credentials
+        self.service = build_service("tasks", "v1", credentials=credentials)
+        self._default_tasklist_id: str | None = None
+        # httplib2 is not thread-safe: other threads execute requests on their own transport
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+
+        self._tasklist_future: Future[str] | None = None
+        if prefetch:
+            self._tasklist_future = Future()
+            # Daemon thread, not an executor worker: executor threads are joined
+            # at interpreter exit, so a slow prefetch would delay exiting
+            threading.Thread(
+                target=self._prefetch_default_tasklist_id,
+                args=(self._tasklist_future,),
+                name="gmail-tasks-prefetch",
+                daemon=True,
+            ).start()
         logger.debug("Tasks API client initialized successfully")
 
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp | None:
+        """Get the HTTP transport for executing requests on the calling thread.
+
+        Returns:
+            None on the thread that created the client (use the service's own
+            transport), otherwise an authorized transport owned by the calling thread
+        """
+        if threading.get_ident() == self._owner_thread:
+            return None
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def refresh_default_tasklist(self) -> None:
+        """Forget the cached default task list ID (re-fetched on next use)."""
+        self._default_tasklist_id = None
+        self._tasklist_future = None
+
+    def _prefetch_default_tasklist_id(self, future: Future[str]) -> None:
+        """Fetch the default task list ID into a future (prefetch thread target).
+
+        Args:
+            future: Future receiving the ID or the fetch error
+        """
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(self._fetch_default_tasklist_id())
+        except Exception as e:
+            future.set_exception(e)
+
     def _get_default_tasklist_id(self) -> str:
         """Get the ID of the default task list.
 
+        The ID is fetched once and cached on the client, so CRUD operations
+        don't pay an extra API round-trip each.
+
         Returns:
             Default task list ID
 
         Raises:
             Exception: If API call fails
         """
-        logger.debug("Fetching default task list")
+        if self._default_tasklist_id is not None:
+            return self._default_tasklist_id
+
+        future, self._tasklist_future = self._tasklist_future, None
+        if future is not None:
+            try:
+                self._default_tasklist_id = future.result()
+                return self._default_tasklist_id
+            except Exception as e:
+                logger.debug("Default task list prefetch failed (%s), fetching again", e)
+
         try:
-            tasklists = self.service.tasklists().list(maxResults=1).execute()
-            items = tasklists.get("items", [])
-            if not items:
-                raise ValueError("No task lists found")
-            default_id: str = items[0]["id"]
-            logger.debug(f"Default task list ID: {default_id}")
-            return default_id
+            self._default_tasklist_id = self._fetch_default_tasklist_id()
         except Exception as e:
-            logger.error(f"Failed to get default task list: {type(e).__name__}: {e}")
+            logger.error("Failed to get default task list: %s: %s", type(e).__name__, e)
             raise
+        return self._default_tasklist_id
+
+    def _fetch_default_tasklist_id(self) -> str:
+        """Fetch the ID of the default task list from the API.
+
+        Failures are not logged here: the prefetch thread hands them to
+        _get_default_tasklist_id, which retries and logs only its own failure.
+
+        Returns:
+            Default task list ID
+
+        Raises:
+            Exception: If API call fails
+        """
+        logger.debug("Fetching default task list")
+        tasklists = self.service.tasklists().list(maxResults=1).execute(http=self._thread_http())
+        items = tasklists.get("items", [])
+        if not items:
+            raise ValueError("No task lists found")
+        default_id: str = items[0]["id"]
+        logger.debug("Default task list ID: %s", default_id)
+        return default_id
 
     def list_tasks(
         self,
@@ -112,7 +280,8 @@ class TaskClient:
             due_min: Only tasks due after this datetime (inclusive)
             due_max: Only tasks due before this datetime (exclusive)
             query: Search query for task title and notes (client-side filtering)
-            max_results: Maximum number of tasks to return (default: 100)
+            max_results: Maximum number of tasks to return (default: 100); further
+                pages are fetched until this many tasks pass the query filter
 
         Returns:
             List of task dictionaries with processed fields
@@ -122,16 +291,62 @@ class TaskClient:
         """
         logger.info("Listing tasks")
         logger.debug(
-            f"Filters - completed: {completed}, due_min: {due_min}, "
-            f"due_max: {due_max}, query: {query}, max_results: {max_results}"
+            "Filters - completed: %s, due_min: %s, due_max: %s, query: %s, max_results: %s",
+            completed,
+            due_min,
+            due_max,
+            query,
+            max_results,
         )
 
+        try:
+            # Stops pulling (and fetching pages) once max_results tasks passed the filter
+            tasks = self.iter_tasks(
+                completed, due_min, due_max, query, page_size=min(max_results, _LIST_PAGE_LIMIT)
+            )
+            processed_tasks = list(islice(tasks, max_results))
+
+            logger.info("Returning %d tasks after filtering", len(processed_tasks))
+            return processed_tasks
+
+        except Exception as e:
+            logger.error("Failed to list tasks: %s: %s", type(e).__name__, e)
+            raise
+
+    def iter_tasks(
+        self,
+        completed: bool | None = None,
+        due_min: datetime | None = None,
+        due_max: datetime | None = None,
+        query: str | None = None,
+        page_size: int = _LIST_PAGE_LIMIT,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over tasks with optional filtering, fetching pages lazily.
+
+        The next page is only requested once the caller has consumed the
+        current one, so stopping early skips the remaining pages.
+
+        Args:
+            completed: Filter by completion status
+                (None = all, True = completed, False = incomplete)
+            due_min: Only tasks due after this datetime (inclusive)
+            due_max: Only tasks due before this datetime (exclusive)
+            query: Search query for task title and notes (client-side filtering)
+            page_size: Tasks per API page (max 100)
+
+        Yields:
+            Task dictionaries with processed fields
+
+        Raises:
+            Exception: If API call fails
+        """
         tasklist_id = self._get_default_tasklist_id()
 
         # Build API request
         request_params: dict[str, Any] = {
             "tasklist": tasklist_id,
-            "maxResults": max_results,
+            "maxResults": min(page_size, _LIST_PAGE_LIMIT),
+            "fields": _LIST_FIELDS,
         }
 
         # Show completed or incomplete tasks
@@ -147,36 +362,34 @@ class TaskClient:
         if due_max:
             request_params["dueMax"] = due_max.isoformat() + "Z"
 
-        logger.debug(f"API request params: {request_params}")
+        logger.debug("API request params: %s", request_params)
 
-        try:
-            tasks_result = self.service.tasks().list(**request_params).execute()
+        query_lower = query.lower() if query else None
+        tasks_api = self.service.tasks()
+        process = _process_task
+
+        while True:
+            tasks_result = tasks_api.list(**request_params).execute(http=self._thread_http())
             tasks = tasks_result.get("items", [])
 
-            logger.info(f"Retrieved {len(tasks)} tasks from API")
+            logger.info("Retrieved %d tasks from API", len(tasks))
 
             # Process tasks
-            processed_tasks = []
             for task in tasks:
-                processed = self._process_task(task)
+                processed = process(task)
 
                 # Client-side query filtering (search in title and notes)
-                if query:
-                    query_lower = query.lower()
-                    title = (processed.get("title") or "").lower()
-                    notes = (processed.get("notes") or "").lower()
-
-                    if query_lower not in title and query_lower not in notes:
+                if query_lower:
+                    haystack = f"{processed['title'] or ''}\0{processed['notes'] or ''}"
+                    if query_lower not in haystack.lower():
                         continue
 
-                processed_tasks.append(processed)
+                yield processed
 
-            logger.info(f"Returning {len(processed_tasks)} tasks after filtering")
-            return processed_tasks
-
-        except Exception as e:
-            logger.error(f"Failed to list tasks: {type(e).__name__}: {e}")
-            raise
+            page_token = tasks_result.get("nextPageToken")
+            if not page_token:
+                return
+            request_params["pageToken"] = page_token
 
     def get_task(self, task_id: str) -> dict[str, Any]:
         """Get single task by ID.
@@ -190,17 +403,21 @@ class TaskClient:
         Raises:
             Exception: If API call fails or task not found
         """
-        logger.info(f"Fetching task: {task_id}")
+        logger.info("Fetching task: %s", task_id)
 
         tasklist_id = self._get_default_tasklist_id()
 
         try:
-            task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
+            task = (
+                self.service.tasks()
+                .get(tasklist=tasklist_id, task=task_id, fields=_TASK_FIELDS)
+                .execute(http=self._thread_http())
+            )
             logger.info("Task retrieved successfully")
-            return self._process_task(task)
+            return _process_task(task)
 
         except Exception as e:
-            logger.error(f"Failed to get task: {type(e).__name__}: {e}")
+            logger.error("Failed to get task: %s: %s", type(e).__name__, e)
             raise
 
     def create_task(
@@ -222,7 +439,7 @@ class TaskClient:
         Raises:
             Exception: If API call fails
         """
-        logger.info(f"Creating task: {title}")
+        logger.info("Creating task: %s", title)
 
         tasklist_id = self._get_default_tasklist_id()
 
@@ -234,20 +451,22 @@ class TaskClient:
 
         if due:
             # Google Tasks API expects RFC 3339 timestamp (midnight UTC)
-            task_body["due"] = due.strftime("%Y-%m-%dT00:00:00.000Z")
+            task_body["due"] = _format_due(due)
 
-        logger.debug(f"Task body: {task_body}")
+        logger.debug("Task body: %s", task_body)
 
         try:
             created_task = (
-                self.service.tasks().insert(tasklist=tasklist_id, body=task_body).execute()
+                self.service.tasks()
+                .insert(tasklist=tasklist_id, body=task_body, fields=_TASK_FIELDS)
+                .execute(http=self._thread_http())
             )
 
-            logger.info(f"Task created successfully: {created_task['id']}")
-            return self._process_task(created_task)
+            logger.info("Task created successfully: %s", created_task["id"])
+            return _process_task(created_task)
 
         except Exception as e:
-            logger.error(f"Failed to create task: {type(e).__name__}: {e}")
+            logger.error("Failed to create task: %s: %s", type(e).__name__, e)
             raise
 
     def update_task(
@@ -271,36 +490,25 @@ class TaskClient:
         Raises:
             Exception: If API call fails or task not found
         """
-        logger.info(f"Updating task: {task_id}")
+        logger.info("Updating task: %s", task_id)
 
         tasklist_id = self._get_default_tasklist_id()
 
-        try:
-            # Fetch existing task
-            existing_task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
-
-            # Update fields
-            if title is not None:
-                existing_task["title"] = title
-
-            if notes is not None:
-                existing_task["notes"] = notes
-
-            if due is not None:
-                existing_task["due"] = due.strftime("%Y-%m-%dT00:00:00.000Z")
+        # Only the changed fields; PATCH merges them without fetching the task first
+        task_body = self._update_body(title=title, notes=notes, due=due)
 
-            # Update task
+        try:
             updated_task = (
                 self.service.tasks()
-                .update(tasklist=tasklist_id, task=task_id, body=existing_task)
-                .execute()
+                .patch(tasklist=tasklist_id, task=task_id, body=task_body, fields=_TASK_FIELDS)
+                .execute(http=self._thread_http())
             )
 
-            logger.info(f"Task updated successfully: {task_id}")
-            return self._process_task(updated_task)
+            logger.info("Task updated successfully: %s", task_id)
+            return _process_task(updated_task)
 
         except Exception as e:
-            logger.error(f"Failed to update task: {type(e).__name__}: {e}")
+            logger.error("Failed to update task: %s: %s", type(e).__name__, e)
             raise
 
     def complete_task(self, task_id: str) -> dict[str, Any]:
@@ -315,30 +523,28 @@ class TaskClient:
         Raises:
             Exception: If API call fails or task not found
         """
-        logger.info(f"Completing task: {task_id}")
+        logger.info("Completing task: %s", task_id)
 
         tasklist_id = self._get_default_tasklist_id()
 
-        try:
-            # Fetch existing task
-            existing_task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
-
-            # Mark as completed
-            existing_task["status"] = "completed"
-            existing_task["completed"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        # Mark as completed (PATCH: no need to fetch the task first)
+        task_body = {
+            "status": "completed",
+            "completed": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        }
 
-            # Update task
+        try:
             updated_task = (
                 self.service.tasks()
-                .update(tasklist=tasklist_id, task=task_id, body=existing_task)
-                .execute()
+                .patch(tasklist=tasklist_id, task=task_id, body=task_body, fields=_TASK_FIELDS)
+                .execute(http=self._thread_http())
             )
 
-            logger.info(f"Task completed successfully: {task_id}")
-            return self._process_task(updated_task)
+            logger.info("Task completed successfully: %s", task_id)
+            return _process_task(updated_task)
 
         except Exception as e:
-            logger.error(f"Failed to complete task: {type(e).__name__}: {e}")
+            logger.error("Failed to complete task: %s: %s", type(e).__name__, e)
             raise
 
     def uncomplete_task(self, task_id: str) -> dict[str, Any]:
@@ -353,31 +559,25 @@ class TaskClient:
         Raises:
             Exception: If API call fails or task not found
         """
-        logger.info(f"Uncompleting task: {task_id}")
+        logger.info("Uncompleting task: %s", task_id)
 
         tasklist_id = self._get_default_tasklist_id()
 
-        try:
-            # Fetch existing task
-            existing_task = self.service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
+        # Mark as incomplete (PATCH: null clears the completion timestamp)
+        task_body = {"status": "needsAction", "completed": None}
 
-            # Mark as incomplete
-            existing_task["status"] = "needsAction"
-            if "completed" in existing_task:
-                del existing_task["completed"]
-
-            # Update task
+        try:
             updated_task = (
                 self.service.tasks()
-                .update(tasklist=tasklist_id, task=task_id, body=existing_task)
-                .execute()
+                .patch(tasklist=tasklist_id, task=task_id, body=task_body, fields=_TASK_FIELDS)
+                .execute(http=self._thread_http())
             )
 
-            logger.info(f"Task marked incomplete successfully: {task_id}")
-            return self._process_task(updated_task)
+            logger.info("Task marked incomplete successfully: %s", task_id)
+            return _process_task(updated_task)
 
         except Exception as e:
-            logger.error(f"Failed to uncomplete task: {type(e).__name__}: {e}")
+            logger.error("Failed to uncomplete task: %s: %s", type(e).__name__, e)
             raise
 
     def delete_task(self, task_id: str) -> None:
@@ -389,35 +589,229 @@ class TaskClient:
         Raises:
             Exception: If API call fails or task not found
         """
-        logger.info(f"Deleting task: {task_id}")
+        logger.info("Deleting task: %s", task_id)
 
         tasklist_id = self._get_default_tasklist_id()
 
         try:
-            self.service.tasks().delete(tasklist=tasklist_id, task=task_id).execute()
-            logger.info(f"Task deleted successfully: {task_id}")
+            self.service.tasks().delete(tasklist=tasklist_id, task=task_id).execute(
+                http=self._thread_http()
+            )
+            logger.info("Task deleted successfully: %s", task_id)
 
         except Exception as e:
-            logger.error(f"Failed to delete task: {type(e).__name__}: {e}")
+            logger.error("Failed to delete task: %s: %s", type(e).__name__, e)
             raise
 
-    def _process_task(self, task: dict[str, Any]) -> dict[str, Any]:
-        """Process raw task to extract key fields.
+    def bulk_apply(
+        self,
+        task_ids: Iterable[str],
+        op: Callable[[str], T],
+        max_workers: int = _BULK_WORKERS,
+    ) -> list[T]:
+        """Apply a per-task operation to many tasks concurrently.
+
+        Use when batch requests don't fit (e.g. mixed operations or per-task
+        error handling inside op). Runs on the shared executor; each worker
+        thread uses its own transport.
 
         Args:
-            task: Raw task from Google Tasks API
+            task_ids: Task IDs
+            op: Operation to run for each task ID (e.g. client.get_task)
+            max_workers: Maximum number of concurrent requests (capped at the
+                shared executor's 8 workers)
 
         Returns:
-            Processed task with standardized fields
+            Results of op in input order
+
+        Raises:
+            Exception: The first exception raised by op
         """
-        processed = {
-            "id": task.get("id"),
-            "title": task.get("title", "(No title)"),
-            "notes": task.get("notes"),
-            "due": task.get("due"),
-            "status": task.get("status"),
-            "completed": task.get("completed"),
-            "updated": task.get("updated"),
-        }
+        # Resolve the default task list once, before the workers need it
+        self._get_default_tasklist_id()
+        run = op
+        if max_workers < _BULK_WORKERS:
+            # Fewer concurrent calls than the shared executor has workers
+            slots = threading.BoundedSemaphore(max_workers)
+
+            def limited(task_id: str) -> T:
+                with slots:
+                    return op(task_id)
+
+            run = limited
+        return list(_get_executor().map(run, task_ids))
+
+    def complete_many(self, task_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Mark many tasks as completed with concurrent requests.
+
+        Args:
+            task_ids: Task IDs to complete
+
+        Returns:
+            Updated task dictionaries in input order
+
+        Raises:
+            Exception: If any API call fails
+        """
+        return self.bulk_apply(task_ids, self.complete_task)
+
+    def bulk_complete_tasks(
+        self, task_ids: list[str]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, Exception]]:
+        """Mark many tasks as completed using batch HTTP requests.
+
+        Each task is patched with just its status fields, so no prior GET is needed.
+
+        Args:
+            task_ids: Task IDs to complete
+
+        Returns:
+            Tuple of (task ID -> updated task with processed fields, task ID -> error)
+        """
+        logger.info("Completing %d tasks in batch", len(task_ids))
+        completed = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        body = {"status": "completed", "completed": completed}
+        return self._batch_patch({task_id: body for task_id in task_ids})
+
+    def bulk_uncomplete_tasks(
+        self, task_ids: list[str]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, Exception]]:
+        """Mark many tasks as incomplete using batch HTTP requests.
+
+        Args:
+            task_ids: Task IDs to uncomplete
+
+        Returns:
+            Tuple of (task ID -> updated task with processed fields, task ID -> error)
+        """
+        logger.info("Uncompleting %d tasks in batch", len(task_ids))
+        body = {"status": "needsAction", "completed": None}
+        return self._batch_patch({task_id: body for task_id in task_ids})
+
+    def bulk_update_tasks(
+        self, updates: dict[str, dict[str, Any]]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, Exception]]:
+        """Update many tasks using batch HTTP requests.
+
+        Args:
+            updates: Task ID -> fields to change, using the update_task keyword
+                arguments (title, notes, due)
+
+        Returns:
+            Tuple of (task ID -> updated task with processed fields, task ID -> error)
+        """
+        logger.info("Updating %d tasks in batch", len(updates))
+        return self._batch_patch(
+            {task_id: self._update_body(**fields) for task_id, fields in updates.items()}
+        )
+
+    def bulk_delete_tasks(self, task_ids: list[str]) -> tuple[list[str], dict[str, Exception]]:
+        """Delete many tasks using batch HTTP requests.
+
+        Args:
+            task_ids: Task IDs to delete
+
+        Returns:
+            Tuple of (deleted task IDs in input order, task ID -> error)
+        """
+        logger.info("Deleting %d tasks in batch", len(task_ids))
+        tasklist_id = self._get_default_tasklist_id()
+        tasks = self.service.tasks()
+        results, errors = self._execute_batch(
+            task_ids, lambda task_id: tasks.delete(tasklist=tasklist_id, task=task_id)
+        )
+        return list(results), errors
+
+    def _update_body(
+        self,
+        title: str | None = None,
+        notes: str | None = None,
+        due: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Build a partial (PATCH) task body with only the fields that change.
+
+        Args:
+            title: Optional new title
+            notes: Optional new notes
+            due: Optional new due date
 
-        return processed
+        Returns:
+            Task body with the non-None fields
+        """
+        task_body: dict[str, Any] = {}
+
+        if title is not None:
+            task_body["title"] = title
+
+        if notes is not None:
+            task_body["notes"] = notes
+
+        if due is not None:
+            task_body["due"] = _format_due(due)
+
+        return task_body
+
+    def _batch_patch(
+        self, bodies: dict[str, dict[str, Any]]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, Exception]]:
+        """Patch many tasks (partial bodies) using batch HTTP requests.
+
+        Args:
+            bodies: Task ID -> fields to change
+
+        Returns:
+            Tuple of (task ID -> updated task with processed fields, task ID -> error)
+        """
+        tasklist_id = self._get_default_tasklist_id()
+        tasks = self.service.tasks()
+        results, errors = self._execute_batch(
+            list(bodies),
+            lambda task_id: tasks.patch(
+                tasklist=tasklist_id, task=task_id, body=bodies[task_id], fields=_TASK_FIELDS
+            ),
+        )
+        return {task_id: _process_task(task) for task_id, task in results.items()}, errors
+
+    def _execute_batch(
+        self, task_ids: list[str], make_request: Callable[[str], HttpRequest]
+    ) -> tuple[dict[str, Any], dict[str, Exception]]:
+        """Execute one request per task in batch HTTP requests of up to 50.
+
+        Args:
+            task_ids: Task IDs (duplicates are sent once)
+            make_request: Builds the API request for a task ID
+
+        Returns:
+            Tuple of (task ID -> raw response, task ID -> error), both in input order.
+            If a whole batch fails, its error is recorded for every task in that
+            batch without a response, and the remaining batches still run.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        responses: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+
+        def callback(request_id: str, response: Any, exception: Exception | None) -> None:
+            if exception is not None:
+                logger.error("Batch request for task %s failed: %s", request_id, exception)
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        for start in range(0, len(task_ids), _BATCH_LIMIT):
+            chunk = task_ids[start : start + _BATCH_LIMIT]
+            batch = self.service.new_batch_http_request(callback=callback)
+            for task_id in chunk:
+                batch.add(make_request(task_id), request_id=task_id)
+            logger.debug("Executing task batch of %d requests", len(chunk))
+            try:
+                batch.execute(http=self._thread_http())
+            except Exception as e:
+                logger.error("Task batch of %d requests failed: %s", len(chunk), e)
+                for task_id in chunk:
+                    if task_id not in responses and task_id not in errors:
+                        errors[task_id] = e
+
+        # Callbacks fire in completion order; report in input order
+        results = {task_id: responses[task_id] for task_id in task_ids if task_id in responses}
+        failures = {task_id: errors[task_id] for task_id in task_ids if task_id in errors}
+        return results, failures
@@ -0,0 +1,104 @@
+"""Tests for the persistent calendar event cache.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from google_gmail_tool.core import calendar_cache
+from google_gmail_tool.core.calendar_cache import CalendarCache
+
+
+def make_event(event_id: str, start: str, end: str, status: str = "confirmed") -> dict[str, Any]:
+    """Build a processed event as returned by CalendarClient._process_event."""
+    return {"id": event_id, "start": start, "end": end, "status": status, "updated": None}
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[CalendarCache]:
+    """Create a cache in a temporary database file."""
+    cache = CalendarCache(tmp_path / "calendar.sqlite")
+    yield cache
+    cache.close()
+
+
+def test_upsert_events_inserts_and_replaces(cache: CalendarCache) -> None:
+    """Test upsert_events stores events and replaces existing ones by ID."""
+    cache.upsert_events([make_event("a", "2025-01-01T10:00:00Z", "2025-01-01T11:00:00Z")])
+    cache.upsert_events([make_event("a", "2025-01-01T12:00:00+01:00", "2025-01-01T13:00:00Z")])
+
+    assert cache.get_event("a") == make_event(
+        "a", "2025-01-01T12:00:00+01:00", "2025-01-01T13:00:00Z"
+    )
+    assert cache.get_event("missing") is None
+
+
+def test_upsert_events_removes_cancelled_events(cache: CalendarCache) -> None:
+    """Test a cancelled event from an incremental sync deletes the cached event."""
+    cache.upsert_events([make_event("a", "2025-01-01T10:00:00Z", "2025-01-01T11:00:00Z")])
+    cache.upsert_events([{"id": "a", "status": "cancelled"}])
+
+    assert cache.get_event("a") is None
+
+
+def test_replace_window_drops_only_overlapping_events(cache: CalendarCache) -> None:
+    """Test replace_window replaces events in the window and keeps the others."""
+    cache.upsert_events(
+        [
+            make_event("inside", "2025-01-01T10:00:00Z", "2025-01-01T11:00:00Z"),
+            make_event("outside", "2025-01-03T10:00:00Z", "2025-01-03T11:00:00Z"),
+        ]
+    )
+
+    cache.replace_window(
+        "2025-01-01T00:00:00Z",
+        "2025-01-02T00:00:00Z",
+        [make_event("new", "2025-01-01T14:00:00Z", "2025-01-01T15:00:00Z")],
+    )
+
+    assert cache.get_event("inside") is None
+    assert cache.get_event("outside") is not None
+    assert cache.get_event("new") is not None
+
+
+def test_query_events_bounds_and_order(cache: CalendarCache) -> None:
+    """Test query_events returns overlapping events ordered by start, up to limit."""
+    cache.upsert_events(
+        [
+            make_event("late", "2025-01-01T20:00:00Z", "2025-01-01T21:00:00Z"),
+            make_event("ends-at-min", "2024-12-31T23:00:00Z", "2025-01-01T00:00:00Z"),
+            make_event("overlaps-min", "2024-12-31T23:00:00Z", "2025-01-01T01:00:00Z"),
+            make_event("all-day", "2025-01-01", "2025-01-02"),
+            make_event("starts-at-max", "2025-01-02T00:00:00Z", "2025-01-02T01:00:00Z"),
+        ]
+    )
+
+    events = cache.query_events("2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z", 10)
+    assert [event["id"] for event in events] == ["overlaps-min", "all-day", "late"]
+
+    limited = cache.query_events("2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z", 2)
+    assert [event["id"] for event in limited] == ["overlaps-min", "all-day"]
+
+
+def test_set_sync_token_prunes_oldest_windows(
+    cache: CalendarCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test only the most recently synced windows keep their sync token."""
+    monkeypatch.setattr(calendar_cache, "_MAX_SYNC_TOKENS", 2)
+
+    cache.set_sync_token("day1", "t1")
+    cache.set_sync_token("day2", "t2")
+    cache.set_sync_token("day1", "t1b")  # re-synced, now the most recent
+    cache.set_sync_token("day3", "t3")
+
+    assert cache.get_sync_token("day2") is None
+    assert cache.get_sync_token("day1") == "t1b"
+    assert cache.get_sync_token("day3") == "t3"
+
+    cache.set_sync_token("day3", None)
+    assert cache.get_sync_token("day3") is None
@@ -0,0 +1,143 @@
+"""Tests for CalendarClient cache synchronization against a mocked Calendar service.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from google_gmail_tool.core import calendar_client
+from google_gmail_tool.core.calendar_cache import CalendarCache
+from google_gmail_tool.core.calendar_client import CalendarClient
+
+TIME_MIN = "2025-01-01T00:00:00Z"
+TIME_MAX = "2025-01-02T00:00:00Z"
+KEY = f"primary|{TIME_MIN}|{TIME_MAX}"
+
+
+def raw_event(event_id: str, hour: int, status: str = "confirmed") -> dict[str, Any]:
+    """Build a raw Calendar API event on 2025-01-01."""
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "status": status,
+        "start": {"dateTime": f"2025-01-01T{hour:02d}:00:00Z"},
+        "end": {"dateTime": f"2025-01-01T{hour + 1:02d}:00:00Z"},
+    }
+
+
+@pytest.fixture
+def mock_service() -> MagicMock:
+    """Create mock Google Calendar service."""
+    return MagicMock()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[CalendarCache]:
+    """Create a cache in a temporary database file."""
+    cache = CalendarCache(tmp_path / "calendar.sqlite")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def client(
+    monkeypatch: pytest.MonkeyPatch, mock_service: MagicMock, cache: CalendarCache
+) -> CalendarClient:
+    """Create CalendarClient with mocked service and a temporary cache."""
+    monkeypatch.setattr(calendar_client, "build_service", Mock(return_value=mock_service))
+    monkeypatch.setattr(calendar_client, "shared_http", Mock())
+    return CalendarClient(Mock(), cache=cache)
+
+
+def list_calls(mock_service: MagicMock) -> list[dict[str, Any]]:
+    """Get the keyword arguments of every events().list() call."""
+    return [call.kwargs for call in mock_service.events.return_value.list.call_args_list]
+
+
+def test_sync_window_full_sync_pages_and_stores_token(
+    client: CalendarClient, mock_service: MagicMock, cache: CalendarCache
+) -> None:
+    """Test the first sync of a window is a bounded full sync over all pages."""
+    mock_service.events.return_value.list.return_value.execute.side_effect = [
+        {"items": [raw_event("a", 10)], "nextPageToken": "p2"},
+        {"items": [raw_event("b", 12)], "nextSyncToken": "sync-1"},
+    ]
+
+    client._sync_window(cache, TIME_MIN, TIME_MAX)
+
+    calls = list_calls(mock_service)
+    assert calls[0]["timeMin"] == TIME_MIN
+    assert calls[0]["timeMax"] == TIME_MAX
+    assert "syncToken" not in calls[0]
+    assert calls[1]["pageToken"] == "p2"
+    assert cache.get_sync_token(KEY) == "sync-1"
+    events = cache.query_events(TIME_MIN, TIME_MAX, 10)
+    assert [event["id"] for event in events] == ["a", "b"]
+
+
+def test_sync_window_incremental_sync_applies_changes(
+    client: CalendarClient, mock_service: MagicMock, cache: CalendarCache
+) -> None:
+    """Test a stored token turns the sync into an incremental one."""
+    cache.upsert_events([client._process_event(raw_event("a", 10))])
+    cache.upsert_events([client._process_event(raw_event("b", 12))])
+    cache.set_sync_token(KEY, "sync-1")
+    mock_service.events.return_value.list.return_value.execute.return_value = {
+        "items": [raw_event("a", 10, status="cancelled"), raw_event("c", 14)],
+        "nextSyncToken": "sync-2",
+    }
+
+    client._sync_window(cache, TIME_MIN, TIME_MAX)
+
+    (call,) = list_calls(mock_service)
+    assert call["syncToken"] == "sync-1"
+    assert "timeMin" not in call
+    assert "timeMax" not in call
+    assert cache.get_sync_token(KEY) == "sync-2"
+    events = cache.query_events(TIME_MIN, TIME_MAX, 10)
+    assert [event["id"] for event in events] == ["b", "c"]
+
+
+def test_sync_window_expired_token_falls_back_to_full_sync(
+    client: CalendarClient, mock_service: MagicMock, cache: CalendarCache
+) -> None:
+    """Test HTTP 410 on an incremental sync resyncs the whole window."""
+    cache.upsert_events([client._process_event(raw_event("stale", 9))])
+    cache.set_sync_token(KEY, "expired")
+    gone = HttpError(httplib2.Response({"status": 410}), b"Gone")
+    mock_service.events.return_value.list.return_value.execute.side_effect = [
+        gone,
+        {"items": [raw_event("a", 10)], "nextSyncToken": "sync-new"},
+    ]
+
+    client._sync_window(cache, TIME_MIN, TIME_MAX)
+
+    first, second = list_calls(mock_service)
+    assert first["syncToken"] == "expired"
+    assert "syncToken" not in second
+    assert second["timeMin"] == TIME_MIN
+    assert cache.get_sync_token(KEY) == "sync-new"
+    events = cache.query_events(TIME_MIN, TIME_MAX, 10)
+    assert [event["id"] for event in events] == ["a"]
+
+
+def test_sync_window_reraises_other_errors(
+    client: CalendarClient, mock_service: MagicMock, cache: CalendarCache
+) -> None:
+    """Test errors other than an expired token propagate and keep the token."""
+    cache.set_sync_token(KEY, "sync-1")
+    error = HttpError(httplib2.Response({"status": 500}), b"Backend Error")
+    mock_service.events.return_value.list.return_value.execute.side_effect = error
+
+    with pytest.raises(HttpError):
+        client._sync_window(cache, TIME_MIN, TIME_MAX)
+
+    assert cache.get_sync_token(KEY) == "sync-1"
@@ -0,0 +1,443 @@
+"""Tests for DriveClient bulk operations against a mocked Drive service.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from google_gmail_tool.core import drive_client
+from google_gmail_tool.core.drive_client import DriveClient
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each request via a responder."""
+
+    def __init__(
+        self,
+        callback: Callable[[str, Any, Exception | None], None],
+        responder: Callable[[str], Any],
+        executed: list[list[str]],
+    ) -> None:
+        self._callback = callback
+        self._responder = responder
+        self._executed = executed
+        self.request_ids: list[str] = []
+
+    def add(self, request: Any, request_id: str) -> None:
+        """Queue a request (rejects repeated IDs like BatchHttpRequest)."""
+        if request_id in self.request_ids:
+            raise KeyError("A request with this ID already exists")
+        self.request_ids.append(request_id)
+
+    def execute(self, **kwargs: Any) -> None:
+        """Answer queued requests in reverse order (completion order is arbitrary)."""
+        self._executed.append(self.request_ids)
+        for request_id in reversed(self.request_ids):
+            response = self._responder(request_id)
+            if isinstance(response, Exception):
+                self._callback(request_id, None, response)
+            else:
+                self._callback(request_id, response, None)
+
+
+@pytest.fixture
+def mock_service() -> MagicMock:
+    """Create mock Google Drive service."""
+    return MagicMock()
+
+
+@pytest.fixture
+def drive(monkeypatch: pytest.MonkeyPatch, mock_service: MagicMock) -> DriveClient:
+    """Create DriveClient with mocked service and transport."""
+    monkeypatch.setattr(drive_client, "build_service", Mock(return_value=mock_service))
+    monkeypatch.setattr(drive_client, "shared_http", Mock())
+    return DriveClient(Mock())
+
+
+def use_batches(mock_service: MagicMock, responder: Callable[[str], Any]) -> list[list[str]]:
+    """Make the mock service hand out FakeBatch objects; returns executed request IDs."""
+    executed: list[list[str]] = []
+    mock_service.new_batch_http_request.side_effect = lambda callback: FakeBatch(
+        callback, responder, executed
+    )
+    return executed
+
+
+def test_delete_files_keeps_order_and_collects_failures(
+    drive: DriveClient, mock_service: MagicMock
+) -> None:
+    """Test delete_files reports successes and failures in request order."""
+    executed = use_batches(
+        mock_service,
+        lambda file_id: Exception("404 not found") if file_id.startswith("x") else {"id": file_id},
+    )
+    limit = drive_client._BATCH_LIMIT
+    file_ids = [f"f{i}" for i in range(limit + 5)] + ["x1", "x2"]
+
+    result = drive.delete_files(file_ids)
+
+    assert [len(chunk) for chunk in executed] == [limit, 7]
+    assert [file["id"] for file in result["files"]] == file_ids[:-2]
+    assert [failure["id"] for failure in result["failed"]] == ["x1", "x2"]
+
+
+def test_delete_files_sends_duplicate_ids_once(drive: DriveClient, mock_service: MagicMock) -> None:
+    """Test repeated file IDs are sent once instead of crashing the batch."""
+    executed = use_batches(mock_service, lambda file_id: {"id": file_id})
+
+    result = drive.delete_files(["a", "b", "a"])
+
+    assert executed == [["a", "b"]]
+    assert [file["id"] for file in result["files"]] == ["a", "b"]
+    assert result["failed"] == []
+
+
+def test_move_files_dedupes_metadata_lookup(drive: DriveClient, mock_service: MagicMock) -> None:
+    """Test move_files looks up parents once per file and reports missing files."""
+    executed = use_batches(
+        mock_service,
+        lambda file_id: (
+            Exception("404") if file_id == "gone" else {"id": file_id, "parents": ["p"]}
+        ),
+    )
+
+    result = drive.move_files([("a", "dest"), ("a", "dest"), ("gone", "dest")])
+
+    assert executed[0] == ["a", "gone"]  # metadata batch
+    assert executed[1] == ["a"]  # move batch
+    assert [file["id"] for file in result["files"]] == ["a"]
+    assert [failure["id"] for failure in result["failed"]] == ["gone"]
+
+
+def test_download_files_sanitizes_and_dedupes_names(
+    drive: DriveClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    """Test Drive names cannot escape output_dir and duplicates do not overwrite."""
+    written: dict[str, str] = {}
+
+    def fake_download(file_id: str, output_path: str, chunksize: int | None) -> int:
+        written[file_id] = output_path
+        return 1
+
+    monkeypatch.setattr(drive, "_stream_download", fake_download)
+    files: list[str | dict[str, Any]] = [
+        {"id": "1", "name": "../../.bashrc", "mimeType": "text/plain"},
+        {"id": "2", "name": "/etc/x", "mimeType": "text/plain"},
+        {"id": "3", "name": "report.pdf", "mimeType": "application/pdf"},
+        {"id": "4", "name": "report.pdf", "mimeType": "application/pdf"},
+        {"id": "5", "name": "..", "mimeType": "text/plain"},
+    ]
+
+    result = drive.download_files(files, str(tmp_path), workers=2)
+
+    assert result["failed"] == []
+    assert {file_id: path.rsplit("/", 1)[-1] for file_id, path in written.items()} == {
+        "1": ".bashrc",
+        "2": "x",
+        "3": written["3"].rsplit("/", 1)[-1],
+        "4": written["4"].rsplit("/", 1)[-1],
+        "5": "5",
+    }
+    assert {written["3"], written["4"]} == {
+        str(tmp_path / "report.pdf"),
+        str(tmp_path / "report (1).pdf"),
+    }
+    assert all(path.startswith(str(tmp_path) + "/") for path in written.values())
+
+
+def test_download_files_resolves_ids_in_one_batch(
+    drive: DriveClient, mock_service: MagicMock, monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    """Test bare IDs are looked up in one batch before the workers start."""
+    executed = use_batches(
+        mock_service,
+        lambda file_id: (
+            Exception("404")
+            if file_id == "gone"
+            else {"id": file_id, "name": f"{file_id}.txt", "mimeType": "text/plain"}
+        ),
+    )
+    monkeypatch.setattr(drive, "_stream_download", lambda file_id, path, chunksize: 1)
+
+    result = drive.download_files(["a", "gone", "b"], str(tmp_path), workers=2)
+
+    assert executed == [["a", "gone", "b"]]
+    assert sorted(file["name"] for file in result["files"]) == ["a.txt", "b.txt"]
+    assert result["failed"] == [{"id": "gone", "error": "File not found"}]
+
+
+def use_folder_pages(mock_service: MagicMock, pages: dict[str, list[list[dict[str, Any]]]]) -> None:
+    """Serve files().list() for "'<folder>' in parents" queries page by page."""
+
+    def list_request(**params: Any) -> Mock:
+        folder_id = params["q"].split("'")[1]
+        page = int(params.get("pageToken") or 0)
+        folder_pages = pages.get(folder_id, [[]])
+        response: dict[str, Any] = {"files": folder_pages[page]}
+        if page + 1 < len(folder_pages):
+            response["nextPageToken"] = str(page + 1)
+        return Mock(execute=Mock(return_value=response))
+
+    mock_service.files.return_value.list.side_effect = list_request
+
+
+def test_folder_name_index_follows_all_pages(drive: DriveClient, mock_service: MagicMock) -> None:
+    """Test the name index covers children past the first 1000-item page."""
+    use_folder_pages(
+        mock_service,
+        {"parent": [[{"id": "1", "name": "a"}], [{"id": "2", "name": "b"}]]},
+    )
+
+    assert drive._folder_name_index("parent") == {"a": "1", "b": "2"}
+
+
+def test_upload_folder_skip_existing_sees_later_pages(
+    drive: DriveClient, mock_service: MagicMock, tmp_path: Any
+) -> None:
+    """Test skip_existing finds the destination folder and file on a later page."""
+    local = tmp_path / "project"
+    local.mkdir()
+    (local / "notes.txt").write_bytes(b"hello")
+    remote_file = {
+        "id": "file-1",
+        "name": "notes.txt",
+        "mimeType": "text/plain",
+        "size": "5",
+        "md5Checksum": "5d41402abc4b2a76b9719d911017c592",
+    }
+    use_folder_pages(
+        mock_service,
+        {
+            "root": [
+                [{"id": "other", "name": "other", "mimeType": "text/plain"}],
+                [{"id": "proj-1", "name": "project", "mimeType": drive_client._FOLDER_MIME_TYPE}],
+            ],
+            "proj-1": [[{"id": "x", "name": "x.txt", "mimeType": "text/plain"}], [remote_file]],
+        },
+    )
+
+    result = drive.upload_folder(str(local), skip_existing=True, workers=1)
+
+    assert result["folder"]["id"] == "proj-1"
+    assert result["folders"] == []
+    assert result["files"] == []
+    assert result["skipped_files"] == [str(local / "notes.txt")]
+    mock_service.files.return_value.create.assert_not_called()
+
+
+def test_rename_files_sends_one_update_per_file(
+    drive: DriveClient, mock_service: MagicMock
+) -> None:
+    """Test rename_files batches one update per file with the new name."""
+    executed = use_batches(mock_service, lambda file_id: {"id": file_id, "name": "renamed"})
+
+    result = drive.rename_files([("a", "one.txt"), ("b", "two.txt")])
+
+    assert executed == [["a", "b"]]
+    bodies = [call.kwargs["body"] for call in mock_service.files.return_value.update.call_args_list]
+    assert bodies == [{"name": "one.txt"}, {"name": "two.txt"}]
+    assert [file["id"] for file in result["files"]] == ["a", "b"]
+
+
+def folder_metadata(folder_id: str) -> Any:
+    """Batch responder: IDs starting with "f" are folders, "gone" is missing."""
+    if folder_id == "gone":
+        return Exception("404 not found")
+    mime_type = drive_client._FOLDER_MIME_TYPE if folder_id.startswith("f") else "text/plain"
+    return {"id": folder_id, "name": folder_id, "mimeType": mime_type, "parents": ["old"]}
+
+
+def test_rename_folders_checks_folders_in_one_batch(
+    drive: DriveClient, mock_service: MagicMock
+) -> None:
+    """Test rename_folders skips missing items and non-folders."""
+    executed = use_batches(mock_service, folder_metadata)
+    mock_service.files.return_value.update.return_value.execute.return_value = {"id": "f1"}
+
+    result = drive.rename_folders({"f1": "Reports", "doc": "x", "gone": "y"})
+
+    assert executed == [["f1", "doc", "gone"]]
+    mock_service.files.return_value.update.assert_called_once_with(
+        fileId="f1", body={"name": "Reports"}, fields=drive_client._UPDATED_FOLDER_FIELDS
+    )
+    assert result["folders"] == [{"id": "f1"}]
+    assert [failure["id"] for failure in result["failed"]] == ["doc", "gone"]
+
+
+def test_move_folders_replaces_current_parents(drive: DriveClient, mock_service: MagicMock) -> None:
+    """Test move_folders moves each folder away from its looked-up parents."""
+    use_batches(mock_service, folder_metadata)
+
+    result = drive.move_folders(["f1", "f2"], "dest")
+
+    calls = mock_service.files.return_value.update.call_args_list
+    assert [(call.kwargs["fileId"], call.kwargs["addParents"]) for call in calls] == [
+        ("f1", "dest"),
+        ("f2", "dest"),
+    ]
+    assert all(call.kwargs["removeParents"] == "old" for call in calls)
+    assert len(result["folders"]) == 2
+    assert result["failed"] == []
+
+
+def test_delete_folders_trashes_or_deletes(drive: DriveClient, mock_service: MagicMock) -> None:
+    """Test delete_folders trashes by default and deletes permanently on request."""
+    use_batches(mock_service, folder_metadata)
+    files = mock_service.files.return_value
+
+    trashed = drive.delete_folders(["f1", "doc"])
+    deleted = drive.delete_folders(["f2"], permanent=True)
+
+    files.update.assert_called_once_with(fileId="f1", body={"trashed": True})
+    files.delete.assert_called_once_with(fileId="f2")
+    assert trashed["folders"] == ["f1"]
+    assert [failure["id"] for failure in trashed["failed"]] == ["doc"]
+    assert deleted == {"folders": ["f2"], "failed": []}
+
+
+@pytest.fixture
+def fake_multipart(
+    drive: DriveClient, monkeypatch: pytest.MonkeyPatch
+) -> list[tuple[str, dict[str, Any], str]]:
+    """Replace the aiohttp multipart upload; files named "bad*" fail."""
+    uploaded: list[tuple[str, dict[str, Any], str]] = []
+
+    async def auth_headers() -> dict[str, str]:
+        return {}
+
+    async def multipart_upload(
+        session: Any, file_path: Path, metadata: dict[str, Any], mime_type: str | None, fields: str
+    ) -> tuple[dict[str, Any], int]:
+        await asyncio.sleep(0)
+        if file_path.name.startswith("bad"):
+            raise ConnectionError("upload failed")
+        uploaded.append((file_path.name, metadata, fields))
+        return {"id": f"id-{file_path.name}", "name": metadata["name"]}, file_path.stat().st_size
+
+    monkeypatch.setattr(drive, "_async_auth_headers", auth_headers)
+    monkeypatch.setattr(drive, "_async_multipart_upload", multipart_upload)
+    return uploaded
+
+
+@pytest.mark.skipif(not drive_client._HAS_AIOHTTP, reason="aiohttp not installed")
+def test_upload_files_async_keeps_order_and_collects_failures(
+    drive: DriveClient, fake_multipart: list[tuple[str, dict[str, Any], str]], tmp_path: Path
+) -> None:
+    """Test upload_files_async returns files in input order and reports failures."""
+    for name in ("a.txt", "bad.txt", "b.txt"):
+        (tmp_path / name).write_bytes(b"x")
+    done: list[None] = []
+
+    result = asyncio.run(
+        drive.upload_files_async(
+            [
+                {"local_path": str(tmp_path / "a.txt"), "folder_id": "parent"},
+                {"local_path": str(tmp_path / "bad.txt")},
+                {"local_path": str(tmp_path / "b.txt"), "name": "renamed.txt"},
+            ],
+            concurrency=2,
+            on_done=lambda: done.append(None),
+        )
+    )
+
+    assert [file["name"] for file in result["files"]] == ["a.txt", "renamed.txt"]
+    assert result["failed"] == [{"local_path": str(tmp_path / "bad.txt"), "error": "upload failed"}]
+    assert len(done) == 3
+    metadata = {name: meta for name, meta, _ in fake_multipart}
+    assert metadata["a.txt"]["parents"] == ["parent"]
+    assert "parents" not in metadata["b.txt"]
+    assert {fields for _, _, fields in fake_multipart} == {drive_client._CREATED_FILE_FIELDS}
+
+
+@pytest.mark.skipif(not drive_client._HAS_AIOHTTP, reason="aiohttp not installed")
+def test_upload_folder_splits_small_and_large_files(
+    drive: DriveClient,
+    mock_service: MagicMock,
+    fake_multipart: list[tuple[str, dict[str, Any], str]],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test small files go through upload_files_async and large ones through the API."""
+    local = tmp_path / "project"
+    local.mkdir()
+    (local / "small.txt").write_bytes(b"abc")
+    (local / "bad.txt").write_bytes(b"abcd")
+    (local / "large.bin").write_bytes(b"0123456789")
+    drive._resumable_threshold = 8
+    monkeypatch.setattr(
+        drive, "create_folder", Mock(return_value={"id": "root-id", "name": "project"})
+    )
+    monkeypatch.setattr(drive, "_thread_local_service", lambda: mock_service)
+    mock_service.files.return_value.create.return_value.execute.return_value = {
+        "id": "id-large.bin",
+        "name": "large.bin",
+    }
+
+    result = drive.upload_folder(str(local), workers=1)
+
+    assert [(name, fields) for name, _, fields in fake_multipart] == [
+        ("small.txt", drive_client._FOLDER_UPLOAD_FIELDS)
+    ]
+    assert fake_multipart[0][1]["parents"] == ["root-id"]
+    create = mock_service.files.return_value.create
+    assert create.call_args.kwargs["body"] == {"name": "large.bin", "parents": ["root-id"]}
+    assert sorted(file["id"] for file in result["files"]) == ["id-large.bin", "id-small.txt"]
+    assert result["total_bytes"] == 3 + 10
+
+
+def test_upload_folder_inside_event_loop_uses_thread_pool(
+    drive: DriveClient,
+    mock_service: MagicMock,
+    fake_multipart: list[tuple[str, dict[str, Any], str]],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test upload_folder called from a running event loop skips the aiohttp path."""
+    local = tmp_path / "project"
+    local.mkdir()
+    (local / "small.txt").write_bytes(b"abc")
+    monkeypatch.setattr(
+        drive, "create_folder", Mock(return_value={"id": "root-id", "name": "project"})
+    )
+    monkeypatch.setattr(drive, "_thread_local_service", lambda: mock_service)
+    mock_service.files.return_value.create.return_value.execute.return_value = {
+        "id": "id-small.txt",
+        "name": "small.txt",
+    }
+
+    async def upload() -> dict[str, Any]:
+        return drive.upload_folder(str(local), workers=1)
+
+    result = asyncio.run(upload())
+
+    assert fake_multipart == []
+    assert [file["id"] for file in result["files"]] == ["id-small.txt"]
+    assert result["total_bytes"] == 3
+
+
+def test_upload_folder_does_not_follow_directory_symlinks(
+    drive: DriveClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test a symlink cycle is created as a folder but not walked into."""
+    local = tmp_path / "project"
+    (local / "sub").mkdir(parents=True)
+    (local / "sub" / "loop").symlink_to(local, target_is_directory=True)
+    created: list[tuple[str, str | None]] = []
+
+    def create_folder(name: str, parent_id: str | None = None, **kwargs: Any) -> dict[str, Any]:
+        created.append((name, parent_id))
+        return {"id": f"id-{name}", "name": name}
+
+    monkeypatch.setattr(drive, "create_folder", create_folder)
+
+    result = drive.upload_folder(str(local), workers=1)
+
+    assert created == [("project", None), ("sub", "id-project"), ("loop", "id-sub")]
+    assert result["files"] == []
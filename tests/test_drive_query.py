@@ -0,0 +1,38 @@
+"""Tests for google_gmail_tool.core._drive_query module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from google_gmail_tool.core._drive_query import (
+    escape,
+    q_and,
+    q_in_parent,
+    q_mime_eq,
+    q_name_contains,
+    q_name_eq,
+    q_trashed,
+)
+
+
+def test_escape_quotes_and_backslashes() -> None:
+    """Test that single quotes and backslashes are escaped."""
+    assert escape("O'Brien") == "O\\'Brien"
+    assert escape("a\\b") == "a\\\\b"
+    assert escape("plain") == "plain"
+
+
+def test_clauses() -> None:
+    """Test the individual query clauses."""
+    assert q_name_eq("it's.pdf") == "name='it\\'s.pdf'"
+    assert q_name_contains("report") == "name contains 'report'"
+    assert q_in_parent("root") == "'root' in parents"
+    assert q_mime_eq("application/pdf") == "mimeType='application/pdf'"
+    assert q_trashed(False) == "trashed=false"
+    assert q_trashed(True) == "trashed=true"
+
+
+def test_q_and_skips_empty_parts() -> None:
+    """Test that q_and joins clauses and ignores None/empty parts."""
+    assert q_and(q_name_eq("a"), None, "", q_trashed(False)) == "name='a' and trashed=false"
+    assert q_and() == ""
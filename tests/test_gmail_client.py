@@ -0,0 +1,119 @@
+"""Tests for GmailClient batch fetching against a mocked Gmail service.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from google_gmail_tool.core import gmail_client
+from google_gmail_tool.core.gmail_client import GmailClient
+
+
+@pytest.fixture
+def mock_service() -> MagicMock:
+    """Create mock Gmail service whose batch requests fail as a whole."""
+    service = MagicMock()
+    unavailable = HttpError(Mock(status=503, reason="Unavailable"), b"batch unavailable")
+    service.new_batch_http_request.return_value.execute.side_effect = unavailable
+    return service
+
+
+@pytest.fixture
+def gmail(monkeypatch: pytest.MonkeyPatch, mock_service: MagicMock) -> GmailClient:
+    """Create GmailClient with mocked service and transport."""
+    monkeypatch.setattr(gmail_client, "build_service", Mock(return_value=mock_service))
+    monkeypatch.setattr(gmail_client, "shared_http", Mock())
+    return GmailClient(Mock())
+
+
+def use_single_gets(mock_service: MagicMock) -> set[int]:
+    """Answer messages().get() per ID ("bad*" fails); returns the fetching thread IDs."""
+    threads: set[int] = set()
+
+    def get(userId: str, id: str, **kwargs: Any) -> Mock:  # noqa: N803
+        def execute() -> dict[str, Any]:
+            threads.add(threading.get_ident())
+            if id.startswith("bad"):
+                raise ConnectionError("reset")
+            return {"id": id}
+
+        return Mock(execute=execute)
+
+    mock_service.users.return_value.messages.return_value.get.side_effect = get
+    return threads
+
+
+def test_batch_get_falls_back_to_single_gets(gmail: GmailClient, mock_service: MagicMock) -> None:
+    """Test a failed batch is refetched with single GETs on worker threads."""
+    threads = use_single_gets(mock_service)
+
+    results = gmail._batch_get("message", ["a", "bad", "b"])
+
+    assert results == {"a": {"id": "a"}, "b": {"id": "b"}}
+    assert threading.get_ident() not in threads
+
+
+def test_batch_get_fallback_works_inside_running_event_loop(
+    gmail: GmailClient, mock_service: MagicMock
+) -> None:
+    """Test the fallback can be called from code running in an event loop."""
+    use_single_gets(mock_service)
+
+    async def fetch() -> dict[str, dict[str, Any]]:
+        return gmail._batch_get("message", ["a"])
+
+    assert asyncio.run(fetch()) == {"a": {"id": "a"}}
+
+
+def test_batch_get_fallback_reuses_thread_services(
+    gmail: GmailClient, mock_service: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test per-thread services are built once per worker, not once per chunk."""
+    use_single_gets(mock_service)
+    monkeypatch.setattr(gmail_client, "_BATCH_LIMIT", 2)
+    build = Mock(return_value=mock_service)
+    monkeypatch.setattr(gmail_client, "build_service", build)
+    monkeypatch.setattr(gmail_client, "_FALLBACK_EXECUTOR", None)
+    monkeypatch.setattr(gmail_client, "_FALLBACK_CONCURRENCY", 1)
+
+    results = gmail._batch_get("message", [f"m{i}" for i in range(6)])
+
+    assert len(results) == 6
+    assert build.call_count == 1
+
+
+def test_get_message_full_cache_hits_are_isolated(
+    gmail: GmailClient, mock_service: MagicMock
+) -> None:
+    """Test mutating a returned message does not change later cache hits."""
+    mock_service.users.return_value.messages.return_value.get.return_value.execute.return_value = {
+        "threadId": "t1",
+        "labelIds": ["INBOX"],
+        "payload": {
+            "headers": [{"name": "Subject", "value": "Hi"}],
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "application/pdf",
+                    "filename": "a.pdf",
+                    "body": {"attachmentId": "att1", "size": 3},
+                }
+            ],
+        },
+    }
+
+    first = gmail.get_message_full("m1")
+    first["labels"].append("SPAM")
+    first["attachments"][0]["filename"] = "changed.pdf"
+    second = gmail.get_message_full("m1")
+
+    assert second["labels"] == ["INBOX"]
+    assert second["attachments"][0]["filename"] == "a.pdf"
+    assert mock_service.users.return_value.messages.return_value.get.call_count == 1
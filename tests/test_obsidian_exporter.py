@@ -0,0 +1,91 @@
+"""Tests for ObsidianExporter note body handling.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from google_gmail_tool.core.obsidian_exporter import ObsidianExporter
+
+
+@pytest.mark.parametrize(
+    ("note", "body"),
+    [
+        ("---\ntitle: x\n---\n\n# Body\n", "# Body\n"),
+        ("---\ntitle: x\n---\n\u00a0\u2003\u3000\x1c \n# Body\n", "# Body\n"),
+        ("---\ntitle: x\n---\n\u200bBody\n", "\u200bBody\n"),  # zero-width space is kept
+        ("---\ntitle: x\n---", ""),
+        ("---\ntitle: unterminated\n", "---\ntitle: unterminated\n"),
+        ("# No frontmatter\n", "# No frontmatter\n"),
+        ("", ""),
+    ],
+)
+def test_copy_note_body_strips_frontmatter(tmp_path: Path, note: str, body: str) -> None:
+    """Test the copied body matches str.lstrip() after the frontmatter."""
+    note_file = tmp_path / "note.md"
+    note_file.write_text(note, encoding="utf-8")
+    out = BytesIO()
+
+    ObsidianExporter(str(tmp_path))._copy_note_body(note_file, out)
+
+    expected = (body + "\n\n").encode() if note else b""
+    assert out.getvalue() == expected
+
+
+def make_message(message_id: str, filename: str) -> dict[str, Any]:
+    """Build a full message with one downloaded attachment."""
+    return {
+        "id": message_id,
+        "thread_id": "thread-1",
+        "from": "Alice <alice@example.com>",
+        "to": "bob@example.com",
+        "subject": "Report",
+        "date": "Mon, 17 Nov 2025 04:32:27 +0000",
+        "date_iso": "2025-11-17T04:32:27+00:00",
+        "labels": [],
+        "body": "See attached.",
+        "attachments": [
+            {
+                "filename": filename,
+                "attachment_id": f"att-{message_id}",
+                "size": 4,
+                "mime_type": "image/png",
+            }
+        ],
+    }
+
+
+def test_export_thread_writes_repeated_attachment_name_once(tmp_path: Path) -> None:
+    """Test a filename repeated across messages is written once, with the last data."""
+    exporter = ObsidianExporter(str(tmp_path))
+    messages = [make_message("m1", "image001.png"), make_message("m2", "image001.png")]
+    attachments = {"m1": {"image001.png": b"old!"}, "m2": {"image001.png": b"new!"}}
+
+    note_file = exporter.export_thread(messages, attachments)
+
+    written = [path.name for path in note_file.parent.iterdir()]
+    assert sorted(written) == sorted([note_file.name, "image001.png"])
+    assert (note_file.parent / "image001.png").read_bytes() == b"new!"
+
+
+def test_export_thread_append_keeps_earlier_messages_and_attachments(tmp_path: Path) -> None:
+    """Test re-exporting with a new message appends it and keeps earlier attachments."""
+    exporter = ObsidianExporter(str(tmp_path))
+    first = make_message("m1", "report.pdf")
+    second = make_message("m2", "chart.png")
+    exporter.export_thread([first], {"m1": {"report.pdf": b"pdf!"}})
+
+    note_file = exporter.export_thread([first, second], {"m2": {"chart.png": b"png!"}})
+
+    note = note_file.read_text(encoding="utf-8")
+    assert note.count("**Message ID:** `m1`") == 1
+    assert note.count("**Message ID:** `m2`") == 1
+    frontmatter = note.split("\n---\n", 1)[0]
+    assert 'filename: "report.pdf"' in frontmatter
+    assert 'filename: "chart.png"' in frontmatter
+    assert "message_count: 2" in frontmatter
@@ -8,15 +8,18 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import logging
+import threading
 from datetime import datetime
-from unittest.mock import Mock, patch
+from typing import Any
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
-from google_gmail_tool.core.task_client import TaskClient
+from google_gmail_tool.core.task_client import TaskClient, _format_due
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_credentials() -> Mock:
     """Create mock Google credentials."""
     credentials = Mock()
@@ -26,9 +29,9 @@ def mock_credentials() -> Mock:
 
 
 @pytest.fixture
-def mock_service() -> Mock:
+def mock_service() -> MagicMock:
     """Create mock Google Tasks service."""
-    service = Mock()
+    service = MagicMock()
     service.tasklists.return_value.list.return_value.execute.return_value = {
         "items": [{"id": "default-list-id", "title": "My Tasks"}]
     }
@@ -36,18 +39,25 @@ def mock_service() -> Mock:
 
 
 @pytest.fixture
-def task_client(mock_credentials: Mock, mock_service: Mock) -> TaskClient:
+def mock_build(monkeypatch: pytest.MonkeyPatch, mock_service: Mock) -> Mock:
+    """Patch the service builder used by TaskClient to return the mock service."""
+    build = Mock(return_value=mock_service)
+    monkeypatch.setattr("google_gmail_tool.core.task_client.build_service", build)
+    return build
+
+
+@pytest.fixture
+def task_client(mock_credentials: Mock, mock_build: Mock) -> TaskClient:
     """Create TaskClient with mocked service."""
-    with patch("google_gmail_tool.core.task_client.build", return_value=mock_service):
-        client = TaskClient(mock_credentials)
-    return client
+    return TaskClient(mock_credentials, prefetch=False)
 
 
-def test_task_client_initialization(mock_credentials: Mock, mock_service: Mock) -> None:
+def test_task_client_initialization(
+    mock_credentials: Mock, mock_service: Mock, mock_build: Mock
+) -> None:
     """Test TaskClient initializes with credentials."""
-    with patch("google_gmail_tool.core.task_client.build", return_value=mock_service):
-        client = TaskClient(mock_credentials)
-        assert client.service == mock_service
+    client = TaskClient(mock_credentials)
+    assert client.service == mock_service
 
 
 def test_get_default_tasklist_id(task_client: TaskClient, mock_service: Mock) -> None:
@@ -57,6 +67,68 @@ def test_get_default_tasklist_id(task_client: TaskClient, mock_service: Mock) ->
     mock_service.tasklists.return_value.list.assert_called_with(maxResults=1)
 
 
+def test_default_tasklist_id_is_cached(task_client: TaskClient, mock_service: Mock) -> None:
+    """Test the default task list is fetched once across operations until refreshed."""
+    mock_service.tasks.return_value.list.return_value.execute.return_value = {"items": []}
+
+    task_client.list_tasks()
+    task_client.delete_task("task-123")
+    task_client.get_task("task-123")
+    assert mock_service.tasklists.return_value.list.call_count == 1
+
+    task_client.refresh_default_tasklist()
+    task_client.delete_task("task-123")
+    assert mock_service.tasklists.return_value.list.call_count == 2
+
+
+def test_default_tasklist_id_is_prefetched(
+    mock_credentials: Mock, mock_service: Mock, mock_build: Mock
+) -> None:
+    """Test the default task list is fetched in the background on construction."""
+    client = TaskClient(mock_credentials)
+
+    assert client._get_default_tasklist_id() == "default-list-id"
+    assert client._get_default_tasklist_id() == "default-list-id"
+    assert mock_service.tasklists.return_value.list.call_count == 1
+
+
+def test_default_tasklist_prefetch_runs_on_daemon_thread(
+    mock_credentials: Mock, mock_service: Mock, mock_build: Mock
+) -> None:
+    """Test the prefetch thread cannot block interpreter exit."""
+    daemon: list[bool] = []
+
+    def execute(**kwargs: Any) -> dict[str, Any]:
+        daemon.append(threading.current_thread().daemon)
+        return {"items": [{"id": "default-list-id"}]}
+
+    mock_service.tasklists.return_value.list.return_value.execute.side_effect = execute
+    client = TaskClient(mock_credentials)
+
+    assert client._get_default_tasklist_id() == "default-list-id"
+    assert daemon == [True]
+
+
+def test_failed_prefetch_is_logged_once(
+    mock_credentials: Mock,
+    mock_service: Mock,
+    mock_build: Mock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing prefetch plus failing refetch logs a single ERROR."""
+    mock_service.tasklists.return_value.list.return_value.execute.side_effect = ConnectionError(
+        "offline"
+    )
+    client = TaskClient(mock_credentials)
+
+    with caplog.at_level(logging.DEBUG), pytest.raises(ConnectionError):
+        client._get_default_tasklist_id()
+
+    errors = [record for record in caplog.records if record.levelno >= logging.ERROR]
+    assert len(errors) == 1
+    assert mock_service.tasklists.return_value.list.return_value.execute.call_count == 2
+
+
 def test_get_default_tasklist_id_no_lists(task_client: TaskClient, mock_service: Mock) -> None:
     """Test _get_default_tasklist_id raises when no task lists exist."""
     mock_service.tasklists.return_value.list.return_value.execute.return_value = {"items": []}
@@ -77,6 +149,29 @@ def test_list_tasks_calls_api(task_client: TaskClient, mock_service: Mock) -> No
     assert call_kwargs["tasklist"] == "default-list-id"
     assert call_kwargs["maxResults"] == 50
     assert call_kwargs["showCompleted"] is False
+    assert call_kwargs["fields"] == (
+        "items(id,title,notes,due,status,completed,updated),nextPageToken"
+    )
+
+
+def test_list_tasks_filters_query_across_pages(task_client: TaskClient, mock_service: Mock) -> None:
+    """Test list_tasks follows pages until max_results tasks match the query."""
+    mock_service.tasks.return_value.list.return_value.execute.side_effect = [
+        {
+            "items": [{"id": "1", "title": "Buy milk"}, {"id": "2", "title": "Other"}],
+            "nextPageToken": "page-2",
+        },
+        {
+            "items": [{"id": "3", "title": "Call", "notes": "about MILK"}, {"id": "4"}],
+            "nextPageToken": "page-3",
+        },
+    ]
+
+    tasks = task_client.list_tasks(query="Milk", max_results=2)
+
+    assert [task["id"] for task in tasks] == ["1", "3"]
+    assert mock_service.tasks.return_value.list.call_count == 2
+    assert mock_service.tasks.return_value.list.call_args.kwargs["pageToken"] == "page-2"
 
 
 def test_create_task_builds_request(task_client: TaskClient, mock_service: Mock) -> None:
@@ -100,18 +195,14 @@ def test_create_task_builds_request(task_client: TaskClient, mock_service: Mock)
     assert "due" in call_kwargs["body"]
 
 
-def test_process_task_extracts_fields() -> None:
-    """Test _process_task extracts standard fields."""
-    # Create a mock client without patching (just for method access)
-    mock_creds = Mock()
-    mock_service = Mock()
-    mock_service.tasklists.return_value.list.return_value.execute.return_value = {
-        "items": [{"id": "test-list"}]
-    }
+def test_format_due_uses_midnight_utc() -> None:
+    """Test _format_due keeps only the date, as an RFC 3339 midnight UTC timestamp."""
+    assert _format_due(datetime(2025, 11, 20, 15, 30)) == "2025-11-20T00:00:00.000Z"
+    assert _format_due(datetime(987, 1, 2)) == "0987-01-02T00:00:00.000Z"
 
-    with patch("google_gmail_tool.core.task_client.build", return_value=mock_service):
-        client = TaskClient(mock_creds)
 
+def test_process_task_extracts_fields(task_client: TaskClient) -> None:
+    """Test _process_task extracts standard fields."""
     raw_task = {
         "id": "task-123",
         "title": "Test Task",
@@ -121,7 +212,7 @@ def test_process_task_extracts_fields() -> None:
         "updated": "2025-11-17T10:00:00.000Z",
     }
 
-    processed = client._process_task(raw_task)
+    processed = task_client._process_task(raw_task)
 
     assert processed["id"] == "task-123"
     assert processed["title"] == "Test Task"
@@ -133,13 +224,8 @@ def test_process_task_extracts_fields() -> None:
 
 
 def test_complete_task_sets_status(task_client: TaskClient, mock_service: Mock) -> None:
-    """Test complete_task sets status to completed."""
-    mock_service.tasks.return_value.get.return_value.execute.return_value = {
-        "id": "task-123",
-        "title": "Test",
-        "status": "needsAction",
-    }
-    mock_service.tasks.return_value.update.return_value.execute.return_value = {
+    """Test complete_task sets status to completed with a single PATCH."""
+    mock_service.tasks.return_value.patch.return_value.execute.return_value = {
         "id": "task-123",
         "title": "Test",
         "status": "completed",
@@ -150,9 +236,26 @@ def test_complete_task_sets_status(task_client: TaskClient, mock_service: Mock)
 
     assert task["status"] == "completed"
     assert task["completed"] is not None
-    mock_service.tasks.return_value.update.assert_called_once()
-    update_body = mock_service.tasks.return_value.update.call_args.kwargs["body"]
-    assert update_body["status"] == "completed"
+    mock_service.tasks.return_value.get.assert_not_called()
+    mock_service.tasks.return_value.update.assert_not_called()
+    mock_service.tasks.return_value.patch.assert_called_once()
+    patch_body = mock_service.tasks.return_value.patch.call_args.kwargs["body"]
+    assert patch_body["status"] == "completed"
+
+
+def test_update_task_patches_changed_fields(task_client: TaskClient, mock_service: Mock) -> None:
+    """Test update_task sends only the given fields in a single PATCH."""
+    mock_service.tasks.return_value.patch.return_value.execute.return_value = {
+        "id": "task-123",
+        "title": "New title",
+    }
+
+    task_client.update_task("task-123", title="New title", due=datetime(2025, 11, 20))
+
+    mock_service.tasks.return_value.get.assert_not_called()
+    call_kwargs = mock_service.tasks.return_value.patch.call_args.kwargs
+    assert call_kwargs["task"] == "task-123"
+    assert call_kwargs["body"] == {"title": "New title", "due": "2025-11-20T00:00:00.000Z"}
 
 
 def test_delete_task_calls_api(task_client: TaskClient, mock_service: Mock) -> None:
@@ -163,3 +266,79 @@ def test_delete_task_calls_api(task_client: TaskClient, mock_service: Mock) -> N
     call_kwargs = mock_service.tasks.return_value.delete.call_args.kwargs
     assert call_kwargs["tasklist"] == "default-list-id"
     assert call_kwargs["task"] == "task-123"
+
+
+def test_bulk_complete_tasks_uses_batch_patch(task_client: TaskClient, mock_service: Mock) -> None:
+    """Test bulk_complete_tasks patches all tasks in one batch and collects errors."""
+    batches: list[list[str]] = []
+
+    def new_batch(callback: Any) -> Mock:
+        request_ids: list[str] = []
+        batch = Mock()
+        batch.add.side_effect = lambda request, request_id: request_ids.append(request_id)
+
+        def execute(**kwargs: Any) -> None:
+            batches.append(request_ids)
+            for request_id in reversed(request_ids):
+                if request_id == "missing":
+                    callback(request_id, None, Exception("404 not found"))
+                else:
+                    callback(request_id, {"id": request_id, "status": "completed"}, None)
+
+        batch.execute.side_effect = execute
+        return batch
+
+    mock_service.new_batch_http_request.side_effect = new_batch
+
+    tasks, errors = task_client.bulk_complete_tasks(["t1", "missing", "t2", "t1"])
+
+    assert batches == [["t1", "missing", "t2"]]
+    assert list(tasks) == ["t1", "t2"]
+    assert tasks["t2"]["status"] == "completed"
+    assert list(errors) == ["missing"]
+    mock_service.tasks.return_value.get.assert_not_called()
+    patch_body = mock_service.tasks.return_value.patch.call_args.kwargs["body"]
+    assert patch_body["status"] == "completed"
+    assert patch_body["completed"].endswith("Z")
+
+
+def test_bulk_complete_tasks_records_failed_batch(
+    task_client: TaskClient, mock_service: Mock
+) -> None:
+    """Test a failing batch marks its tasks as errors while other batches still apply."""
+    executed: list[int] = []
+
+    def new_batch(callback: Any) -> Mock:
+        request_ids: list[str] = []
+        batch = Mock()
+        batch.add.side_effect = lambda request, request_id: request_ids.append(request_id)
+
+        def execute(**kwargs: Any) -> None:
+            executed.append(len(request_ids))
+            if len(executed) == 2:
+                raise ConnectionError("connection reset")
+            for request_id in request_ids:
+                callback(request_id, {"id": request_id, "status": "completed"}, None)
+
+        batch.execute.side_effect = execute
+        return batch
+
+    mock_service.new_batch_http_request.side_effect = new_batch
+    task_ids = [f"t{i}" for i in range(60)]
+
+    tasks, errors = task_client.bulk_complete_tasks(task_ids)
+
+    assert executed == [50, 10]
+    assert list(tasks) == task_ids[:50]
+    assert list(errors) == task_ids[50:]
+    assert isinstance(errors["t55"], ConnectionError)
+
+
+def test_bulk_apply_preserves_order(task_client: TaskClient, mock_service: Mock) -> None:
+    """Test bulk_apply runs op for every task ID and returns results in input order."""
+    task_ids = [f"task-{i}" for i in range(20)]
+
+    results = task_client.bulk_apply(task_ids, lambda task_id: task_id.upper(), max_workers=4)
+
+    assert results == [task_id.upper() for task_id in task_ids]
+    assert mock_service.tasklists.return_value.list.call_count == 1